@@ -79,13 +79,20 @@ class AgentRegistrySync:
         
         # Get all registered engines from orchestrator
         if hasattr(self.orchestrator, 'engines'):
-            for engine_name, engine in self.orchestrator.engines.items():
+            # Engines not loaded yet are described from their spec, not imported
+            loaded = self.orchestrator.engines.loaded()
+            for engine_name in self.orchestrator.engines:
+                engine = loaded.get(engine_name)
+                if engine is None:
+                    agents.append(self.get_pending_engine_info(engine_name))
+                    continue
                 agent_info = {
                     "id": engine_name,
                     "name": engine_name,
                     "type": "recursive_engine",
                     "class_name": engine.__class__.__name__,
                     "status": "active" if hasattr(engine, 'running') and engine.running else "inactive",
+                    "loaded": True,
                     "discovered_at": datetime.now().isoformat(),
                     "capabilities": self.get_engine_capabilities(engine),
                     "health_score": self.calculate_health_score(engine),
@@ -100,6 +107,22 @@ class AgentRegistrySync:
         self.logger.info(f"Discovered {len(agents)} agents")
         return agents
     
+    def get_pending_engine_info(self, engine_name: str) -> Dict[str, Any]:
+        """Describe a registered engine that has not been loaded yet."""
+        status = self.orchestrator.engines.status_of(engine_name)
+        return {
+            "id": engine_name,
+            "name": engine_name,
+            "type": "recursive_engine",
+            "class_name": status["path"].rpartition(":")[2],
+            "status": "inactive",
+            "loaded": False,
+            "discovered_at": datetime.now().isoformat(),
+            "capabilities": [],
+            "health_score": self.calculate_health_score(None),
+            "kpi_metrics": self.get_kpi_metrics(None)
+        }
+    
     def get_engine_capabilities(self, engine) -> List[str]:
         """Extract capabilities from an engine."""
         capabilities = []
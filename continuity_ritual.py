@@ -20,6 +20,8 @@ from typing import Dict, List, Any, Optional, Callable
 from pathlib import Path
 import subprocess
 
+from recursive_improvement.log_config import configure_logging
+
 
 class ContinuityRitual:
     """Manages automated maintenance rituals for system continuity."""
@@ -35,7 +37,7 @@ class ContinuityRitual:
             Path(path).mkdir(parents=True, exist_ok=True)
         
         # Setup logging
-        logging.basicConfig(level=logging.INFO)
+        configure_logging()
         self.logger = logging.getLogger(__name__)
         
         # Load configuration
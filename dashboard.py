@@ -12,6 +12,7 @@ import urllib.parse
 # Import recursive improvement status
 try:
     from integration import _orchestrator, initialize_recursive_improvement_system
+    from recursive_improvement.metrics_registry import CONTENT_TYPE as METRICS_CONTENT_TYPE, registry
     RECURSIVE_AVAILABLE = True
 except ImportError:
     RECURSIVE_AVAILABLE = False
@@ -19,6 +20,7 @@ except ImportError:
 
 class DashboardHandler(SimpleHTTPRequestHandler):
     def do_GET(self):
+        parsed = urllib.parse.urlparse(self.path)
         if self.path == '/':
             self.send_dashboard_html()
         elif self.path == '/api/status':
@@ -29,6 +31,10 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             self.send_recursive_json()
         elif self.path == '/api/recursive/trigger':
             self.trigger_recursive_improvement()
+        elif parsed.path == '/api/recursive/metrics':
+            self.send_recursive_metrics_json(urllib.parse.parse_qs(parsed.query))
+        elif parsed.path == '/metrics':
+            self.send_prometheus_metrics()
         else:
             super().do_GET()
 
@@ -158,11 +164,16 @@ class DashboardHandler(SimpleHTTPRequestHandler):
                     Object.entries(data.engines).forEach(([name, engine]) => {
                         const engineDiv = document.createElement('div');
                         engineDiv.className = `engine-card ${engine.running ? 'engine-running' : 'engine-stopped'}`;
+                        const main = (engine.resources || {}).main;
+                        const timing = main && main.wall.p50 !== undefined
+                            ? `Main p50/p90: ${(main.wall.p50 * 1000).toFixed(0)}/${(main.wall.p90 * 1000).toFixed(0)}ms`
+                            : 'Main p50/p90: n/a';
                         engineDiv.innerHTML = `
                             <strong>${name}</strong><br>
                             Status: ${engine.running ? '✓ Running' : '✗ Stopped'}<br>
                             Executions: ${engine.total_executions || 0}<br>
-                            Actions: ${engine.actions_count || 0}
+                            Actions: ${engine.actions_count || 0}<br>
+                            ${timing}
                         `;
                         engineGrid.appendChild(engineDiv);
                     });
@@ -231,6 +242,7 @@ class DashboardHandler(SimpleHTTPRequestHandler):
                         "total_improvements": orchestrator_status.get("total_improvements", 0),
                         "uptime": orchestrator_status.get("uptime", 0),
                         "engines": status.get("engines", {}),
+                        "resources": status.get("resources", []),
                         "recent_activity": status.get("recent_activity", {})
                     }
                 else:
@@ -246,6 +258,78 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         
         self.send_json_response(recursive_data)
     
+    def send_recursive_metrics_json(self, query):
+        """Send recursive improvement metrics for an engine/metric/time range."""
+        if not RECURSIVE_AVAILABLE:
+            self.send_json_response({"error": "Recursive improvement system not available"})
+            return
+        
+        def param(name, default=None):
+            return query.get(name, [default])[0]
+        
+        try:
+            global _orchestrator
+            if _orchestrator is None:
+                _orchestrator = initialize_recursive_improvement_system()
+            
+            hours = float(param("hours", 24))
+            limit = param("limit")
+            end = datetime.now().timestamp()
+            
+            # Long ranges read the downsampled tiers instead of raw history
+            resolution = param("resolution")
+            if resolution is None and param("metric"):
+                if hours > 60 * 24:
+                    resolution = "1d"
+                elif hours > 48:
+                    resolution = "1h"
+            
+            if resolution and resolution != "raw":
+                metrics = _orchestrator.recursive_logger.query_rollups(
+                    param("metric"),
+                    engine=param("engine"),
+                    resolution=resolution,
+                    start=end - hours * 3600,
+                    end=end
+                )
+            else:
+                metrics = _orchestrator.recursive_logger.query_metrics(
+                    engine=param("engine"),
+                    metric=param("metric"),
+                    start=end - hours * 3600,
+                    end=end,
+                    limit=int(limit) if limit else 500
+                )
+            response = {
+                "engine": param("engine"),
+                "metric": param("metric"),
+                "hours": hours,
+                "resolution": resolution or "raw",
+                "count": len(metrics),
+                "metrics": metrics
+            }
+        except Exception as e:
+            response = {"error": f"Error querying metrics: {e}"}
+        
+        self.send_json_response(response)
+    
+    def send_prometheus_metrics(self):
+        """Send the metrics registry in the Prometheus text format for scraping."""
+        if not RECURSIVE_AVAILABLE:
+            self.send_text_response("# Recursive improvement system not available\n", status=503)
+            return
+        
+        try:
+            global _orchestrator
+            if _orchestrator is None:
+                _orchestrator = initialize_recursive_improvement_system()
+            body = registry.render()
+        except Exception as e:
+            self.send_text_response(f"# Error rendering metrics: {e}\n", status=500)
+            return
+        
+        self.send_text_response(body, METRICS_CONTENT_TYPE)
+    
     def trigger_recursive_improvement(self):
         """Trigger recursive improvement via API."""
         if not RECURSIVE_AVAILABLE:
@@ -260,10 +344,19 @@ class DashboardHandler(SimpleHTTPRequestHandler):
                     result = _orchestrator.trigger_recursive_improvement("dashboard_trigger", {
                         "source": "dashboard",
                         "timestamp": datetime.now().isoformat()
-                    })
+                    }, source="dashboard")
+                    
+                    if result.get("admission") == "rejected":
+                        response = {
+                            "error": f"Trigger rejected: {result.get('reason')}",
+                            "retry_after": result.get("retry_after", 0)
+                        }
+                        self.send_json_response(response, status=429 if "rate_limited" in result.get("reason", "") else 503)
+                        return
                     
                     response = {
                         "success": True,
+                        "admission": result.get("admission"),
                         "engines_triggered": len(result.get("engines_triggered", [])),
                         "total_improvements": result.get("total_improvements", 0),
                         "timestamp": result.get("timestamp")
@@ -275,12 +368,20 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         
         self.send_json_response(response)
 
-    def send_json_response(self, data):
-        self.send_response(200)
+    def send_json_response(self, data, status=200):
+        self.send_response(status)
         self.send_header('Content-type', 'application/json')
         self.end_headers()
         self.wfile.write(json.dumps(data).encode())
 
+    def send_text_response(self, body, content_type='text/plain; charset=utf-8', status=200):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
 
 def start_dashboard(port=8000):
     """Start the dashboard server."""
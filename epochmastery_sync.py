@@ -141,15 +141,23 @@ class EpochmasteryAgentSync:
         if not hasattr(self.orchestrator, 'engines'):
             return engines
             
-        for engine_id, engine in self.orchestrator.engines.items():
+        # Engines not loaded yet are described from their spec, not imported
+        loaded = self.orchestrator.engines.loaded()
+        for engine_id in self.orchestrator.engines:
+            engine = loaded.get(engine_id)
+            if engine is None:
+                class_name = self.orchestrator.engines.status_of(engine_id)["path"].rpartition(":")[2]
+            else:
+                class_name = engine.__class__.__name__
             engine_info = {
                 "id": engine_id,
                 "name": getattr(engine, 'name', engine_id),
                 "type": "recursive_engine",
-                "class_name": engine.__class__.__name__,
+                "class_name": class_name,
                 "status": "active" if getattr(engine, 'running', False) else "inactive",
+                "loaded": engine is not None,
                 "discovered_at": datetime.now().isoformat(),
-                "capabilities": self._extract_engine_capabilities(engine),
+                "capabilities": self._extract_engine_capabilities(class_name),
                 "health_score": self._calculate_engine_health(engine),
                 "version": "1.0.0"
             }
@@ -358,7 +366,7 @@ class EpochmasteryAgentSync:
                 self.orchestrator.trigger_recursive_improvement("epochmastery_sync", {
                     "context": "epochmastery_sync",
                     "audit_result": audit_result
-                })
+                }, source="epochmastery_sync")
                 feedback_result["feedback_triggered"] = True
             
             # Generate improvement suggestions
@@ -585,11 +593,10 @@ and includes full governance compliance, audit trails, and explainability docume
             labels=["epochmastery", "comprehensive-sync", "automation", "governance"]
         )
     
-    def _extract_engine_capabilities(self, engine) -> List[str]:
-        """Extract capabilities from engine instance."""
-        # Basic capability extraction based on class name and methods
+    def _extract_engine_capabilities(self, class_name: str) -> List[str]:
+        """Extract capabilities from an engine's class name."""
         capabilities = []
-        class_name = engine.__class__.__name__.lower()
+        class_name = class_name.lower()
         
         if "review" in class_name:
             capabilities.extend(["code_review", "pattern_learning"])
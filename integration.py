@@ -4,35 +4,49 @@ EpochCore RAS Integration System
 Enhanced with Recursive Autonomous Improvement Algorithms
 """
 
+import time
+_import_started = time.perf_counter()
+
+import os
 import sys
+import signal
 import argparse
+import threading
 from datetime import datetime
 import logging
 
-# Import recursive improvement framework
-from recursive_improvement import RecursiveOrchestrator
-from recursive_improvement.engines import (
-    RecursiveFeedbackLoopEngine,
-    AutonomousExperimentationTreeEngine,
-    SelfCloningMVPAgentEngine,
-    AssetLibraryEngine,
-    WeeklyAutoDebriefBotEngine,
-    KPIMutationEngine,
-    AutonomousEscalationLogicEngine,
-    RecursiveWorkflowAutomationEngine,
-    ContentStackTreeEngine,
-    SelfImprovingPlaybookGeneratorEngine,
-    # Recursive Autonomy Modules
-    AICodeReviewBotEngine,
-    AutoRefactorEngine,
-    DependencyHealthEngine,
-    WorkflowAuditorEngine,
-    DocUpdaterEngine
+# The framework itself is imported on first use, so commands answered by a
+# running daemon never load it
+from recursive_improvement.daemon import (
+    DEFAULT_SOCKET_PATH, DaemonClient, DaemonConnectionError, DaemonError, OrchestratorDaemon
 )
+from recursive_improvement.startup import StartupProfile
+from recursive_improvement.tracing import configure_tracing, tracer
+
+STARTUP_PROFILE = StartupProfile()
+STARTUP_PROFILE.record("integration", time.perf_counter() - _import_started, "import")
 
 # Global orchestrator instance
 _orchestrator = None
 
+# Daemon socket to forward commands to; None always runs them in-process
+_daemon_socket = os.environ.get("RECURSIVE_DAEMON_SOCKET", DEFAULT_SOCKET_PATH)
+_daemon_client = None
+
+
+def _daemon():
+    """Client for a running daemon, or None to run the command in-process."""
+    global _daemon_client
+    if _daemon_socket is None:
+        return None
+    if _daemon_client is None:
+        client = DaemonClient(_daemon_socket)
+        if not client.available():
+            return None
+        _daemon_client = client
+    return _daemon_client
+
+
 def initialize_recursive_improvement_system():
     """Initialize the recursive improvement system."""
     global _orchestrator
@@ -43,41 +57,30 @@ def initialize_recursive_improvement_system():
     try:
         print(f"[{datetime.now()}] Initializing Recursive Improvement System...")
         
+        with STARTUP_PROFILE.phase("recursive_improvement", "import"):
+            from recursive_improvement import RecursiveOrchestrator
+            from recursive_improvement.engines import ENGINE_SPECS
+        
         # Create orchestrator
-        _orchestrator = RecursiveOrchestrator()
-        
-        if not _orchestrator.initialize():
-            raise Exception("Failed to initialize orchestrator")
-        
-        # Register all 15 recursive improvement engines (10 original + 5 recursive autonomy)
-        engines = [
-            RecursiveFeedbackLoopEngine(),
-            AutonomousExperimentationTreeEngine(),
-            SelfCloningMVPAgentEngine(),
-            AssetLibraryEngine(),
-            WeeklyAutoDebriefBotEngine(),
-            KPIMutationEngine(),
-            AutonomousEscalationLogicEngine(),
-            RecursiveWorkflowAutomationEngine(),
-            ContentStackTreeEngine(),
-            SelfImprovingPlaybookGeneratorEngine(),
-            # Recursive Autonomy Modules
-            AICodeReviewBotEngine(),
-            AutoRefactorEngine(),
-            DependencyHealthEngine(),
-            WorkflowAuditorEngine(),
-            DocUpdaterEngine()
-        ]
+        with STARTUP_PROFILE.phase("orchestrator construction"):
+            _orchestrator = RecursiveOrchestrator()
         
-        registered_count = 0
-        for engine in engines:
-            if _orchestrator.register_engine(engine):
-                registered_count += 1
-                print(f"✓ Registered {engine.name}")
-            else:
-                print(f"✗ Failed to register {engine.name}")
+        with STARTUP_PROFILE.phase("orchestrator initialize"):
+            if not _orchestrator.initialize():
+                raise Exception("Failed to initialize orchestrator")
         
-        print(f"✓ Recursive Improvement System initialized with {registered_count}/15 engines")
+        # Register all 15 recursive improvement engines (10 original + 5 recursive autonomy).
+        # Each is imported and started the first time a context routes to it
+        registered_count = 0
+        with STARTUP_PROFILE.phase("engine registration"):
+            for spec in ENGINE_SPECS:
+                if _orchestrator.register_lazy_engine(spec):
+                    registered_count += 1
+                    print(f"✓ Registered {spec.name}")
+                else:
+                    print(f"✗ Failed to register {spec.name}")
+        
+        print(f"✓ Recursive Improvement System initialized with {registered_count}/{len(ENGINE_SPECS)} engines")
         return _orchestrator
         
     except Exception as e:
@@ -143,8 +146,15 @@ def get_status():
     
     # Add recursive improvement status
     global _orchestrator
-    if _orchestrator:
+    daemon = _daemon()
+    if daemon is not None:
+        system_status = daemon.call("status")
+    elif _orchestrator:
         system_status = _orchestrator.get_system_status()
+    else:
+        system_status = None
+    
+    if system_status:
         orchestrator_status = system_status.get("orchestrator", {})
         print(f"  RECURSIVE ENGINES: {orchestrator_status.get('active_engines', 0)} active")
         print(f"  IMPROVEMENTS: {orchestrator_status.get('total_improvements', 0)} total")
@@ -153,7 +163,7 @@ def get_status():
         print("  RECURSIVE ENGINES: Initializing...")
     
     print("  SYSTEM: Operational")
-    return {"status": "operational", "recursive_system": _orchestrator is not None}
+    return {"status": "operational", "recursive_system": system_status is not None}
 
 def validate_system():
     """Validate system integrity including recursive improvements."""
@@ -187,7 +197,17 @@ def validate_system():
     return {"status": "valid", "errors": 0, "recursive_system_validated": True}
 
 def main():
+    global _daemon_socket
     parser = argparse.ArgumentParser(description="EpochCore RAS Integration System with Recursive Improvements")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Print import and initialization timings after the command (see also python -X importtime)")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="Record every span of the command and write a Chrome trace (chrome://tracing, Perfetto)")
+    parser.add_argument("--socket", default=_daemon_socket,
+                        help="Daemon socket that commands are forwarded to when a daemon is running "
+                             "(default: $RECURSIVE_DAEMON_SOCKET or %(default)s)")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Run the command in-process even if a daemon is running")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
     subparsers.add_parser("setup-demo", help="Set up demo environment with recursive improvements")
@@ -203,6 +223,10 @@ def main():
     subparsers.add_parser("epochmastery-status", help="Get EPOCHMASTERY sync system status")
     subparsers.add_parser("epochmastery-discover", help="Discover all agents and modules")
     
+    # Resident orchestrator for the commands above
+    subparsers.add_parser("daemon", help="Keep the orchestrator resident and serve CLI commands over --socket")
+    subparsers.add_parser("daemon-stop", help="Stop the daemon listening on --socket")
+    
     # Add mesh sync command
     mesh_parser = subparsers.add_parser("mesh-sync", help="Run Organization Mesh Sync")
     mesh_parser.add_argument("--dry-run", default="true", help="Run in dry-run mode (true/false)")
@@ -211,6 +235,27 @@ def main():
     
     args = parser.parse_args()
     
+    _daemon_socket = None if args.no_daemon else args.socket
+    if args.trace:
+        # A daemon's spans stay in the daemon, so traced commands run in-process
+        _daemon_socket = None
+        configure_tracing({"sample_rate": 1.0})
+    
+    with STARTUP_PROFILE.phase(f"command {args.command}", "run"), tracer.span(f"cli.{args.command}"):
+        exit_code = run_command(parser, args)
+    
+    if args.trace:
+        print(f"✓ Wrote {tracer.export_chrome_trace(args.trace)} spans to {args.trace}")
+    
+    if args.startup_profile:
+        if _orchestrator is not None:
+            STARTUP_PROFILE.add_engine_loads(_orchestrator.engines.load_stats)
+        print(STARTUP_PROFILE.report())
+    return exit_code
+
+
+def run_command(parser, args):
+    """Dispatch a parsed subcommand and return its exit code."""
     if args.command == "setup-demo":
         result = setup_demo()
         return 0 if result["status"] == "success" else 1
@@ -241,6 +286,12 @@ def main():
     elif args.command == "epochmastery-discover":
         result = discover_epochmastery_agents()
         return 0 if result.get("status") == "success" else 1
+    elif args.command == "daemon":
+        result = run_daemon(args.socket)
+        return 0 if result.get("status") == "stopped" else 1
+    elif args.command == "daemon-stop":
+        result = stop_daemon(args.socket)
+        return 0 if result.get("status") == "stopped" else 1
     elif args.command == "mesh-sync":
         result = run_mesh_sync(args.dry_run, args.target_branch, args.config)
         return 0 if result.get("status") == "success" else 1
@@ -253,12 +304,15 @@ def get_recursive_status():
     """Get detailed recursive improvement system status."""
     global _orchestrator
     
-    if _orchestrator is None:
-        _orchestrator = initialize_recursive_improvement_system()
+    daemon = _daemon()
+    if daemon is not None:
+        status = daemon.call("status")
+    else:
+        if _orchestrator is None:
+            _orchestrator = initialize_recursive_improvement_system()
+        status = _orchestrator.get_system_status() if _orchestrator else None
     
-    if _orchestrator:
-        status = _orchestrator.get_system_status()
-        
+    if status:
         print("Recursive Improvement System Status:")
         print("=" * 40)
         
@@ -271,7 +325,10 @@ def get_recursive_status():
         print("\nEngine Status:")
         engines = status.get("engines", {})
         for name, engine_status in engines.items():
-            running_status = "✓ Running" if engine_status.get("running", False) else "✗ Stopped"
+            if not engine_status.get("loaded", True):
+                running_status = "○ Not loaded"
+            else:
+                running_status = "✓ Running" if engine_status.get("running", False) else "✗ Stopped"
             executions = engine_status.get("total_executions", 0)
             print(f"  {name}: {running_status} ({executions} executions)")
         
@@ -285,17 +342,26 @@ def trigger_manual_improvement():
     """Manually trigger recursive improvements."""
     global _orchestrator
     
-    if _orchestrator is None:
+    daemon = _daemon()
+    if daemon is None and _orchestrator is None:
         _orchestrator = initialize_recursive_improvement_system()
     
-    if _orchestrator:
+    if daemon is not None or _orchestrator:
         print("Triggering manual recursive improvement cycle...")
         
-        result = _orchestrator.trigger_recursive_improvement("manual_trigger", {
+        metadata = {
             "initiated_by": "user",
             "trigger_time": datetime.now().isoformat(),
             "context": "manual_execution"
-        })
+        }
+        if daemon is not None:
+            result = daemon.call("trigger", context="manual_trigger", metadata=metadata, source="cli")
+        else:
+            result = _orchestrator.trigger_recursive_improvement("manual_trigger", metadata, source="cli")
+        
+        if result.get("admission") == "rejected":
+            print(f"✗ Trigger rejected: {result.get('reason')} (retry after {result.get('retry_after', 0)}s)")
+            return {"status": "rejected", "result": result}
         
         print(f"✓ Triggered {len(result.get('engines_triggered', []))} engines")
         print(f"✓ Generated {result.get('total_improvements', 0)} improvements")
@@ -315,6 +381,76 @@ def cleanup_recursive_system():
         _orchestrator = None
 
 
+def run_daemon(socket_path=DEFAULT_SOCKET_PATH):
+    """Keep one orchestrator resident and serve CLI commands on a UNIX socket."""
+    global _daemon_socket
+    _daemon_socket = None  # Never forward to ourselves
+    
+    orchestrator = initialize_recursive_improvement_system()
+    if orchestrator is None:
+        return {"status": "error", "message": "System not initialized"}
+    
+    daemon = OrchestratorDaemon(orchestrator, socket_path)
+    
+    # EPOCHMASTERY commands share the resident orchestrator. Runs are
+    # serialized since the sync writes the manifest and ledger files
+    from epochmastery_sync import EpochmasteryAgentSync
+    sync_system = EpochmasteryAgentSync()
+    sync_system.orchestrator = orchestrator
+    readonly_system = EpochmasteryAgentSync()
+    epochmastery_lock = threading.Lock()
+    
+    def serialized(method):
+        def call():
+            with epochmastery_lock:
+                return method()
+        return call
+    
+    daemon.register("epochmastery_sync", serialized(sync_system.run_full_epochmastery_sync))
+    daemon.register("epochmastery_manifest", serialized(readonly_system._load_manifest))
+    daemon.register("epochmastery_discover", serialized(readonly_system.discover_all_agents))
+    
+    # serve_forever runs on this thread, so stop it from another one
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=daemon.stop, daemon=True).start())
+    
+    try:
+        daemon.bind()
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        cleanup_recursive_system()
+        return {"status": "error", "message": str(e)}
+    
+    print(f"✓ Orchestrator daemon listening on {socket_path} (pid {os.getpid()})")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cleanup_recursive_system()
+    print("✓ Orchestrator daemon stopped")
+    return {"status": "stopped"}
+
+
+def stop_daemon(socket_path=DEFAULT_SOCKET_PATH):
+    """Ask a running daemon to shut down."""
+    daemon = DaemonClient(socket_path)
+    try:
+        if not daemon.available():
+            print(f"No daemon listening on {socket_path}")
+            return {"status": "not_running"}
+        daemon.call("shutdown")
+    except DaemonConnectionError:
+        # The daemon can exit before its reply reaches us
+        pass
+    except DaemonError as e:
+        print(f"✗ Daemon on {socket_path} did not shut down: {e}")
+        return {"status": "error", "error": str(e)}
+    finally:
+        daemon.close()
+    print(f"✓ Daemon on {socket_path} is shutting down")
+    return {"status": "stopped"}
+
+
 def run_epochmastery_sync():
     """Run full EPOCHMASTERY AGENTIC SYNC & AUTO-PR workflow."""
     try:
@@ -323,8 +459,11 @@ def run_epochmastery_sync():
         print("🚀 STARTING EPOCHMASTERY AGENTIC SYNC & AUTO-PR")
         print("=" * 50)
         
-        sync_system = EpochmasteryAgentSync()
-        result = sync_system.run_full_epochmastery_sync()
+        daemon = _daemon()
+        if daemon is not None:
+            result = daemon.call("epochmastery_sync")
+        else:
+            result = EpochmasteryAgentSync().run_full_epochmastery_sync()
         
         print(f"\n✅ EPOCHMASTERY Sync Session: {result['session_id']}")
         print(f"📊 Overall Status: {result['overall_status'].upper()}")
@@ -367,8 +506,11 @@ def get_epochmastery_status():
     try:
         from epochmastery_sync import EpochmasteryAgentSync
         
-        sync_system = EpochmasteryAgentSync()
-        manifest = sync_system._load_manifest()
+        daemon = _daemon()
+        if daemon is not None:
+            manifest = daemon.call("epochmastery_manifest")
+        else:
+            manifest = EpochmasteryAgentSync()._load_manifest()
         
         print("EPOCHMASTERY AGENTIC SYNC System Status:")
         print("=" * 45)
@@ -422,8 +564,11 @@ def discover_epochmastery_agents():
         print("🔍 DISCOVERING EPOCHMASTERY AGENTS & MODULES")
         print("=" * 45)
         
-        sync_system = EpochmasteryAgentSync()
-        agents = sync_system.discover_all_agents()
+        daemon = _daemon()
+        if daemon is not None:
+            agents = daemon.call("epochmastery_discover")
+        else:
+            agents = EpochmasteryAgentSync().discover_all_agents()
         
         print(f"📊 Total Agents Discovered: {len(agents)}")
         print("\n🤖 Agent Registry:")
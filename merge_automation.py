@@ -19,6 +19,8 @@ from pathlib import Path
 import tempfile
 import re
 
+from recursive_improvement.log_config import configure_logging
+
 
 class MergeAutomation:
     """Manages automated merge operations with quality gates and rollback."""
@@ -33,7 +35,7 @@ class MergeAutomation:
             Path(path).mkdir(parents=True, exist_ok=True)
         
         # Setup logging
-        logging.basicConfig(level=logging.INFO)
+        configure_logging()
         self.logger = logging.getLogger(__name__)
         
         # Load configuration
@@ -3,19 +3,34 @@ EpochCore RAS Recursive Improvement Framework
 
 This module provides the core infrastructure for implementing recursive,
 compounding autonomous improvement algorithms across the entire system.
+
+Exports are imported on first access (PEP 562), so light submodules such as
+``recursive_improvement.daemon`` can be used without loading the framework.
 """
 
-from .base import RecursiveEngine, CompoundingAction
-from .orchestrator import RecursiveOrchestrator
-from .logger import RecursiveLogger
-from .scheduler import RecursiveScheduler
+import importlib
+
+_EXPORTS = {
+    'RecursiveEngine': '.base',
+    'CompoundingAction': '.base',
+    'RecursiveOrchestrator': '.orchestrator',
+    'RecursiveLogger': '.logger',
+    'RecursiveScheduler': '.scheduler'
+}
+
+__all__ = list(_EXPORTS)
+
+__version__ = '1.0.0'
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    'RecursiveEngine',
-    'CompoundingAction',
-    'RecursiveOrchestrator',
-    'RecursiveLogger',
-    'RecursiveScheduler'
-]
 
-__version__ = '1.0.0'
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
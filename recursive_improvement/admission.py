@@ -0,0 +1,184 @@
+"""
+Admission Control - Rate limiting and single-flight joining for improvement sweeps
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+from typing import Any, Callable, Dict, Tuple
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` tokens per second up to ``burst``."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, now: float = None) -> bool:
+        """Take one token if available."""
+        self._refill(now if now is not None else time.monotonic())
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def refund(self):
+        """Return a token taken by ``try_acquire``."""
+        self.tokens = min(self.burst, self.tokens + 1.0)
+
+    def retry_after(self) -> float:
+        """Seconds until the next token is available."""
+        if self.tokens >= 1.0 or self.rate <= 0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+class AdmissionRejected(Exception):
+    """Raised internally when a sweep is not admitted."""
+
+    def __init__(self, reason: str, retry_after: float = 0.0):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Gates improvement sweeps before they start.
+
+    A trigger whose key matches a sweep that is already running joins it and
+    receives the same result, waiting at most ``join_timeout`` seconds. A
+    trigger from inside that sweep's own thread is rejected, it would wait
+    on itself. Otherwise it must get a token from both its context's and its
+    source's bucket and fit under ``max_in_flight``; if not it is shed with a
+    reason and a ``retry_after`` hint rather than queued.
+    """
+
+    DEFAULT_CONFIG = {
+        "enabled": True,
+        "max_in_flight": 2,
+        "join_timeout": 60.0,
+        "context_rate": 0.2,
+        "context_burst": 5,
+        "source_rate": 0.5,
+        "source_burst": 10,
+        "max_buckets": 1024
+    }
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = {**self.DEFAULT_CONFIG, **(config or {})}
+        self.enabled = self.config["enabled"]
+        self.max_in_flight = self.config["max_in_flight"]
+        self.join_timeout = self.config["join_timeout"]
+        self.logger = logging.getLogger("recursive.admission")
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        # key -> (future, ident of the thread running the sweep)
+        self._in_flight: Dict[Any, Tuple[Future, int]] = {}
+        self._stats = {"admitted": 0, "joined": 0, "rate_limited": 0, "overloaded": 0,
+                       "reentrant": 0, "join_timeouts": 0, "max_in_flight_seen": 0}
+
+    def _bucket(self, kind: str, name: str) -> TokenBucket:
+        key = (kind, name)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.config["max_buckets"]:
+                # Drop buckets that have refilled completely, they carry no state
+                now = time.monotonic()
+                for stale_key, stale in list(self._buckets.items()):
+                    stale._refill(now)
+                    if stale.tokens >= stale.burst:
+                        del self._buckets[stale_key]
+            bucket = self._buckets[key] = TokenBucket(
+                self.config[f"{kind}_rate"], self.config[f"{kind}_burst"]
+            )
+        return bucket
+
+    def _admit(self, key: Any, context: str, source: str) -> Tuple[Future, bool]:
+        """Return the future for ``key`` and whether this caller owns the sweep."""
+        with self._lock:
+            running = self._in_flight.get(key)
+            if running is not None:
+                future, owner_thread = running
+                if owner_thread == threading.get_ident():
+                    self._stats["reentrant"] += 1
+                    raise AdmissionRejected("reentrant")
+                self._stats["joined"] += 1
+                return future, False
+
+            if len(self._in_flight) >= self.max_in_flight:
+                self._stats["overloaded"] += 1
+                raise AdmissionRejected("overloaded")
+
+            now = time.monotonic()
+            context_bucket = self._bucket("context", context)
+            if not context_bucket.try_acquire(now):
+                self._stats["rate_limited"] += 1
+                raise AdmissionRejected("context_rate_limited", context_bucket.retry_after())
+            source_bucket = self._bucket("source", source)
+            if not source_bucket.try_acquire(now):
+                context_bucket.refund()
+                self._stats["rate_limited"] += 1
+                raise AdmissionRejected("source_rate_limited", source_bucket.retry_after())
+
+            future = Future()
+            self._in_flight[key] = (future, threading.get_ident())
+            self._stats["admitted"] += 1
+            self._stats["max_in_flight_seen"] = max(self._stats["max_in_flight_seen"], len(self._in_flight))
+            return future, True
+
+    def run(self, key: Any, context: str, source: str,
+            sweep: Callable[[], Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Run ``sweep`` if admitted. Returns ``(outcome, result)`` where outcome
+        is "admitted", "joined" or "rejected"; rejected results carry
+        ``reason`` and ``retry_after``. A join that outlasts ``join_timeout``
+        is rejected with reason "join_timeout".
+        """
+        if not self.enabled:
+            return "admitted", sweep()
+
+        try:
+            future, owner = self._admit(key, context, source)
+        except AdmissionRejected as e:
+            self.logger.warning(f"Rejected sweep for {context} from {source}: {e.reason}")
+            return "rejected", {"reason": e.reason, "retry_after": round(e.retry_after, 3)}
+
+        if not owner:
+            try:
+                return "joined", future.result(self.join_timeout)
+            except TimeoutError:
+                with self._lock:
+                    self._stats["join_timeouts"] += 1
+                self.logger.warning(f"Timed out joining sweep for {context} from {source}")
+                return "rejected", {"reason": "join_timeout", "retry_after": 0.0}
+
+        try:
+            result = sweep()
+            future.set_result(result)
+            return "admitted", result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "in_flight": len(self._in_flight),
+                "max_in_flight": self.max_in_flight,
+                "buckets": len(self._buckets),
+                **self._stats
+            }
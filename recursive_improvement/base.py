@@ -4,15 +4,29 @@ Base classes for the Recursive Improvement Framework
 Provides foundation for all recursive, compounding autonomous improvement algorithms.
 """
 
-import asyncio
-import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 import logging
 
+from .blob_store import ContentAddressedBlobStore
+from .deadline_scheduler import shared_delayed_executor
+from .event_bus import HookEventBus
+from .metrics_registry import registry as metrics
+from .resources import ResourceMeter
+from .tracing import bind_context, tracer
+
+
+ACTION_SECONDS = metrics.histogram(
+    "recursive_engine_action_duration_seconds",
+    "Wall time of engine main and pre-actions in this process",
+    ("engine", "action")
+)
+
 
 @dataclass
 class CompoundingAction:
@@ -30,9 +44,50 @@ class CompoundingAction:
             self.metadata = {}
 
 
+class ExecutionRecord:
+    """
+    Compact summary of one ``execute_with_compounding`` call. The full result
+    is kept in the logger's blob store under ``result_digest``.
+    """
+    
+    __slots__ = ("timestamp", "duration", "status", "actions", "result_digest")
+    
+    def __init__(self, timestamp: float, duration: float, status: str,
+                 actions: int, result_digest: str):
+        self.timestamp = timestamp
+        self.duration = duration
+        self.status = status
+        self.actions = actions
+        self.result_digest = result_digest
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "duration": self.duration,
+            "status": self.status,
+            "actions": self.actions,
+            "result_digest": self.result_digest
+        }
+
+
 class RecursiveEngine(ABC):
     """Abstract base class for all recursive improvement engines."""
     
+    # "io" engines run on threads; "cpu" engines are GIL-bound and run in a worker process
+    execution_class = "io"
+    
+    # Trigger context tags this engine subscribes to, e.g. ("workflow",). None
+    # falls back to the orchestrator's legacy name-based context groups
+    context_tags: Optional[tuple] = None
+    
+    # Engine-specific attributes saved in checkpoints and marshalled to worker processes
+    state_attributes: tuple = ()
+    
+    # Weekly cycle ordering: names of engines or artifacts this engine needs, and
+    # the artifacts it produces. Dependents run after, and are skipped if, these fail
+    depends_on: tuple = ()
+    produces: tuple = ()
+    
     def __init__(self, name: str, config: Dict[str, Any] = None):
         self.name = name
         self.config = config or {}
@@ -40,7 +95,33 @@ class RecursiveEngine(ABC):
         self.is_running = False
         self.actions: List[CompoundingAction] = []
         self.last_execution = {}
-        self.execution_history = []
+        # Ring buffer of recent ExecutionRecords; total_executions counts all of them
+        self.execution_history = deque(maxlen=self.config.get("history_size", 100))
+        self.total_executions = 0
+        # Set by the orchestrator on registration, gives access to logged history
+        self.recursive_logger = None
+        # Encoded result of the latest run without a logger, a process pool
+        # worker hands it back for the parent to store
+        self.unstored_payload: Optional[Tuple[str, bytes]] = None
+        # Minimum time between runs of each action type, overridable in seconds
+        self.intervals = {"main": timedelta(weeks=1.0), "pre": timedelta(weeks=0.25)}
+        for action_type, seconds in self.config.get("intervals", {}).items():
+            self.intervals[action_type] = timedelta(seconds=seconds)
+        # Pre-actions start this many seconds into the main action, on the shared timer
+        self.pre_action_delay = self.config.get("pre_action_delay", 0.25)
+        self.pre_action_stats = {
+            "runs": 0,
+            "overlap_last": 0.0,
+            "overlap_total": 0.0,
+            "queue_delay_last": 0.0,
+            "queue_delay_max": 0.0
+        }
+        # Last successful result and the input fingerprint it was computed from
+        self.memoize = self.config.get("memoize", True)
+        self.memo: Optional[Dict[str, Any]] = None
+        self.memo_stats = {"hits": 0, "misses": 0}
+        # Wall/CPU time, peak RSS and allocation sites of each main and pre-action run
+        self.resources = ResourceMeter(self.config.get("resources"))
         
     @abstractmethod
     def initialize(self) -> bool:
@@ -54,9 +135,50 @@ class RecursiveEngine(ABC):
     
     def execute_pre_action(self) -> Dict[str, Any]:
         """Execute pre-action that runs before main action completes."""
-        self.logger.info(f"{self.name}: Executing pre-action at +{0.25} interval")
+        self.logger.info(f"{self.name}: Executing pre-action at +{self.pre_action_delay}s")
         return {"status": "pre-action_completed", "engine": self.name}
     
+    async def run_main(self) -> Dict[str, Any]:
+        """
+        Async main action. Engines with native async I/O override this; the
+        default runs ``execute_main_action`` on the event loop's executor.
+        """
+        import asyncio  # Imported on use, it is costly and sync callers never need it
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, bind_context(self._measured), "main", self.execute_main_action)
+    
+    async def run_pre(self) -> Dict[str, Any]:
+        """Async pre-action, defaults to ``execute_pre_action`` on the executor."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, bind_context(self._measured), "pre", self.execute_pre_action)
+    
+    def _measured(self, action_type: str, action: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Run an action on the current thread under a span, the resource meter and its histogram."""
+        started = time.perf_counter()
+        try:
+            with tracer.span(f"engine.{action_type}_action", engine=self.name), self.resources.measure(action_type):
+                return action()
+        finally:
+            ACTION_SECONDS.labels(self.name, action_type).observe(time.perf_counter() - started)
+    
+    async def _run_measured_async(self, action_type: str) -> Dict[str, Any]:
+        """
+        Await ``run_main``/``run_pre``. The defaults measure on their executor
+        thread; native async overrides share the loop, so only their wall
+        time is measured.
+        """
+        method = f"run_{action_type}"
+        if getattr(type(self), method) is getattr(RecursiveEngine, method):
+            return await getattr(self, method)()
+        started = time.perf_counter()
+        try:
+            with tracer.span(f"engine.{action_type}_action", engine=self.name), \
+                    self.resources.measure(action_type, cpu=False):
+                return await getattr(self, method)()
+        finally:
+            ACTION_SECONDS.labels(self.name, action_type).observe(time.perf_counter() - started)
+    
     def add_compounding_action(self, action: CompoundingAction):
         """Add a compounding action to this engine."""
         self.actions.append(action)
@@ -73,8 +195,7 @@ class RecursiveEngine(ABC):
             return True
             
         last_exec = self.last_execution[action_type]
-        interval = 1.0 if action_type == 'main' else 0.25
-        next_exec = last_exec + timedelta(weeks=interval)
+        next_exec = last_exec + self.intervals.get(action_type, self.intervals['pre'])
         return datetime.now() >= next_exec
     
     def execute_with_compounding(self) -> Dict[str, Any]:
@@ -87,46 +208,145 @@ class RecursiveEngine(ABC):
             "timestamp": datetime.now().isoformat(),
             "actions_executed": []
         }
+        started = time.monotonic()
+        executor = shared_delayed_executor()
+        pre_call = None
         
         try:
-            # Schedule pre-action to run during main action execution
+            # Queue the pre-action to start part-way into the main action
             if self.should_execute('pre'):
-                pre_thread = threading.Thread(
-                    target=self._delayed_pre_action, 
-                    args=(0.25,)
-                )
-                pre_thread.start()
+                pre_call = executor.schedule(self.pre_action_delay, bind_context(self._run_pre_action))
             
             # Execute main action
             if self.should_execute('main'):
-                main_result = self.execute_main_action()
+                main_result = self._measured("main", self.execute_main_action)
                 result["main_action"] = main_result
                 result["actions_executed"].append("main")
                 self.last_execution['main'] = datetime.now()
+            main_finished = time.monotonic()
             
             # Wait for pre-action to complete if it was started
-            if 'pre_thread' in locals():
-                pre_thread.join(timeout=10)  # Don't wait forever
+            if pre_call is not None:
+                # Once the main action is done there is nothing left to overlap with
+                executor.expedite(pre_call)
+                self._await_pre_action(pre_call, started, main_finished)
             
-            self.execution_history.append(result)
+            self._record_execution(result, started)
             return result
             
         except Exception as e:
             self.logger.error(f"{self.name}: Execution error - {e}")
             result["error"] = str(e)
+            self._record_execution(result, started)
             return result
     
-    def _delayed_pre_action(self, delay: float):
-        """Execute pre-action with delay to create overlap."""
-        time.sleep(delay)
+    def _run_pre_action(self) -> Optional[tuple]:
+        """Run the pre-action if due. Returns its monotonic start and end times."""
+        if not self.should_execute('pre'):
+            return None
+        
+        pre_started = time.monotonic()
+        try:
+            self._measured("pre", self.execute_pre_action)
+            self.last_execution['pre'] = datetime.now()
+            self.logger.info(f"{self.name}: Pre-action completed with overlap")
+        except Exception as e:
+            self.logger.error(f"{self.name}: Pre-action error - {e}")
+        return pre_started, time.monotonic()
+    
+    def _await_pre_action(self, pre_call, main_started: float, main_finished: float):
+        """Wait for a queued pre-action and record its overlap and queueing delay."""
+        try:
+            timing = pre_call.future.result(timeout=10)  # Don't wait forever
+        except FuturesTimeoutError:
+            self.logger.warning(f"{self.name}: Pre-action still running after 10s")
+            return
+        if timing is None:
+            return
+        
+        pre_started, pre_finished = timing
+        overlap = max(0.0, min(main_finished, pre_finished) - max(main_started, pre_started))
+        queue_delay = max(0.0, pre_started - pre_call.due)
+        
+        stats = self.pre_action_stats
+        stats["runs"] += 1
+        stats["overlap_last"] = overlap
+        stats["overlap_total"] += overlap
+        stats["queue_delay_last"] = queue_delay
+        stats["queue_delay_max"] = max(stats["queue_delay_max"], queue_delay)
+    
+    async def execute_with_compounding_async(self) -> Dict[str, Any]:
+        """
+        Event-loop counterpart of ``execute_with_compounding``. The overlapping
+        pre-action is a task on the same loop rather than a sleeping thread.
+        """
+        if not self.is_running:
+            return {"error": "Engine not running"}
+        
+        result = {
+            "engine": self.name,
+            "timestamp": datetime.now().isoformat(),
+            "actions_executed": []
+        }
+        started = time.monotonic()
+        
+        import asyncio
+        pre_task = None
+        try:
+            if self.should_execute('pre'):
+                pre_task = asyncio.ensure_future(self._delayed_pre_action_async(self.pre_action_delay))
+            
+            if self.should_execute('main'):
+                main_result = await self._run_measured_async("main")
+                result["main_action"] = main_result
+                result["actions_executed"].append("main")
+                self.last_execution['main'] = datetime.now()
+            
+            if pre_task is not None:
+                await asyncio.wait({pre_task}, timeout=10)  # Don't wait forever
+            
+            self._record_execution(result, started)
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"{self.name}: Execution error - {e}")
+            result["error"] = str(e)
+            self._record_execution(result, started)
+            return result
+    
+    async def _delayed_pre_action_async(self, delay: float):
+        """Run the pre-action after ``delay`` seconds without holding a thread."""
+        import asyncio
+        await asyncio.sleep(delay)
         if self.should_execute('pre'):
             try:
-                pre_result = self.execute_pre_action()
+                await self._run_measured_async("pre")
                 self.last_execution['pre'] = datetime.now()
                 self.logger.info(f"{self.name}: Pre-action completed with overlap")
             except Exception as e:
                 self.logger.error(f"{self.name}: Pre-action error - {e}")
     
+    def _record_execution(self, result: Dict[str, Any], started: float):
+        """Append a compact record of ``result``, spilling the payload to the logger."""
+        try:
+            if self.recursive_logger is not None:
+                digest = self.recursive_logger.store_payload(result)
+            else:
+                digest, data = ContentAddressedBlobStore.encode(result)
+                self.unstored_payload = (digest, data)
+        except Exception as e:
+            self.logger.error(f"{self.name}: Failed to store execution result - {e}")
+            digest = None
+        
+        self.execution_history.append(ExecutionRecord(
+            time.time(),
+            time.monotonic() - started,
+            "error" if "error" in result else "completed",
+            len(result.get("actions_executed", [])),
+            digest
+        ))
+        self.total_executions += 1
+    
     def start(self) -> bool:
         """Start the recursive engine."""
         if self.initialize():
@@ -140,23 +360,94 @@ class RecursiveEngine(ABC):
         self.is_running = False
         self.logger.info(f"{self.name}: Stopped")
     
+    def input_fingerprint(self) -> Optional[str]:
+        """
+        Digest of everything the main action reads. While it matches the last
+        successful run, that run's result is reused instead of executing again.
+        None (the default) means the engine is always executed.
+        """
+        return None
+    
+    def memoized_result(self) -> tuple:
+        """Return ``(fingerprint, cached_result)``, the result being None on a miss."""
+        if not self.memoize:
+            return None, None
+        try:
+            with tracer.span("engine.fingerprint", engine=self.name):
+                fingerprint = self.input_fingerprint()
+        except Exception as e:
+            self.logger.warning(f"{self.name}: Failed to fingerprint inputs - {e}")
+            return None, None
+        if fingerprint is None:
+            return None, None
+        
+        if self.memo is not None and self.memo["fingerprint"] == fingerprint:
+            self.memo_stats["hits"] += 1
+            return fingerprint, {**self.memo["result"], "actions_executed": [], "cached": True}
+        self.memo_stats["misses"] += 1
+        return fingerprint, None
+    
+    def remember_result(self, fingerprint: Optional[str], result: Dict[str, Any]):
+        """Keep ``result`` for reuse if it is a successful main-action run."""
+        if fingerprint is not None and "main" in result.get("actions_executed", ()) and "error" not in result:
+            self.memo = {"fingerprint": fingerprint, "result": result}
+    
+    def export_state(self) -> Dict[str, Any]:
+        """Export the picklable execution state of this engine."""
+        state = {
+            "last_execution": self.last_execution,
+            "execution_history": self.execution_history,
+            "total_executions": self.total_executions,
+            "memo": self.memo,
+            "resources": self.resources.export_state()
+        }
+        for attribute in self.state_attributes:
+            state[attribute] = getattr(self, attribute)
+        return state
+    
+    def import_state(self, state: Dict[str, Any]):
+        """Replace execution state with one produced by ``export_state``."""
+        for attribute, value in state.items():
+            current = getattr(self, attribute, None)
+            # Helpers such as the resource meter restore in place and keep their settings
+            if isinstance(current, ResourceMeter):
+                current.import_state(value)
+                continue
+            # Bounded buffers keep this engine's configured size
+            if isinstance(current, deque) and not (isinstance(value, deque) and value.maxlen == current.maxlen):
+                value = deque(value, maxlen=current.maxlen)
+            setattr(self, attribute, value)
+    
     def get_status(self) -> Dict[str, Any]:
         """Get current engine status."""
         return {
             "name": self.name,
             "running": self.is_running,
             "last_execution": self.last_execution,
-            "total_executions": len(self.execution_history),
-            "actions_count": len(self.actions)
+            "total_executions": self.total_executions,
+            "actions_count": len(self.actions),
+            "pre_action": self.pre_action_stats,
+            "memoization": self.memo_stats,
+            "resources": self.resources.summary()
         }
 
 
 class RecursiveHook:
-    """Hook system for integrating recursive improvements into existing modules."""
+    """
+    Hook system for integrating recursive improvements into existing modules.
     
-    def __init__(self):
+    In the default ``"sync"`` mode callbacks run on the triggering thread and
+    their results are returned. In ``"bus"`` mode events are queued on a
+    ``HookEventBus`` and dispatched in the background, with optional per-event
+    debounce, coalescing and priority (see ``configure_event``).
+    """
+    
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = config or {}
         self.hooks: Dict[str, List[Callable]] = {}
         self.logger = logging.getLogger("recursive.hooks")
+        self.mode = self.config.get("mode", "sync")
+        self.bus = HookEventBus(self._dispatch, self.config) if self.mode == "bus" else None
     
     def register_hook(self, event: str, callback: Callable):
         """Register a hook for a specific event."""
@@ -165,15 +456,45 @@ class RecursiveHook:
         self.hooks[event].append(callback)
         self.logger.debug(f"Registered hook for event: {event}")
     
+    def configure_event(self, event: str, debounce: float = None, max_wait: float = None,
+                        priority: int = None):
+        """Set bus dispatch options for an event. Ignored in sync mode."""
+        if self.bus is not None:
+            self.bus.configure_event(event, debounce=debounce, max_wait=max_wait, priority=priority)
+    
     def trigger_hook(self, event: str, *args, **kwargs):
         """Trigger all hooks for a specific event."""
-        if event in self.hooks:
-            results = []
-            for hook in self.hooks[event]:
-                try:
-                    result = hook(*args, **kwargs)
-                    results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Hook error for {event}: {e}")
-            return results
-        return []
\ No newline at end of file
+        if self.bus is not None:
+            if event in self.hooks:
+                self.bus.publish(event, args, kwargs)
+            return []
+        return self._dispatch(event, args, kwargs)
+    
+    def _dispatch(self, event: str, args: tuple, kwargs: Dict[str, Any]) -> List[Any]:
+        results = []
+        for hook in list(self.hooks.get(event, [])):
+            try:
+                result = hook(*args, **kwargs)
+                results.append(result)
+            except Exception as e:
+                self.logger.error(f"Hook error for {event}: {e}")
+        return results
+    
+    def flush(self, timeout: float = None) -> bool:
+        """Wait for queued bus events to be dispatched."""
+        return self.bus.flush(timeout) if self.bus is not None else True
+    
+    def stop(self):
+        """Dispatch pending bus events and stop the dispatcher."""
+        if self.bus is not None:
+            self.bus.stop()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hook registration and dispatch statistics."""
+        stats = {
+            "mode": self.mode,
+            "registered": {event: len(callbacks) for event, callbacks in self.hooks.items()}
+        }
+        if self.bus is not None:
+            stats.update(self.bus.get_stats())
+        return stats
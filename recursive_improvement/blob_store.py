@@ -0,0 +1,121 @@
+"""
+Blob Store - Content-addressed storage for large recursive action payloads
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+BLOB_REF = "$blob"
+
+
+class ContentAddressedBlobStore:
+    """
+    Stores JSON payloads once under the SHA-256 of their canonical encoding
+    (``<dir>/<2-char prefix>/<digest>.json.gz``). Writing a payload that is
+    already stored is a no-op, so identical results dedupe automatically.
+    """
+
+    name = "blobs"
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger("recursive.blob_store")
+        self._lock = threading.Lock()
+        self._known = set()
+        self._stats = {"blobs_written": 0, "dedup_hits": 0, "bytes_written": 0}
+
+    @staticmethod
+    def encode(value: Any) -> Tuple[str, bytes]:
+        """Return the digest and canonical JSON encoding of ``value``."""
+        data = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        return hashlib.sha256(data).hexdigest(), data
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / f"{digest}.json.gz"
+
+    def exists(self, digest: str) -> bool:
+        """Check whether a blob is stored."""
+        return digest in self._known or self._path(digest).exists()
+
+    def put_encoded(self, digest: str, data: bytes):
+        """Store pre-encoded bytes under ``digest`` unless already present."""
+        with self._lock:
+            if self.exists(digest):
+                self._known.add(digest)
+                self._stats["dedup_hits"] += 1
+                return
+
+        path = self._path(digest)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = Path(f"{path}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._known.add(digest)
+            self._stats["blobs_written"] += 1
+            self._stats["bytes_written"] += path.stat().st_size
+
+    def append_many(self, blobs: Iterable[Tuple[str, bytes]]):
+        """Store a batch of ``(digest, data)`` pairs."""
+        for digest, data in blobs:
+            self.put_encoded(digest, data)
+
+    def put(self, value: Any) -> str:
+        """Store ``value`` and return its digest."""
+        digest, data = self.encode(value)
+        self.put_encoded(digest, data)
+        return digest
+
+    def get(self, digest: str) -> Any:
+        """Load the payload stored under ``digest``."""
+        with gzip.open(self._path(digest), "rb") as f:
+            return json.loads(f.read())
+
+    def externalize(self, value: Any, threshold: int, pending: List[Tuple[str, bytes]]) -> Any:
+        """
+        Replace every nested dict/list whose encoding exceeds ``threshold``
+        bytes with a ``{"$blob": digest}`` reference, innermost first. The
+        same subtree always compacts to the same blob wherever it appears.
+        Blobs to write are appended to ``pending``; nothing touches disk here.
+        """
+        if not isinstance(value, (dict, list)):
+            return value
+
+        _, data = self.encode(value)
+        if len(data) <= threshold:
+            return value
+
+        if isinstance(value, dict):
+            value = {key: self.externalize(item, threshold, pending)
+                     for key, item in value.items()}
+        else:
+            value = [self.externalize(item, threshold, pending) for item in value]
+
+        digest, data = self.encode(value)
+        pending.append((digest, data))
+        return {BLOB_REF: digest}
+
+    def resolve(self, value: Any) -> Any:
+        """Recursively replace blob references with their payloads."""
+        if isinstance(value, dict):
+            if BLOB_REF in value:
+                return self.resolve(self.get(value[BLOB_REF]))
+            return {key: self.resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.resolve(item) for item in value]
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get blob storage statistics."""
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,129 @@
+"""
+Engine Checkpoints - Snapshot and restore of recursive engine state
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .base import RecursiveEngine
+
+
+CHECKPOINT_VERSION = 1
+
+
+class EngineCheckpointStore:
+    """
+    Keeps one gzipped pickle per engine (``<dir>/<engine>.ckpt.gz``) holding
+    the state returned by ``export_state``. Files are replaced atomically and
+    only rewritten when the state actually changed since the last save.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger("recursive.checkpoint")
+        self._lock = threading.Lock()
+        self._digests: Dict[str, str] = {}
+        self._stats = {"saved": 0, "unchanged": 0, "restored": 0, "errors": 0, "bytes_written": 0}
+
+    def _path(self, engine_name: str) -> Path:
+        return self.directory / f"{engine_name}.ckpt.gz"
+
+    @staticmethod
+    def _class_path(engine: RecursiveEngine) -> str:
+        return f"{type(engine).__module__}.{type(engine).__qualname__}"
+
+    def save(self, engine: RecursiveEngine) -> bool:
+        """Write a checkpoint for ``engine``. Returns True if a file was written."""
+        try:
+            data = pickle.dumps(engine.export_state(), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # State can change under a running engine, the next save retries
+            self.logger.error(f"Failed to snapshot {engine.name}: {e}")
+            with self._lock:
+                self._stats["errors"] += 1
+            return False
+
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if self._digests.get(engine.name) == digest:
+                self._stats["unchanged"] += 1
+                return False
+
+        header = {
+            "version": CHECKPOINT_VERSION,
+            "engine": engine.name,
+            "class": self._class_path(engine),
+            "saved_at": time.time()
+        }
+        path = self._path(engine.name)
+        tmp_path = Path(f"{path}.{threading.get_ident()}.tmp")
+        try:
+            with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.error(f"Failed to write checkpoint for {engine.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            with self._lock:
+                self._stats["errors"] += 1
+            return False
+
+        with self._lock:
+            self._digests[engine.name] = digest
+            self._stats["saved"] += 1
+            self._stats["bytes_written"] += path.stat().st_size
+        return True
+
+    def save_all(self, engines: Iterable[RecursiveEngine]) -> int:
+        """Checkpoint every engine whose state changed. Returns the number written."""
+        return sum(1 for engine in engines if self.save(engine))
+
+    def load(self, engine: RecursiveEngine) -> Optional[Dict[str, Any]]:
+        """Read the checkpointed state for ``engine`` if one exists and matches its class."""
+        path = self._path(engine.name)
+        if not path.exists():
+            return None
+
+        try:
+            with gzip.open(path, "rb") as f:
+                header = pickle.load(f)
+                if header.get("version") != CHECKPOINT_VERSION or header.get("class") != self._class_path(engine):
+                    self.logger.warning(f"Ignoring incompatible checkpoint for {engine.name}")
+                    return None
+                data = f.read()
+            state = pickle.loads(data)
+        except Exception as e:
+            self.logger.error(f"Failed to read checkpoint for {engine.name}: {e}")
+            with self._lock:
+                self._stats["errors"] += 1
+            return None
+
+        with self._lock:
+            self._digests[engine.name] = hashlib.sha256(data).hexdigest()
+        return state
+
+    def restore(self, engine: RecursiveEngine) -> bool:
+        """Import checkpointed state into ``engine``."""
+        state = self.load(engine)
+        if state is None:
+            return False
+
+        engine.import_state(state)
+        with self._lock:
+            self._stats["restored"] += 1
+        self.logger.info(f"Restored {engine.name} from checkpoint")
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get checkpoint statistics."""
+        with self._lock:
+            return {"directory": str(self.directory), **self._stats}
@@ -0,0 +1,273 @@
+"""
+Orchestrator Daemon - Resident orchestrator served over a local UNIX socket
+
+Frames are a 4-byte big-endian length followed by a UTF-8 JSON body.
+Requests are ``{"method": str, "params": {...}}``; replies are
+``{"ok": true, "result": ...}`` or ``{"ok": false, "error": str}``. A
+connection may carry any number of request/reply pairs.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+DEFAULT_SOCKET_PATH = os.path.join("logs", "orchestrator.sock")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+_HEADER = struct.Struct(">I")
+
+
+class DaemonError(Exception):
+    """Raised by the client when the daemon cannot be reached or a call fails."""
+
+
+class DaemonConnectionError(DaemonError):
+    """Raised when the connection to the daemon cannot be made or is lost."""
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            return None
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+def send_frame(sock: socket.socket, payload: Any):
+    """Write one length-prefixed JSON frame."""
+    body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    if len(body) > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME_SIZE}")
+    sock.sendall(_HEADER.pack(len(body)) + body)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Any]:
+    """Read one frame. Returns None when the peer closed the connection."""
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    (size,) = _HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {size} bytes exceeds {MAX_FRAME_SIZE}")
+    body = _recv_exact(sock, size)
+    if body is None:
+        return None
+    return json.loads(body)
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        daemon: "OrchestratorDaemon" = self.server.daemon
+        while True:
+            try:
+                request = recv_frame(self.request)
+            except (OSError, ValueError) as e:
+                daemon.logger.warning(f"Dropping client connection: {e}")
+                return
+            if request is None:
+                return
+            try:
+                send_frame(self.request, daemon.dispatch(request))
+            except OSError:
+                return
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class OrchestratorDaemon:
+    """
+    Keeps one orchestrator resident and answers RPC calls for it on a UNIX
+    socket. Methods are plain callables taking keyword parameters; the
+    built-in ones cover status, triggers and manual engine runs, and more
+    can be added with ``register``.
+    """
+
+    def __init__(self, orchestrator, socket_path: str = DEFAULT_SOCKET_PATH):
+        self.orchestrator = orchestrator
+        self.socket_path = socket_path
+        self.logger = logging.getLogger("recursive.daemon")
+        self.methods: Dict[str, Callable[..., Any]] = {}
+        self._server: Optional[_UnixServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"requests": 0, "errors": 0, "latency_total": 0.0, "latency_max": 0.0}
+        self._stats_lock = threading.Lock()
+        self.started_at = time.time()
+
+        self.register("ping", lambda: "pong")
+        self.register("status", orchestrator.get_system_status)
+        self.register("trigger", self._trigger)
+        self.register("execute_engine", lambda engine: orchestrator.execute_engine(engine))
+        self.register("daemon_stats", self.get_stats)
+        self.register("shutdown", self._request_shutdown)
+
+    def register(self, method: str, handler: Callable[..., Any]):
+        """Expose ``handler`` to clients as ``method``."""
+        self.methods[method] = handler
+
+    def _trigger(self, context: str = "manual_trigger", metadata: Dict[str, Any] = None,
+                 source: str = None) -> Dict[str, Any]:
+        return self.orchestrator.trigger_recursive_improvement(context, metadata, source=source)
+
+    def _request_shutdown(self) -> bool:
+        # Reply first, stop from another thread once the handler returns
+        threading.Thread(target=self.stop, name="recursive-daemon-stop", daemon=True).start()
+        return True
+
+    def dispatch(self, request: Any) -> Dict[str, Any]:
+        """Run one request and build its reply."""
+        started = time.perf_counter()
+        try:
+            method = request["method"]
+            handler = self.methods.get(method)
+            if handler is None:
+                raise KeyError(f"Unknown method: {method}")
+            reply = {"ok": True, "result": handler(**(request.get("params") or {}))}
+        except Exception as e:
+            self.logger.error(f"RPC {request!r:.80} failed: {e}")
+            reply = {"ok": False, "error": str(e)}
+
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            self._stats["errors"] += 0 if reply["ok"] else 1
+            self._stats["latency_total"] += elapsed
+            self._stats["latency_max"] = max(self._stats["latency_max"], elapsed)
+        return reply
+
+    def bind(self):
+        """Create the socket, replacing a stale one left by a daemon that died."""
+        if os.path.exists(self.socket_path):
+            probe = DaemonClient(self.socket_path)
+            try:
+                listening = probe.available()
+            finally:
+                probe.close()
+            if listening:
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            os.unlink(self.socket_path)
+        directory = os.path.dirname(self.socket_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # The socket is created owner-only, a chmod afterwards would leave it
+        # open to others until then. The umask is process-wide, keep the window short
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        self._server.daemon = self
+        self.logger.info(f"Daemon listening on {self.socket_path}")
+
+    def serve_forever(self):
+        """Serve on the calling thread until ``stop`` is called."""
+        if self._server is None:
+            self.bind()
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._cleanup()
+
+    def start(self):
+        """Serve on a background thread."""
+        self.bind()
+        self._thread = threading.Thread(target=self.serve_forever, name="recursive-daemon", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving and remove the socket file."""
+        if self._server is not None:
+            self._server.shutdown()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _cleanup(self):
+        server, self._server = self._server, None
+        if server is not None:
+            server.server_close()
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+        self.logger.info("Daemon stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request counts and latency."""
+        with self._stats_lock:
+            requests = self._stats["requests"]
+            return {
+                "socket": self.socket_path,
+                "pid": os.getpid(),
+                "uptime": time.time() - self.started_at,
+                "requests": requests,
+                "errors": self._stats["errors"],
+                "latency_avg": self._stats["latency_total"] / requests if requests else 0.0,
+                "latency_max": self._stats["latency_max"]
+            }
+
+
+class DaemonClient:
+    """Client for ``OrchestratorDaemon``; keeps one connection open across calls."""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, timeout: float = 300.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError as e:
+                sock.close()
+                raise DaemonConnectionError(f"Cannot reach daemon at {self.socket_path}: {e}") from e
+            self._sock = sock
+        return self._sock
+
+    def available(self) -> bool:
+        """Check whether a daemon is accepting connections."""
+        if not os.path.exists(self.socket_path):
+            return False
+        try:
+            self._connect()
+            return True
+        except DaemonError:
+            return False
+
+    def call(self, method: str, **params) -> Any:
+        """Invoke a daemon method and return its result."""
+        sock = self._connect()
+        try:
+            send_frame(sock, {"method": method, "params": params})
+            reply = recv_frame(sock)
+        except OSError as e:
+            self.close()
+            raise DaemonConnectionError(f"Daemon call {method} failed: {e}") from e
+        except ValueError as e:
+            self.close()
+            raise DaemonError(f"Daemon call {method} failed: {e}") from e
+        if reply is None:
+            self.close()
+            raise DaemonConnectionError(f"Daemon closed the connection during {method}")
+        if not reply.get("ok"):
+            raise DaemonError(reply.get("error", "unknown error"))
+        return reply.get("result")
+
+    def close(self):
+        """Close the connection."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
@@ -0,0 +1,454 @@
+"""
+Deadline Scheduler - Min-heap timer core for recursive improvement jobs
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from .metrics_registry import registry as metrics
+
+
+SCHEDULER_LAG = metrics.histogram(
+    "recursive_scheduler_lag_seconds",
+    "How late scheduled jobs fired after their due time",
+    ("job",),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0)
+)
+JOB_SECONDS = metrics.histogram(
+    "recursive_scheduler_job_duration_seconds",
+    "Wall time of scheduled job callbacks",
+    ("job",),
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+)
+DELAYED_CALL_LAG = metrics.histogram(
+    "recursive_delayed_call_lag_seconds",
+    "Queueing delay of delayed calls such as compounding pre-actions past their due time",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+)
+
+# Shorthand cron expressions
+CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *"
+}
+
+
+class CronExpression:
+    """
+    Five-field cron expression (minute hour day month weekday) supporting
+    ``*``, lists, ranges and steps. Weekdays run 0-6 from Sunday (7 is also
+    Sunday). As in cron, when both day and weekday are restricted a time
+    matching either one fires.
+    """
+
+    FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7))
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        parts = CRON_ALIASES.get(expression.strip(), expression).split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression '{expression}' must have 5 fields")
+
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse(part, low, high, name)
+            for part, (name, low, high) in zip(parts, self.FIELDS)
+        )
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self._day_restricted = parts[2] != "*"
+        self._weekday_restricted = parts[4] != "*"
+
+    @staticmethod
+    def _parse(field: str, low: int, high: int, name: str) -> frozenset:
+        values = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+                if step < 1:
+                    raise ValueError(f"Invalid step in cron {name} field '{field}'")
+
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start_text, end_text = part.split("-", 1)
+                start, end = int(start_text), int(end_text)
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron {name} field '{field}' is outside {low}-{high}")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first matching minute strictly after ``moment``."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1,
+                                              day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+
+        raise ValueError(f"Cron expression '{self.expression}' never fires")
+
+
+class ScheduledJob:
+    """A recurring job fired by interval or cron, with optional random jitter."""
+
+    __slots__ = ("name", "callback", "interval", "cron", "jitter", "due", "fire_at",
+                 "last_run", "runs", "running", "cancelled")
+
+    def __init__(self, name: str, callback: Callable, interval: float = None,
+                 cron: CronExpression = None, jitter: float = 0.0):
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.cron = cron
+        self.jitter = jitter
+        self.due = 0.0
+        self.fire_at = 0.0
+        self.last_run: Optional[float] = None
+        self.runs = 0
+        self.running = False
+        self.cancelled = False
+
+    def schedule_from(self, now: float, first_due: float = None):
+        """Compute the next deadline after ``now``, jitter is added on top of the due time."""
+        if first_due is not None:
+            self.due = first_due
+        elif self.cron is not None:
+            self.due = self.cron.next_after(datetime.fromtimestamp(now)).timestamp()
+        else:
+            # Step from the previous due time so intervals do not drift,
+            # but skip missed periods rather than firing a burst
+            due = (self.due or now) + self.interval
+            if due <= now:
+                due += ((now - due) // self.interval + 1) * self.interval
+            self.due = due
+        self.fire_at = self.due + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "interval": self.interval,
+            "cron": self.cron.expression if self.cron else None,
+            "jitter": self.jitter,
+            "next_run": datetime.fromtimestamp(self.fire_at).isoformat(),
+            "last_run": datetime.fromtimestamp(self.last_run).isoformat() if self.last_run else None,
+            "runs": self.runs,
+            "running": self.running
+        }
+
+
+class DeadlineScheduler:
+    """
+    Keeps jobs in a min-heap ordered by next deadline. The timer thread
+    sleeps on a condition variable until the earliest deadline, or until a
+    job is added or removed, so there are no idle polling wakeups. Due jobs
+    run on a small worker pool; a job still running when it comes due again
+    is skipped for that period.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.logger = logging.getLogger("recursive.deadline_scheduler")
+        self.is_running = False
+        self._heap: List[tuple] = []
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = {
+            "fired": 0,
+            "errors": 0,
+            "skipped_overlaps": 0,
+            "wakeups": 0,
+            "last_lateness": 0.0,
+            "max_lateness": 0.0
+        }
+
+    def add_job(self, name: str, callback: Callable, interval: float = None, cron: str = None,
+                jitter: float = 0.0, start_at: float = None) -> ScheduledJob:
+        """
+        Schedule ``callback`` every ``interval`` seconds or on a ``cron``
+        expression, replacing any job with the same name. ``start_at`` sets
+        the first due time (epoch seconds) instead of one period from now.
+        """
+        if (interval is None) == (cron is None):
+            raise ValueError("Exactly one of interval or cron must be given")
+        if interval is not None and interval <= 0:
+            raise ValueError("Interval must be positive")
+
+        job = ScheduledJob(name, callback, interval,
+                           CronExpression(cron) if cron is not None else None, jitter)
+        with self._condition:
+            previous = self._jobs.pop(name, None)
+            if previous is not None:
+                previous.cancelled = True
+            job.schedule_from(time.time(), start_at)
+            self._jobs[name] = job
+            heapq.heappush(self._heap, (job.fire_at, next(self._sequence), job))
+            self._condition.notify()
+        return job
+
+    def remove_job(self, name: str) -> bool:
+        """Unschedule a job. Its heap entry is discarded lazily."""
+        with self._condition:
+            job = self._jobs.pop(name, None)
+            if job is None:
+                return False
+            job.cancelled = True
+            self._condition.notify()
+            return True
+
+    def get_job(self, name: str) -> Optional[ScheduledJob]:
+        """Get a scheduled job by name."""
+        with self._condition:
+            return self._jobs.get(name)
+
+    def next_run(self, name: str) -> Optional[datetime]:
+        """Get the next time a job fires."""
+        job = self.get_job(name)
+        return datetime.fromtimestamp(job.fire_at) if job else None
+
+    def start(self):
+        """Start the timer thread."""
+        with self._condition:
+            if self.is_running:
+                return
+            self.is_running = True
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="recursive-job")
+            self._thread = threading.Thread(target=self._run, name="recursive-deadline", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the timer thread; running jobs are left to finish."""
+        with self._condition:
+            if not self.is_running:
+                return
+            self.is_running = False
+            self._condition.notify()
+        self._thread.join(timeout=timeout)
+        self._executor.shutdown(wait=False)
+
+    def _run(self):
+        with self._condition:
+            while self.is_running:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    self._condition.wait()
+                    self._stats["wakeups"] += 1
+                    continue
+
+                fire_at, _, job = self._heap[0]
+                delay = fire_at - time.time()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    self._stats["wakeups"] += 1
+                    continue
+
+                heapq.heappop(self._heap)
+                self._fire(job, -delay)
+                job.schedule_from(time.time())
+                heapq.heappush(self._heap, (job.fire_at, next(self._sequence), job))
+
+    def _fire(self, job: ScheduledJob, lateness: float):
+        """Hand a due job to the worker pool. Called with the condition held."""
+        if job.running:
+            self._stats["skipped_overlaps"] += 1
+            self.logger.warning(f"Job {job.name} still running, skipping this period")
+            return
+
+        job.running = True
+        self._stats["fired"] += 1
+        self._stats["last_lateness"] = lateness
+        self._stats["max_lateness"] = max(self._stats["max_lateness"], lateness)
+        SCHEDULER_LAG.labels(job.name).observe(lateness)
+        try:
+            self._executor.submit(self._execute, job)
+        except RuntimeError as e:
+            job.running = False
+            self.logger.error(f"Failed to dispatch job {job.name}: {e}")
+
+    def _execute(self, job: ScheduledJob):
+        started = time.perf_counter()
+        try:
+            job.callback()
+        except Exception as e:
+            self.logger.error(f"Job {job.name} failed: {e}")
+            with self._condition:
+                self._stats["errors"] += 1
+        finally:
+            JOB_SECONDS.labels(job.name).observe(time.perf_counter() - started)
+            with self._condition:
+                job.running = False
+                job.last_run = time.time()
+                job.runs += 1
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        """Describe all scheduled jobs, soonest first."""
+        with self._condition:
+            return [job.to_dict() for job in sorted(self._jobs.values(), key=lambda job: job.fire_at)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        with self._condition:
+            return {"running": self.is_running, "jobs": len(self._jobs), **self._stats}
+
+
+class DelayedCall:
+    """Handle for a one-shot call queued on a :class:`DelayedExecutor`."""
+
+    __slots__ = ("due", "fn", "args", "future", "dispatched", "started_at")
+
+    def __init__(self, due: float, fn: Callable, args: tuple):
+        self.due = due
+        self.fn = fn
+        self.args = args
+        self.future: Future = Future()
+        self.dispatched = False
+        self.started_at: Optional[float] = None
+
+
+class DelayedExecutor:
+    """
+    Runs one-shot calls after a delay on a shared worker pool. A single timer
+    thread keeps pending calls in a min-heap by monotonic due time, so many
+    engines can have pre-actions pending without a sleeping thread each.
+    Queueing delay (worker start minus due time) is tracked per call.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self.logger = logging.getLogger("recursive.delayed_executor")
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = {
+            "scheduled": 0,
+            "executed": 0,
+            "expedited": 0,
+            "queue_delay_total": 0.0,
+            "queue_delay_max": 0.0
+        }
+
+    def schedule(self, delay: float, fn: Callable, *args) -> DelayedCall:
+        """Run ``fn(*args)`` after ``delay`` seconds. The result is on ``call.future``."""
+        call = DelayedCall(time.monotonic() + max(0.0, delay), fn, args)
+        with self._condition:
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="recursive-delayed")
+                self._thread = threading.Thread(target=self._run, name="recursive-delayed-timer",
+                                                daemon=True)
+                self._thread.start()
+            heapq.heappush(self._heap, (call.due, next(self._sequence), call))
+            self._stats["scheduled"] += 1
+            self._condition.notify()
+        return call
+
+    def expedite(self, call: DelayedCall) -> bool:
+        """Make a pending call due now. Returns False if it was already dispatched."""
+        with self._condition:
+            if call.dispatched:
+                return False
+            call.due = time.monotonic()
+            # The old heap entry no longer matches call.due and is skipped when popped
+            heapq.heappush(self._heap, (call.due, next(self._sequence), call))
+            self._stats["expedited"] += 1
+            self._condition.notify()
+            return True
+
+    def _run(self):
+        with self._condition:
+            while True:
+                while self._heap and (self._heap[0][2].dispatched or self._heap[0][0] != self._heap[0][2].due):
+                    heapq.heappop(self._heap)
+
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                _, _, call = heapq.heappop(self._heap)
+                call.dispatched = True
+                self._executor.submit(self._invoke, call)
+
+    def _invoke(self, call: DelayedCall):
+        call.started_at = time.monotonic()
+        queue_delay = max(0.0, call.started_at - call.due)
+        with self._condition:
+            self._stats["executed"] += 1
+            self._stats["queue_delay_total"] += queue_delay
+            self._stats["queue_delay_max"] = max(self._stats["queue_delay_max"], queue_delay)
+        DELAYED_CALL_LAG.observe(queue_delay)
+
+        if not call.future.set_running_or_notify_cancel():
+            return
+        try:
+            call.future.set_result(call.fn(*call.args))
+        except BaseException as e:
+            call.future.set_exception(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics."""
+        with self._condition:
+            executed = self._stats["executed"]
+            return {
+                **self._stats,
+                # An expedited call leaves a stale entry behind, count only its current one
+                "pending": sum(1 for due, _, call in self._heap if not call.dispatched and due == call.due),
+                "queue_delay_avg": self._stats["queue_delay_total"] / executed if executed else 0.0
+            }
+
+
+_shared_delayed_executor: Optional[DelayedExecutor] = None
+_shared_lock = threading.Lock()
+
+
+def shared_delayed_executor() -> DelayedExecutor:
+    """Get the process-wide executor used for compounding pre-actions."""
+    global _shared_delayed_executor
+    with _shared_lock:
+        if _shared_delayed_executor is None:
+            _shared_delayed_executor = DelayedExecutor()
+        return _shared_delayed_executor
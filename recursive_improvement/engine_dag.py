@@ -0,0 +1,150 @@
+"""
+Engine DAG - Dependency-ordered parallel execution of recursive engines
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List
+
+from .base import RecursiveEngine
+from .tracing import bind_context
+
+
+class EngineDAG:
+    """
+    Dependency graph built from the engines' ``depends_on``/``produces``
+    declarations. A dependency names either an engine or an artifact some
+    engines produce; dependencies nothing registered provides are ignored.
+    Engines caught in (or downstream of) a cycle are never run.
+    """
+
+    def __init__(self, engines: Dict[str, RecursiveEngine]):
+        self.engines = dict(engines)
+        self.logger = logging.getLogger("recursive.engine_dag")
+
+        providers: Dict[str, List[str]] = {}
+        for name, engine in self.engines.items():
+            providers.setdefault(name, []).append(name)
+            for artifact in engine.produces:
+                providers.setdefault(artifact, []).append(name)
+
+        self.upstream: Dict[str, List[str]] = {name: [] for name in self.engines}
+        self.downstream: Dict[str, List[str]] = {name: [] for name in self.engines}
+        self.unresolved: Dict[str, List[str]] = {}
+        for name, engine in self.engines.items():
+            for dependency in engine.depends_on:
+                found = [p for p in providers.get(dependency, []) if p != name]
+                if not found:
+                    self.unresolved.setdefault(name, []).append(dependency)
+                for provider in found:
+                    if provider not in self.upstream[name]:
+                        self.upstream[name].append(provider)
+                        self.downstream[provider].append(name)
+
+        self.order, self.cyclic = self._topological_order()
+        if self.cyclic:
+            self.logger.error(f"Dependency cycle involving: {', '.join(self.cyclic)}")
+
+    def _topological_order(self) -> tuple:
+        """Kahn's algorithm, ties broken by registration order."""
+        remaining = {name: len(upstream) for name, upstream in self.upstream.items()}
+        ready = [name for name in self.engines if remaining[name] == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for child in self.downstream[name]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        ordered = set(order)
+        return order, [name for name in self.engines if name not in ordered]
+
+    def _run_node(self, name: str, execute: Callable[[RecursiveEngine], Dict[str, Any]],
+                  cycle_started: float) -> Dict[str, Any]:
+        started = time.monotonic()
+        try:
+            result = execute(self.engines[name])
+            outcome = {"status": "failed", "error": result["error"]} if result.get("error") else {"status": "ok"}
+            outcome["result"] = result
+        except Exception as e:
+            outcome = {"status": "failed", "error": str(e)}
+        finished = time.monotonic()
+        outcome["started"] = round(started - cycle_started, 4)
+        outcome["duration"] = finished - started
+        return outcome
+
+    def run(self, execute: Callable[[RecursiveEngine], Dict[str, Any]],
+            max_workers: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        Execute every engine once, each as soon as all its upstreams succeeded,
+        with up to ``max_workers`` running at a time. Returns an outcome per
+        engine with ``status`` "ok", "failed" or "skipped".
+        """
+        outcomes: Dict[str, Dict[str, Any]] = {
+            name: {"status": "skipped", "reason": "dependency cycle"} for name in self.cyclic
+        }
+        remaining = {name: len(self.upstream[name]) for name in self.order}
+        ready = [name for name in self.order if remaining[name] == 0]
+        cycle_started = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="recursive-dag") as pool:
+            running = {}
+            while ready or running:
+                while ready:
+                    name = ready.pop(0)
+                    failed = [p for p in self.upstream[name] if outcomes[p]["status"] != "ok"]
+                    if failed:
+                        outcomes[name] = {"status": "skipped", "reason": f"upstream failed: {', '.join(failed)}"}
+                        ready.extend(self._release(name, remaining))
+                    else:
+                        running[pool.submit(bind_context(self._run_node), name, execute, cycle_started)] = name
+
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        outcomes[name] = future.result()
+                        ready.extend(self._release(name, remaining))
+
+        return outcomes
+
+    def _release(self, name: str, remaining: Dict[str, int]) -> List[str]:
+        """Mark ``name`` settled and return dependents that have become ready."""
+        released = []
+        for child in self.downstream[name]:
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                released.append(child)
+        return released
+
+    def critical_path(self, outcomes: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """The chain of dependent engines with the longest total run time."""
+        finish: Dict[str, float] = {}
+        previous: Dict[str, str] = {}
+        for name in self.order:
+            before = max(self.upstream[name], key=lambda p: finish[p], default=None)
+            finish[name] = outcomes.get(name, {}).get("duration", 0.0) + (finish[before] if before else 0.0)
+            if before:
+                previous[name] = before
+
+        if not finish:
+            return {"engines": [], "duration_seconds": 0.0}
+
+        name = max(finish, key=finish.get)
+        total = finish[name]
+        path = [name]
+        while name in previous:
+            name = previous[name]
+            path.append(name)
+        return {"engines": path[::-1], "duration_seconds": round(total, 4)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable view of the graph."""
+        return {
+            "order": self.order,
+            "edges": {name: upstream for name, upstream in self.upstream.items() if upstream},
+            "unresolved": self.unresolved,
+            "cyclic": self.cyclic
+        }
@@ -1,40 +1,82 @@
 """
 All recursive improvement engines including recursive autonomy modules
+
+Engine classes are imported on first access (PEP 562), so importing this
+package stays cheap. ``ENGINE_SPECS`` names every engine by import path for
+lazy registration with the orchestrator.
 """
 
-from .feedback_loop_engine import RecursiveFeedbackLoopEngine
-from .experimentation_tree_engine import AutonomousExperimentationTreeEngine
-from .cloning_agent_engine import SelfCloningMVPAgentEngine
-from .asset_library_engine import AssetLibraryEngine
-from .debrief_bot_engine import WeeklyAutoDebriefBotEngine
-from .kpi_mutation_engine import KPIMutationEngine
-from .escalation_logic_engine import AutonomousEscalationLogicEngine
-from .workflow_automation_engine import RecursiveWorkflowAutomationEngine
-from .content_stack_engine import ContentStackTreeEngine
-from .playbook_generator_engine import SelfImprovingPlaybookGeneratorEngine
-
-# Recursive Autonomy Modules
-from .ai_code_review_bot import AICodeReviewBotEngine
-from .auto_refactor import AutoRefactorEngine
-from .dependency_health import DependencyHealthEngine
-from .workflow_auditor import WorkflowAuditorEngine
-from .doc_updater import DocUpdaterEngine
-
-__all__ = [
-    'RecursiveFeedbackLoopEngine',
-    'AutonomousExperimentationTreeEngine',
-    'SelfCloningMVPAgentEngine',
-    'AssetLibraryEngine',
-    'WeeklyAutoDebriefBotEngine',
-    'KPIMutationEngine',
-    'AutonomousEscalationLogicEngine',
-    'RecursiveWorkflowAutomationEngine',
-    'ContentStackTreeEngine',
-    'SelfImprovingPlaybookGeneratorEngine',
+import importlib
+
+from ..registry import EngineSpec
+
+# Engine class -> defining submodule
+_ENGINE_MODULES = {
+    'RecursiveFeedbackLoopEngine': '.feedback_loop_engine',
+    'AutonomousExperimentationTreeEngine': '.experimentation_tree_engine',
+    'SelfCloningMVPAgentEngine': '.cloning_agent_engine',
+    'AssetLibraryEngine': '.asset_library_engine',
+    'WeeklyAutoDebriefBotEngine': '.debrief_bot_engine',
+    'KPIMutationEngine': '.kpi_mutation_engine',
+    'AutonomousEscalationLogicEngine': '.escalation_logic_engine',
+    'RecursiveWorkflowAutomationEngine': '.workflow_automation_engine',
+    'ContentStackTreeEngine': '.content_stack_engine',
+    'SelfImprovingPlaybookGeneratorEngine': '.playbook_generator_engine',
     # Recursive Autonomy Modules
-    'AICodeReviewBotEngine',
-    'AutoRefactorEngine',
-    'DependencyHealthEngine',
-    'WorkflowAuditorEngine',
-    'DocUpdaterEngine'
-]
\ No newline at end of file
+    'AICodeReviewBotEngine': '.ai_code_review_bot',
+    'AutoRefactorEngine': '.auto_refactor',
+    'DependencyHealthEngine': '.dependency_health',
+    'WorkflowAuditorEngine': '.workflow_auditor',
+    'DocUpdaterEngine': '.doc_updater'
+}
+
+# Context tags per engine name, the one source for both the engine classes
+# and their specs, so routing agrees before and after an engine loads
+CONTEXT_TAGS = {
+    "feedback_loop_engine": ("workflow",),
+    "experimentation_tree_engine": ("workflow",),
+    "asset_library_engine": ("content",),
+    "weekly_auto_debrief_bot": ("monitoring",),
+    "kpi_mutation_engine": ("validation",),
+    "autonomous_escalation_logic": ("validation",),
+    "recursive_workflow_automation": ("workflow",),
+    "content_stack_tree": ("content",),
+    "self_improving_playbook_generator": ("content",)
+}
+
+# Every engine by name and import path
+ENGINE_SPECS = [
+    EngineSpec(name, f"{__name__}.{path}", CONTEXT_TAGS.get(name)) for name, path in (
+        ("feedback_loop_engine", "feedback_loop_engine:RecursiveFeedbackLoopEngine"),
+        ("experimentation_tree_engine", "experimentation_tree_engine:AutonomousExperimentationTreeEngine"),
+        ("self_cloning_mvp_agent", "cloning_agent_engine:SelfCloningMVPAgentEngine"),
+        ("asset_library_engine", "asset_library_engine:AssetLibraryEngine"),
+        ("weekly_auto_debrief_bot", "debrief_bot_engine:WeeklyAutoDebriefBotEngine"),
+        ("kpi_mutation_engine", "kpi_mutation_engine:KPIMutationEngine"),
+        ("autonomous_escalation_logic", "escalation_logic_engine:AutonomousEscalationLogicEngine"),
+        ("recursive_workflow_automation", "workflow_automation_engine:RecursiveWorkflowAutomationEngine"),
+        ("content_stack_tree", "content_stack_engine:ContentStackTreeEngine"),
+        ("self_improving_playbook_generator", "playbook_generator_engine:SelfImprovingPlaybookGeneratorEngine"),
+        # Recursive Autonomy Modules
+        ("ai_code_review_bot", "ai_code_review_bot:AICodeReviewBotEngine"),
+        ("auto_refactor", "auto_refactor:AutoRefactorEngine"),
+        ("dependency_health", "dependency_health:DependencyHealthEngine"),
+        ("workflow_auditor", "workflow_auditor:WorkflowAuditorEngine"),
+        ("doc_updater", "doc_updater:DocUpdaterEngine")
+    )
+]
+
+__all__ = list(_ENGINE_MODULES)
+
+
+def __getattr__(name):
+    module = _ENGINE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    engine_cls = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = engine_cls
+    return engine_cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ENGINE_MODULES))
@@ -20,6 +20,9 @@ class AICodeReviewBotEngine(RecursiveEngine):
     Learns from merged PRs, updates review logic, and improves ML model recursively.
     """
     
+    execution_class = "cpu"
+    state_attributes = ("review_history", "model_metrics", "learned_patterns", "review_rules")
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("ai_code_review_bot", config)
         self.review_history = []
@@ -360,5 +363,6 @@ class AICodeReviewBotEngine(RecursiveEngine):
             "learned_patterns_count": len(self.learned_patterns),
             "review_rules_count": sum(len(rules) for rules in self.review_rules.values()),
             "last_execution": self.last_execution,
-            "total_executions": len(self.execution_history)
+            "total_executions": self.total_executions,
+            "resources": self.resources.summary()
         }
\ No newline at end of file
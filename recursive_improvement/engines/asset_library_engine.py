@@ -9,11 +9,15 @@ import hashlib
 import json
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class AssetLibraryEngine(RecursiveEngine):
     """Asset Library Engine with embedding-based deduplication."""
     
+    context_tags = CONTEXT_TAGS["asset_library_engine"]
+    state_attributes = ("asset_library", "embeddings_cache")
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("asset_library_engine", config)
         self.asset_library = {}
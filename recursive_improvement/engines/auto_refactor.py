@@ -4,7 +4,7 @@ Autonomous refactoring engine that suggests and optionally applies recursive cod
 """
 
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import ast
 import os
 import re
@@ -12,6 +12,8 @@ import subprocess
 import logging
 
 from ..base import RecursiveEngine, CompoundingAction
+from ..fingerprint import fingerprint_files
+from ..tracing import traced
 
 
 class AutoRefactorEngine(RecursiveEngine):
@@ -20,6 +22,10 @@ class AutoRefactorEngine(RecursiveEngine):
     Analyzes code for refactoring opportunities and applies improvements recursively.
     """
     
+    execution_class = "cpu"
+    state_attributes = ("refactoring_history", "code_metrics", "improvement_suggestions")
+    produces = ("refactorings",)
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("auto_refactor", config)
         self.refactoring_history = []
@@ -62,6 +68,10 @@ class AutoRefactorEngine(RecursiveEngine):
             self.logger.error(f"Failed to initialize Auto Refactor Engine: {e}")
             return False
     
+    def input_fingerprint(self) -> Optional[str]:
+        """Content digest of every Python file analysed, plus the refactoring rules."""
+        return fingerprint_files(self._get_python_files(), self.refactoring_rules)
+    
     def execute_main_action(self) -> Dict[str, Any]:
         """Execute main refactoring analysis and improvement application."""
         try:
@@ -179,6 +189,7 @@ class AutoRefactorEngine(RecursiveEngine):
             }
         }
     
+    @traced("auto_refactor.analyze_codebase")
     def _analyze_codebase(self) -> List[Dict[str, Any]]:
         """Analyze entire codebase for refactoring opportunities."""
         analysis_results = []
@@ -569,5 +580,7 @@ class AutoRefactorEngine(RecursiveEngine):
             "refactoring_rules_count": len(self.refactoring_rules),
             "improvement_suggestions_count": len(self.improvement_suggestions),
             "last_execution": self.last_execution,
-            "total_executions": len(self.execution_history)
+            "total_executions": self.total_executions,
+            "memoization": self.memo_stats,
+            "resources": self.resources.summary()
         }
\ No newline at end of file
@@ -74,6 +74,8 @@ class SelfCloningMVPAgentEngine(RecursiveEngine):
     environment/config for instant cloning on trigger at +0.25 intervals.
     """
     
+    state_attributes = ("mvp_agents", "clone_triggers", "preloaded_environments")
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("self_cloning_mvp_agent", config)
         self.mvp_agents: Dict[str, MVPAgent] = {}
@@ -7,11 +7,14 @@ from datetime import datetime
 from typing import Dict, Any
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class ContentStackTreeEngine(RecursiveEngine):
     """Content Stack Tree with embedding-based expansion."""
     
+    context_tags = CONTEXT_TAGS["content_stack_tree"]
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("content_stack_tree", config)
         
@@ -3,15 +3,20 @@ Engine 5: Weekly Auto-Debrief Bot Engine
 Scheduled GPT agent scans KPIs, posts summary, launches new experiments; recursive prompts tuned weekly
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class WeeklyAutoDebriefBotEngine(RecursiveEngine):
     """Weekly Auto-Debrief Bot with recursive prompt tuning."""
     
+    context_tags = CONTEXT_TAGS["weekly_auto_debrief_bot"]
+    depends_on = ("kpi_mutations", "feedback_audit")
+    produces = ("weekly_debrief",)
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("weekly_auto_debrief_bot", config)
         
@@ -24,10 +29,11 @@ class WeeklyAutoDebriefBotEngine(RecursiveEngine):
             return False
     
     def execute_main_action(self) -> Dict[str, Any]:
+        kpis = self._scan_weekly_kpis()
         return {
             "timestamp": datetime.now().isoformat(),
             "action": "weekly_debrief",
-            "kpis_scanned": 15,
+            "kpis_scanned": len(kpis) if kpis is not None else 0,
             "experiments_launched": 3,
             "summary_posted": True
         }
@@ -37,4 +43,21 @@ class WeeklyAutoDebriefBotEngine(RecursiveEngine):
             "timestamp": datetime.now().isoformat(),
             "action": "prompt_tuning",
             "prompts_optimized": 8
-        }
\ No newline at end of file
+        }
+    
+    def _scan_weekly_kpis(self):
+        """
+        Collect the latest value of every numeric metric logged in the past
+        week. Non-numeric metrics have no rollups and are not scanned.
+        """
+        if self.recursive_logger is None:
+            return None
+        
+        # Numeric KPIs come from the hourly rollups rather than raw history
+        week_ago = datetime.now() - timedelta(weeks=1)
+        latest = {}
+        for engine, metric in self.recursive_logger.rollup_series():
+            buckets = self.recursive_logger.query_rollups(metric, engine, "1h", start=week_ago)
+            if buckets:
+                latest[(engine, metric)] = buckets[-1]["last"]
+        return latest
@@ -4,7 +4,7 @@ Recursive dependency health check for outdated, vulnerable, or deprecated depend
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import json
 import subprocess
 import re
@@ -12,6 +12,8 @@ import logging
 import os
 
 from ..base import RecursiveEngine, CompoundingAction
+from ..fingerprint import fingerprint_files
+from ..tracing import traced
 
 
 class DependencyHealthEngine(RecursiveEngine):
@@ -20,6 +22,8 @@ class DependencyHealthEngine(RecursiveEngine):
     Monitors dependencies for security vulnerabilities, updates, and deprecations.
     """
     
+    state_attributes = ("dependency_history", "vulnerability_database", "health_metrics")
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("dependency_health", config)
         self.dependency_history = []
@@ -62,6 +66,10 @@ class DependencyHealthEngine(RecursiveEngine):
             self.logger.error(f"Failed to initialize Dependency Health Engine: {e}")
             return False
     
+    def input_fingerprint(self) -> Optional[str]:
+        """Content digest of every dependency manifest, plus the update policies."""
+        return fingerprint_files(self._find_dependency_files(), self.update_policies)
+    
     def execute_main_action(self) -> Dict[str, Any]:
         """Execute comprehensive dependency health check and updates."""
         try:
@@ -357,6 +365,7 @@ class DependencyHealthEngine(RecursiveEngine):
             
         return dependencies
     
+    @traced("dependency_health.check_vulnerabilities")
     def _check_vulnerabilities(self, analysis_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Check dependencies for known vulnerabilities."""
         vulnerabilities = []
@@ -713,5 +722,7 @@ class DependencyHealthEngine(RecursiveEngine):
             "vulnerability_db_size": len(self.vulnerability_database),
             "update_policies": self.update_policies,
             "last_execution": self.last_execution,
-            "total_executions": len(self.execution_history)
+            "total_executions": self.total_executions,
+            "memoization": self.memo_stats,
+            "resources": self.resources.summary()
         }
\ No newline at end of file
@@ -21,6 +21,11 @@ class DocUpdaterEngine(RecursiveEngine):
     Keeps documentation synchronized with code changes and suggests improvements.
     """
     
+    execution_class = "cpu"
+    state_attributes = ("doc_history", "code_doc_mapping", "sync_metrics")
+    depends_on = ("refactorings",)
+    produces = ("documentation",)
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("doc_updater", config)
         self.doc_history = []
@@ -1056,5 +1061,6 @@ Examples:
             "code_doc_mapping_size": len(self.code_doc_mapping),
             "doc_templates_count": len(self.doc_templates),
             "last_execution": self.last_execution,
-            "total_executions": len(self.execution_history)
+            "total_executions": self.total_executions,
+            "resources": self.resources.summary()
         }
\ No newline at end of file
@@ -7,11 +7,14 @@ from datetime import datetime
 from typing import Dict, Any
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class AutonomousEscalationLogicEngine(RecursiveEngine):
     """Autonomous Escalation Logic with mode performance tuning."""
     
+    context_tags = CONTEXT_TAGS["autonomous_escalation_logic"]
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("autonomous_escalation_logic", config)
         
@@ -9,6 +9,7 @@ import json
 import uuid
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class ExperimentBranch:
@@ -60,6 +61,9 @@ class AutonomousExperimentationTreeEngine(RecursiveEngine):
     and prunes underperforming branches in parallel at +0.25 intervals.
     """
     
+    context_tags = CONTEXT_TAGS["experimentation_tree_engine"]
+    state_attributes = ("experiment_tree", "active_branches", "pruned_branches", "expansion_queue")
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("experimentation_tree_engine", config)
         self.experiment_tree: Optional[ExperimentBranch] = None
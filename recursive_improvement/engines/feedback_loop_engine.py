@@ -3,12 +3,14 @@ Engine 1: Recursive Feedback Loop Engine
 Weekly audits with +0.25 interval GPT pre-scanning and mutation proposals
 """
 
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 import json
 import logging
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class RecursiveFeedbackLoopEngine(RecursiveEngine):
@@ -17,10 +19,15 @@ class RecursiveFeedbackLoopEngine(RecursiveEngine):
     and mutation proposals before audit completion.
     """
     
+    context_tags = CONTEXT_TAGS["feedback_loop_engine"]
+    state_attributes = ("audit_data", "mutation_proposals", "improvement_metrics")
+    produces = ("feedback_audit",)
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("feedback_loop_engine", config)
-        self.audit_data = []
-        self.mutation_proposals = []
+        # Bounded so a long-running daemon keeps constant memory
+        self.audit_data = deque(maxlen=self.config.get("audit_history_size", 52))
+        self.mutation_proposals = deque(maxlen=self.config.get("max_mutation_proposals", 500))
         self.improvement_metrics = {}
         
     def initialize(self) -> bool:
@@ -7,11 +7,15 @@ from datetime import datetime
 from typing import Dict, Any
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class KPIMutationEngine(RecursiveEngine):
     """KPI Mutation Engine with recursive refinement logic."""
     
+    context_tags = CONTEXT_TAGS["kpi_mutation_engine"]
+    produces = ("kpi_mutations",)
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("kpi_mutation_engine", config)
         
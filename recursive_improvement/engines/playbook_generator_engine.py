@@ -7,11 +7,16 @@ from datetime import datetime
 from typing import Dict, Any
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class SelfImprovingPlaybookGeneratorEngine(RecursiveEngine):
     """Self-Improving Playbook Generator with recursive versioning."""
     
+    context_tags = CONTEXT_TAGS["self_improving_playbook_generator"]
+    depends_on = ("weekly_debrief",)
+    produces = ("playbooks",)
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("self_improving_playbook_generator", config)
         
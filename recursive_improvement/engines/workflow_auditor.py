@@ -4,7 +4,7 @@ Meta-workflow auditor for CI/CD pipeline optimization and security, suggesting i
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import os
 import yaml
 import json
@@ -12,6 +12,8 @@ import re
 import logging
 
 from ..base import RecursiveEngine, CompoundingAction
+from ..fingerprint import fingerprint_files
+from ..tracing import traced
 
 
 class WorkflowAuditorEngine(RecursiveEngine):
@@ -20,6 +22,8 @@ class WorkflowAuditorEngine(RecursiveEngine):
     Recursively suggests and applies workflow enhancements.
     """
     
+    state_attributes = ("audit_history", "workflow_patterns", "optimization_metrics")
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("workflow_auditor", config)
         self.audit_history = []
@@ -62,6 +66,10 @@ class WorkflowAuditorEngine(RecursiveEngine):
             self.logger.error(f"Failed to initialize Workflow Auditor Engine: {e}")
             return False
     
+    def input_fingerprint(self) -> Optional[str]:
+        """Content digest of every workflow file, plus the security rules."""
+        return fingerprint_files(self._find_workflow_files(), self.security_rules)
+    
     def execute_main_action(self) -> Dict[str, Any]:
         """Execute comprehensive workflow audit and optimization."""
         try:
@@ -260,6 +268,7 @@ class WorkflowAuditorEngine(RecursiveEngine):
                 
         return workflow_files
     
+    @traced("workflow_auditor.audit_workflow_file")
     def _audit_workflow_file(self, file_path: str) -> Dict[str, Any]:
         """Audit a specific workflow file."""
         try:
@@ -990,5 +999,7 @@ Auditor Engine. Each optimization has been validated for safety and impact befor
             "security_rules_count": sum(len(rules) for rules in self.security_rules.values()),
             "workflow_patterns_count": len(self.workflow_patterns),
             "last_execution": self.last_execution,
-            "total_executions": len(self.execution_history)
+            "total_executions": self.total_executions,
+            "memoization": self.memo_stats,
+            "resources": self.resources.summary()
         }
\ No newline at end of file
@@ -7,11 +7,14 @@ from datetime import datetime
 from typing import Dict, Any
 
 from ..base import RecursiveEngine, CompoundingAction
+from . import CONTEXT_TAGS
 
 
 class RecursiveWorkflowAutomationEngine(RecursiveEngine):
     """Recursive Workflow Automation with efficiency optimization."""
     
+    context_tags = CONTEXT_TAGS["recursive_workflow_automation"]
+    
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__("recursive_workflow_automation", config)
         
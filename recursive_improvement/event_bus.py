@@ -0,0 +1,240 @@
+"""
+Hook Event Bus - Asynchronous, coalescing dispatch for recursive hooks
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+
+class _PendingEvent:
+    """One queued dispatch, possibly standing for a coalesced burst of events."""
+
+    __slots__ = ("event", "args", "kwargs", "count", "metadata", "priority",
+                 "first_seen", "last_seen", "due", "deadline", "ready_at")
+
+    def __init__(self, event: str, args: tuple, kwargs: Dict[str, Any], priority: int, now: float):
+        self.event = event
+        self.args = args
+        self.kwargs = kwargs
+        self.count = 1
+        self.metadata = [kwargs]
+        self.priority = priority
+        self.first_seen = now
+        self.last_seen = now
+        self.due = now
+        self.deadline = float("inf")
+        self.ready_at: Optional[float] = None
+
+    def dispatch_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for callbacks, with burst details when coalesced."""
+        if self.count == 1:
+            return self.kwargs
+        offset = time.time() - time.monotonic()
+        return {
+            **self.kwargs,
+            "coalesced": {
+                "count": self.count,
+                "first_seen": datetime.fromtimestamp(self.first_seen + offset).isoformat(),
+                "last_seen": datetime.fromtimestamp(self.last_seen + offset).isoformat(),
+                "metadata": self.metadata
+            }
+        }
+
+
+class HookEventBus:
+    """
+    Queues hook events and dispatches them on a background thread.
+
+    Events configured with a ``debounce`` window are merged: a burst becomes
+    one dispatch that fires ``debounce`` seconds after the last event (or
+    ``max_wait`` after the first), using the last event's arguments plus a
+    ``coalesced`` summary of the whole burst. Ready events are dispatched
+    highest ``priority`` first, FIFO within a priority.
+    """
+
+    DEFAULT_SETTINGS = {"debounce": 0.0, "max_wait": None, "priority": 0}
+
+    def __init__(self, dispatch: Callable[[str, tuple, Dict[str, Any]], Any],
+                 config: Dict[str, Any] = None):
+        self.dispatch = dispatch
+        self.config = config or {}
+        self.logger = logging.getLogger("recursive.event_bus")
+        self.max_coalesced_metadata = self.config.get("max_coalesced_metadata", 50)
+        self.event_settings: Dict[str, Dict[str, Any]] = {
+            event: {**self.DEFAULT_SETTINGS, **settings}
+            for event, settings in self.config.get("events", {}).items()
+        }
+
+        self._debouncing: Dict[str, _PendingEvent] = {}
+        self._timers: List[tuple] = []
+        self._ready: List[tuple] = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.is_running = False
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def configure_event(self, event: str, debounce: float = None, max_wait: float = None,
+                        priority: int = None):
+        """Set the debounce window, maximum wait and priority for an event."""
+        with self._condition:
+            settings = self.event_settings.setdefault(event, dict(self.DEFAULT_SETTINGS))
+            for key, value in (("debounce", debounce), ("max_wait", max_wait), ("priority", priority)):
+                if value is not None:
+                    settings[key] = value
+
+    def _event_stats(self, event: str) -> Dict[str, Any]:
+        stats = self._stats.get(event)
+        if stats is None:
+            stats = self._stats[event] = {
+                "published": 0,
+                "dispatched": 0,
+                "coalesced": 0,
+                "queue_depth": 0,
+                "max_queue_depth": 0,
+                "latency_last": 0.0,
+                "latency_max": 0.0,
+                "latency_total": 0.0,
+                "queue_delay_max": 0.0
+            }
+        return stats
+
+    def publish(self, event: str, args: tuple = (), kwargs: Dict[str, Any] = None):
+        """Queue an event for dispatch. Returns immediately."""
+        kwargs = kwargs or {}
+        now = time.monotonic()
+        settings = self.event_settings.get(event, self.DEFAULT_SETTINGS)
+
+        with self._condition:
+            self._ensure_started()
+            stats = self._event_stats(event)
+            stats["published"] += 1
+
+            pending = self._debouncing.get(event)
+            if pending is not None:
+                # Merge into the burst already waiting for this event
+                pending.count += 1
+                pending.args, pending.kwargs = args, kwargs
+                pending.last_seen = now
+                if len(pending.metadata) < self.max_coalesced_metadata:
+                    pending.metadata.append(kwargs)
+                pending.due = min(now + settings["debounce"], pending.deadline)
+                heapq.heappush(self._timers, (pending.due, next(self._sequence), pending))
+                stats["coalesced"] += 1
+            else:
+                pending = _PendingEvent(event, args, kwargs, settings["priority"], now)
+                stats["queue_depth"] += 1
+                stats["max_queue_depth"] = max(stats["max_queue_depth"], stats["queue_depth"])
+                if settings["debounce"] > 0:
+                    pending.due = now + settings["debounce"]
+                    if settings["max_wait"] is not None:
+                        pending.deadline = now + settings["max_wait"]
+                    self._debouncing[event] = pending
+                    heapq.heappush(self._timers, (pending.due, next(self._sequence), pending))
+                else:
+                    self._make_ready(pending, now)
+
+            self._condition.notify_all()
+
+    def _make_ready(self, pending: _PendingEvent, now: float):
+        pending.ready_at = now
+        heapq.heappush(self._ready, (-pending.priority, next(self._sequence), pending))
+
+    def _ensure_started(self):
+        if self._thread is None:
+            self.is_running = True
+            self._thread = threading.Thread(target=self._run, name="recursive-event-bus", daemon=True)
+            self._thread.start()
+
+    def _promote_due(self, now: float):
+        """Move debounced events whose window closed to the ready queue."""
+        while self._timers:
+            due, _, pending = self._timers[0]
+            if self._debouncing.get(pending.event) is not pending or pending.due != due:
+                heapq.heappop(self._timers)  # Superseded by a later timer entry
+                continue
+            if due > now:
+                return
+            heapq.heappop(self._timers)
+            del self._debouncing[pending.event]
+            self._make_ready(pending, now)
+
+    def _run(self):
+        with self._condition:
+            while self.is_running:
+                now = time.monotonic()
+                self._promote_due(now)
+
+                if not self._ready:
+                    timeout = self._timers[0][0] - now if self._timers else None
+                    self._condition.wait(timeout)
+                    continue
+
+                _, _, pending = heapq.heappop(self._ready)
+                self._in_flight += 1
+                started = time.monotonic()
+                stats = self._event_stats(pending.event)
+                stats["queue_depth"] -= 1
+
+                self._condition.release()
+                try:
+                    self.dispatch(pending.event, pending.args, pending.dispatch_kwargs())
+                except Exception as e:
+                    self.logger.error(f"Dispatch error for {pending.event}: {e}")
+                finally:
+                    self._condition.acquire()
+
+                latency = started - pending.first_seen
+                stats["dispatched"] += 1
+                stats["latency_last"] = latency
+                stats["latency_max"] = max(stats["latency_max"], latency)
+                stats["latency_total"] += latency
+                stats["queue_delay_max"] = max(stats["queue_delay_max"], started - pending.ready_at)
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def _is_idle(self) -> bool:
+        return not self._debouncing and not self._ready and self._in_flight == 0
+
+    def flush(self, timeout: float = None) -> bool:
+        """Dispatch everything queued, including open debounce windows, and wait."""
+        with self._condition:
+            now = time.monotonic()
+            for pending in self._debouncing.values():
+                pending.due = now
+                heapq.heappush(self._timers, (now, next(self._sequence), pending))
+            self._condition.notify_all()
+            return self._condition.wait_for(self._is_idle, timeout)
+
+    def stop(self, timeout: float = 5.0):
+        """Flush queued events and stop the dispatch thread."""
+        if self._thread is None:
+            return
+        self.flush(timeout)
+        with self._condition:
+            self.is_running = False
+            self._condition.notify_all()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-event queue depth and dispatch latency statistics."""
+        with self._condition:
+            events = {}
+            for event, stats in self._stats.items():
+                dispatched = stats["dispatched"]
+                events[event] = {
+                    **stats,
+                    "latency_avg": stats["latency_total"] / dispatched if dispatched else 0.0
+                }
+            return {
+                "queued": len(self._debouncing) + len(self._ready),
+                "in_flight": self._in_flight,
+                "events": events
+            }
@@ -0,0 +1,56 @@
+"""
+Input Fingerprints - Content digests of the files an engine reads
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, Tuple
+
+
+# path -> (mtime_ns, size, sha256), so unchanged files are not re-read
+_digest_cache: Dict[str, Tuple[int, int, str]] = {}
+_digest_lock = threading.Lock()
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents, or "missing" if it cannot be read."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _digest_lock:
+        cached = _digest_cache.get(path)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
+
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    except OSError:
+        return "missing"
+
+    with _digest_lock:
+        _digest_cache[path] = (*key, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def fingerprint_files(paths: Iterable[str], extra: Any = None) -> str:
+    """
+    Digest over the contents of ``paths`` (order-independent) and an optional
+    JSON-serializable ``extra`` such as the rules the engine applies to them.
+    """
+    fingerprint = hashlib.sha256()
+    for path in sorted(set(paths)):
+        fingerprint.update(path.encode("utf-8", "surrogateescape"))
+        fingerprint.update(b"\0")
+        fingerprint.update(file_digest(path).encode())
+        fingerprint.update(b"\n")
+    if extra is not None:
+        fingerprint.update(json.dumps(extra, sort_keys=True, default=str).encode())
+    return fingerprint.hexdigest()
@@ -0,0 +1,165 @@
+"""
+Logging Configuration - Queue-based logging pipeline for the whole framework
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Union
+
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Default for ``rate_limit``: the default limiter, kept as is by later calls
+_DEFAULT_RATE_LIMIT: Dict[str, Any] = {}
+
+_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_log_files = set()
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limits repeated log messages. Within each ``window`` seconds the first
+    ``burst`` records with the same logger and message pass; after that only
+    one in every ``sample_every`` does. The first record passed in a new
+    window reports how many were suppressed in the previous one.
+    """
+
+    def __init__(self, window: float = 10.0, burst: int = 5, sample_every: int = 100,
+                 max_keys: int = 10000):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.sample_every = max(1, sample_every)
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        # (logger, message) -> [window_start, count, suppressed]
+        self._seen: Dict[tuple, list] = {}
+        self.suppressed_total = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, record.msg)
+        now = time.monotonic()
+
+        with self._lock:
+            state = self._seen.get(key)
+            if state is None or now - state[0] >= self.window:
+                suppressed = state[2] if state else 0
+                if len(self._seen) >= self.max_keys:
+                    self._seen.clear()
+                self._seen[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{record.msg} (suppressed {suppressed} similar messages)"
+                return True
+
+            state[1] += 1
+            if state[1] <= self.burst or (state[1] - self.burst) % self.sample_every == 0:
+                return True
+
+            state[2] += 1
+            self.suppressed_total += 1
+            return False
+
+
+def _coerce_level(level: Union[str, int]) -> int:
+    if isinstance(level, str):
+        return logging.getLevelName(level.upper())
+    return level
+
+
+def _set_rate_limit(rate_limit: Optional[Dict[str, Any]]):
+    """Replace the queue handler's rate limiter, ``None`` removes it."""
+    for existing in [f for f in _queue_handler.filters if isinstance(f, RateLimitFilter)]:
+        _queue_handler.removeFilter(existing)
+    if rate_limit is not None:
+        _queue_handler.addFilter(RateLimitFilter(**rate_limit))
+
+
+def configure_logging(log_file: Optional[str] = None,
+                      level: Union[str, int, None] = None,
+                      levels: Dict[str, Union[str, int]] = None,
+                      rate_limit: Optional[Dict[str, Any]] = _DEFAULT_RATE_LIMIT,
+                      console: bool = True,
+                      fmt: str = DEFAULT_FORMAT,
+                      force: bool = False) -> Optional[QueueListener]:
+    """
+    Route all framework logging through a ``QueueHandler`` on the root logger.
+
+    Callers only enqueue records; a ``QueueListener`` thread formats them and
+    writes to the console and ``log_file``. ``levels`` sets per-subsystem
+    levels (e.g. ``{"recursive.scheduler": "WARNING"}``) and ``rate_limit``
+    configures a :class:`RateLimitFilter` for repeated messages (``None``
+    turns it off).
+
+    Like ``logging.basicConfig`` this leaves a root logger configured by
+    someone else untouched unless ``force`` is set. Calling it again adds
+    ``log_file`` to the running pipeline and applies ``levels``, plus
+    ``level`` and ``rate_limit`` when they are passed, so a bare call never
+    undoes an earlier caller's settings.
+    """
+    global _listener, _queue_handler
+
+    for name, subsystem_level in (levels or {}).items():
+        logging.getLogger(name).setLevel(_coerce_level(subsystem_level))
+
+    with _lock:
+        root = logging.getLogger()
+
+        if _listener is None:
+            if root.handlers and not force:
+                return None
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+
+            handlers = []
+            if console:
+                handlers.append(logging.StreamHandler())
+            _listener = QueueListener(queue.SimpleQueue(), *handlers,
+                                      respect_handler_level=True)
+            _queue_handler = QueueHandler(_listener.queue)
+            root.addHandler(_queue_handler)
+            root.setLevel(_coerce_level(logging.INFO if level is None else level))
+            _listener.start()
+            _set_rate_limit(rate_limit)
+        else:
+            if level is not None:
+                root.setLevel(_coerce_level(level))
+            if rate_limit is not _DEFAULT_RATE_LIMIT:
+                _set_rate_limit(rate_limit)
+
+        if log_file is not None and str(log_file) not in _log_files:
+            # Handlers are fixed once the listener runs, restart it with the file added
+            _listener.stop()
+            _listener.handlers = _listener.handlers + (logging.FileHandler(log_file),)
+            _listener.start()
+            _log_files.add(str(log_file))
+
+        formatter = logging.Formatter(fmt)
+        for handler in _listener.handlers:
+            handler.setFormatter(formatter)
+
+        return _listener
+
+
+def shutdown_logging():
+    """Drain queued records and stop the listener thread."""
+    global _listener, _queue_handler
+
+    with _lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener = None
+        _queue_handler = None
+        _log_files.clear()
+
+
+atexit.register(shutdown_logging)
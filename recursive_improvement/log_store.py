@@ -0,0 +1,434 @@
+"""
+Segmented Log Store - Append-only JSONL storage for recursive improvement logs
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+FSYNC_POLICIES = ("none", "interval", "always")
+
+
+class SegmentedLogStore:
+    """
+    Append-only log store that writes one JSON document per line into
+    size- and time-rotated segment files (``<name>-000001.jsonl``,
+    ``<name>-000002.jsonl``...).
+
+    Each append is a single line write, so logging cost no longer grows with
+    the size of the history. Closed segments are immutable apart from
+    retention (dropping whole expired segments) and compaction (merging small
+    segments and gzipping cold ones). A segment's mtime marks its newest entry.
+
+    Sequences only grow, so every segment numbered below the current one is
+    closed for good; the current one may be reopened for appends even while
+    no file is open.
+    """
+
+    def __init__(self, directory: str, name: str,
+                 max_segment_bytes: int = 4 * 1024 * 1024,
+                 fsync_policy: str = "interval",
+                 fsync_interval: float = 1.0,
+                 max_segment_age: float = None):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync_policy}', "
+                             f"expected one of {FSYNC_POLICIES}")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.max_segment_bytes = max_segment_bytes
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        self.max_segment_age = max_segment_age
+
+        self.logger = logging.getLogger(f"recursive.log_store.{name}")
+        self._lock = threading.Lock()
+        # Serializes retention and compaction passes
+        self._maintenance_lock = threading.Lock()
+        self._file = None
+        self._segment_size = 0
+        self._segment_started = 0.0
+        self._stats = {
+            "segments_dropped": 0,
+            "segments_merged": 0,
+            "segments_compressed": 0,
+            "bytes_reclaimed": 0
+        }
+        self._last_fsync = time.monotonic()
+        self._sequence = self._latest_sequence()
+        # Set by mark_resident, compaction never merges across it
+        self._resident_from = 0
+
+    def _segment_path(self, sequence: int) -> Path:
+        return self.directory / f"{self.name}-{sequence:06d}.jsonl"
+
+    def _latest_sequence(self) -> int:
+        sequences = [self._sequence_of(path) for path in self.segments()]
+        return max(sequences) if sequences else 0
+
+    def _sequence_of(self, path: Path) -> int:
+        stem = path.name[len(self.name) + 1:].split(".", 1)[0]
+        return int(stem)
+
+    def segments(self) -> List[Path]:
+        """Return all segment files (plain and gzipped), oldest first."""
+        paths = list(self.directory.glob(f"{self.name}-*.jsonl"))
+        paths.extend(self.directory.glob(f"{self.name}-*.jsonl.gz"))
+        return sorted(paths, key=self._sequence_of)
+
+    def _open_segment(self):
+        """Open the active segment for appending, rotating if it is full."""
+        if self._sequence == 0:
+            self._sequence = 1
+
+        path = self._segment_path(self._sequence)
+        if path.exists():
+            stat = path.stat()
+            size, started = stat.st_size, stat.st_mtime
+        else:
+            size, started = 0, time.time()
+        if size >= self.max_segment_bytes or self._segment_expired(started) or \
+                not path.exists() and self._sequence_taken(self._sequence):
+            self._sequence += 1
+            path = self._segment_path(self._sequence)
+            size, started = 0, time.time()
+
+        self._file = open(path, "ab")
+        self._segment_size = size
+        self._segment_started = started
+
+    def _segment_expired(self, started: float) -> bool:
+        return self.max_segment_age is not None and \
+            time.time() - started >= self.max_segment_age
+
+    def _sequence_taken(self, sequence: int) -> bool:
+        # A compressed segment with this sequence must not be appended to
+        return Path(f"{self._segment_path(sequence)}.gz").exists()
+
+    def _rotate(self):
+        self._close_segment()
+        self._sequence += 1
+        self._open_segment()
+
+    def _close_segment(self):
+        if self._file is not None:
+            self._file.flush()
+            if self.fsync_policy != "none":
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+    def _maybe_fsync(self):
+        if self.fsync_policy == "always":
+            os.fsync(self._file.fileno())
+        elif self.fsync_policy == "interval":
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+
+    def append(self, entry: Dict[str, Any]):
+        """Append a single entry as one JSON line."""
+        self.append_many([entry])
+
+    @staticmethod
+    def encode(entry: Dict[str, Any]) -> bytes:
+        """Encode an entry as the JSON line ``append_many`` writes."""
+        return (json.dumps(entry, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+    def append_many(self, entries: Iterable[Union[Dict[str, Any], bytes]]):
+        """
+        Append several entries, flushing once for the whole batch. Entries
+        may already be encoded lines from ``encode``.
+        """
+        lines = [entry if isinstance(entry, bytes) else self.encode(entry) for entry in entries]
+        if not lines:
+            return
+
+        with self._lock:
+            if self._file is None:
+                self._open_segment()
+
+            if self._segment_size and self._segment_expired(self._segment_started):
+                self._rotate()
+
+            for line in lines:
+                if self._segment_size and \
+                        self._segment_size + len(line) > self.max_segment_bytes:
+                    self._rotate()
+                self._file.write(line)
+                self._segment_size += len(line)
+
+            self._file.flush()
+            self._maybe_fsync()
+
+    def mark_resident(self, since: float) -> int:
+        """
+        Split the store at the oldest segment written to after ``since``
+        (or the current one) and return its sequence. Segments before it
+        hold only entries up to ``since``, and compaction never merges
+        across the split, so callers may keep the newer side in memory and
+        page the older side from disk.
+        """
+        with self._lock:
+            self._resident_from = max(self._sequence, 1)
+            current = self._segment_path(self._resident_from)
+            if self._file is None and current.exists():
+                mtime = current.stat().st_mtime
+                # An aged-out current segment is never reopened, appends start the next one
+                if mtime <= since and self._segment_expired(mtime):
+                    self._resident_from += 1
+            for path in self.segments():
+                if path.stat().st_mtime > since:
+                    self._resident_from = min(self._sequence_of(path), self._resident_from)
+                    break
+            return self._resident_from
+
+    def iter_entries(self, start_sequence: int = None,
+                     stop_sequence: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over stored entries in write order, optionally only those in
+        segments ``start_sequence <= sequence < stop_sequence``.
+        """
+        for path in self._segment_range(start_sequence, stop_sequence):
+            try:
+                f = gzip.open(path, "rb") if path.suffix == ".gz" else open(path, "rb")
+            except FileNotFoundError:
+                # Compressed, merged away or expired by maintenance since the listing
+                path = Path(f"{path}.gz")
+                if not path.exists():
+                    continue
+                f = gzip.open(path, "rb")
+            with f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final line from a crash mid-write
+                        self.logger.warning(f"Skipping corrupt line in {path}")
+
+    def count_entries(self, start_sequence: int = None, stop_sequence: int = None) -> int:
+        """Count stored entries by their line breaks, without parsing them."""
+        count = 0
+        for path in self._segment_range(start_sequence, stop_sequence):
+            try:
+                f = gzip.open(path, "rb") if path.suffix == ".gz" else open(path, "rb")
+            except FileNotFoundError:
+                continue
+            with f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    count += chunk.count(b"\n")
+        return count
+
+    def _segment_range(self, start_sequence: Optional[int], stop_sequence: Optional[int]) -> List[Path]:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+            paths = self.segments()
+        return [
+            path for path in paths
+            if (start_sequence is None or self._sequence_of(path) >= start_sequence)
+            and (stop_sequence is None or self._sequence_of(path) < stop_sequence)
+        ]
+
+    def is_empty(self) -> bool:
+        """Check whether the store holds no data."""
+        return not any(path.stat().st_size for path in self.segments())
+
+    def migrate_legacy_json(self, legacy_path: Path) -> int:
+        """
+        Import entries from a legacy JSON array log (``actions.json``/``metrics.json``).
+
+        Migration only runs into an empty store, so it is safe to call on
+        every start. The legacy file is left in place untouched.
+        """
+        legacy_path = Path(legacy_path)
+        if not legacy_path.exists() or not self.is_empty():
+            return 0
+
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.error(f"Failed to read legacy log {legacy_path}: {e}")
+            return 0
+
+        if not isinstance(data, list):
+            return 0
+
+        self.append_many(data)
+        self.logger.info(f"Migrated {len(data)} entries from {legacy_path}")
+        return len(data)
+
+    def flush(self):
+        """Flush and fsync the active segment."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                if self.fsync_policy != "none":
+                    os.fsync(self._file.fileno())
+                self._last_fsync = time.monotonic()
+
+    def close(self):
+        """Close the active segment."""
+        with self._lock:
+            self._close_segment()
+
+    def _closed_segments(self) -> List[Path]:
+        """Segments that will never be appended to again, oldest first."""
+        # Listed under the lock so a rotation can't slip the new active segment in
+        with self._lock:
+            return [path for path in self.segments() if self._sequence_of(path) < self._sequence]
+
+    def _reclaim(self, path: Path, stat_key: str) -> int:
+        size = path.stat().st_size
+        path.unlink()
+        self._stats[stat_key] += 1
+        return size
+
+    def apply_retention(self, max_age_seconds: float) -> Dict[str, int]:
+        """
+        Drop every segment whose newest entry is older than ``max_age_seconds``.
+
+        Costs O(segments): only file metadata is inspected, and segments
+        holding any unexpired entry are kept whole.
+        """
+        cutoff = time.time() - max_age_seconds
+        dropped = 0
+        reclaimed = 0
+
+        with self._maintenance_lock:
+            for path in self._closed_segments():
+                if path.stat().st_mtime < cutoff:
+                    reclaimed += self._reclaim(path, "segments_dropped")
+                    dropped += 1
+
+            # An idle current segment can expire as a whole too. Appends wait
+            # on the lock, and the next one starts the segment afresh
+            with self._lock:
+                path = self._segment_path(self._sequence)
+                if path.exists() and path.stat().st_mtime < cutoff:
+                    self._close_segment()
+                    reclaimed += self._reclaim(path, "segments_dropped")
+                    dropped += 1
+
+            self._stats["bytes_reclaimed"] += reclaimed
+
+        if dropped:
+            self.logger.info(f"Retention dropped {dropped} segments ({reclaimed} bytes)")
+        return {"segments_dropped": dropped, "bytes_reclaimed": reclaimed}
+
+    def compact(self, min_segment_bytes: int = None,
+                compress_after: float = None) -> Dict[str, int]:
+        """
+        Merge runs of small closed segments and gzip cold ones.
+
+        Consecutive segments smaller than ``min_segment_bytes`` are merged into
+        the first of the run while the result stays under ``max_segment_bytes``.
+        Time-partitioned stores (``max_segment_age``) are never merged, since a
+        merged segment could only expire once its newest partition had.
+        Segments not written for ``compress_after`` seconds are gzipped.
+        """
+        if self.max_segment_age is not None:
+            min_segment_bytes = 0
+        elif min_segment_bytes is None:
+            min_segment_bytes = self.max_segment_bytes // 4
+        merged = compressed = 0
+        reclaimed = 0
+
+        with self._maintenance_lock:
+            run: List[Path] = []
+            run_bytes = 0
+            for path in self._closed_segments() + [None]:
+                small = path is not None and path.suffix != ".gz" and \
+                    path.stat().st_size < min_segment_bytes
+                crosses = bool(run) and path is not None and \
+                    self._sequence_of(run[0]) < self._resident_from <= self._sequence_of(path)
+                if small and not crosses and run_bytes + path.stat().st_size <= self.max_segment_bytes:
+                    run.append(path)
+                    run_bytes += path.stat().st_size
+                    continue
+
+                if len(run) > 1:
+                    merged += len(run) - 1
+                    self._merge_segments(run)
+                run, run_bytes = ([path], path.stat().st_size) if small else ([], 0)
+
+            if compress_after is not None:
+                cutoff = time.time() - compress_after
+                for path in self._closed_segments():
+                    if path.suffix != ".gz" and path.stat().st_mtime < cutoff:
+                        reclaimed += self._compress_segment(path)
+                        compressed += 1
+
+            self._stats["bytes_reclaimed"] += reclaimed
+
+        if merged or compressed:
+            self.logger.info(f"Compaction merged {merged} and compressed {compressed} "
+                             f"segments ({reclaimed} bytes reclaimed)")
+        return {
+            "segments_merged": merged,
+            "segments_compressed": compressed,
+            "bytes_reclaimed": reclaimed
+        }
+
+    def _merge_segments(self, run: List[Path]):
+        """
+        Concatenate ``run`` into its first segment, keeping the newest mtime.
+        Concatenation frees no space, so nothing is counted as reclaimed.
+        """
+        target = run[0]
+        newest = max(path.stat().st_mtime for path in run)
+
+        # Readers list segments under the lock, hold it until the run is consistent again
+        with self._lock:
+            tmp_path = Path(f"{target}.tmp")
+            with open(tmp_path, "wb") as out:
+                for path in run:
+                    with open(path, "rb") as f:
+                        shutil.copyfileobj(f, out)
+            os.replace(tmp_path, target)
+            os.utime(target, (newest, newest))
+
+            for path in run[1:]:
+                path.unlink()
+                self._stats["segments_merged"] += 1
+
+    def _compress_segment(self, path: Path) -> int:
+        """Gzip a closed segment in place, keeping its mtime."""
+        mtime = path.stat().st_mtime
+        before = path.stat().st_size
+        gz_path = Path(f"{path}.gz")
+        tmp_path = Path(f"{gz_path}.tmp")
+
+        with open(path, "rb") as f, gzip.open(tmp_path, "wb") as out:
+            shutil.copyfileobj(f, out)
+        with self._lock:
+            os.replace(tmp_path, gz_path)
+            os.utime(gz_path, (mtime, mtime))
+            path.unlink()
+        self._stats["segments_compressed"] += 1
+        return before - gz_path.stat().st_size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get storage and maintenance statistics."""
+        segments = self.segments()
+        return {
+            "segments": len(segments),
+            "compressed_segments": sum(1 for path in segments if path.suffix == ".gz"),
+            "bytes": sum(path.stat().st_size for path in segments),
+            "active_segment": self._sequence,
+            "fsync_policy": self.fsync_policy,
+            **self._stats
+        }
@@ -0,0 +1,195 @@
+"""
+Background Log Writer - Batched, queue-backed writer for recursive improvement logs
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "sample")
+
+
+class BackgroundLogWriter:
+    """
+    Drains a bounded in-memory queue on a dedicated thread and hands entries
+    to ``handler`` in batches, so callers never wait on disk.
+
+    A batch is written once ``batch_size`` entries are pending or the oldest
+    pending entry is ``flush_interval`` seconds old. When the queue is full the
+    overflow policy decides what happens:
+
+    - ``block``: the caller waits for space
+    - ``drop_oldest``: the oldest queued entry is discarded
+    - ``sample``: one in every ``sample_rate`` overflowing entries is kept
+      (evicting the oldest), the rest are discarded
+    """
+
+    def __init__(self, handler: Callable[[List[Any]], None],
+                 max_queue_size: int = 10000,
+                 batch_size: int = 256,
+                 flush_interval: float = 0.5,
+                 overflow_policy: str = "block",
+                 sample_rate: int = 10,
+                 name: str = "recursive-log-writer"):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow_policy}', "
+                             f"expected one of {OVERFLOW_POLICIES}")
+
+        self.handler = handler
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.sample_rate = max(1, sample_rate)
+        self.name = name
+
+        self.logger = logging.getLogger("recursive.log_writer")
+        self._queue = deque()
+        self._oldest_pending = None
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closing = False
+        self._flush_requested = False
+
+        # Counters
+        self._submitted = 0
+        self._completed = 0
+        self._written = 0
+        self._dropped = 0
+        self._overflows = 0
+        self._batches = 0
+        self._errors = 0
+
+    def start(self):
+        """Start the writer thread."""
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._closing = False
+            self._thread = threading.Thread(target=self._run, name=self.name)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def submit(self, item: Any) -> bool:
+        """Queue an entry for writing. Returns False if it was discarded."""
+        with self._cond:
+            if self._closing:
+                return False
+
+            if len(self._queue) >= self.max_queue_size:
+                self._overflows += 1
+                if self.overflow_policy == "block":
+                    while len(self._queue) >= self.max_queue_size and not self._closing:
+                        self._cond.wait()
+                    if self._closing:
+                        return False
+                elif self.overflow_policy == "sample" and \
+                        self._overflows % self.sample_rate != 0:
+                    self._dropped += 1
+                    return False
+                else:
+                    self._queue.popleft()
+                    self._dropped += 1
+                    self._completed += 1
+
+            if not self._queue:
+                self._oldest_pending = time.monotonic()
+            self._queue.append(item)
+            self._submitted += 1
+
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+            return True
+
+    def _next_batch(self) -> Optional[List[Any]]:
+        """Wait until a batch is due. Returns None once closed and drained."""
+        with self._cond:
+            while True:
+                if self._queue:
+                    age = time.monotonic() - self._oldest_pending
+                    if (len(self._queue) >= self.batch_size or
+                            age >= self.flush_interval or
+                            self._flush_requested or self._closing):
+                        break
+                    self._cond.wait(self.flush_interval - age)
+                elif self._closing:
+                    return None
+                else:
+                    self._flush_requested = False
+                    self._cond.wait()
+
+            count = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+            self._oldest_pending = time.monotonic() if self._queue else None
+            # Producers blocked on a full queue can continue
+            self._cond.notify_all()
+            return batch
+
+    def _run(self):
+        """Writer thread loop."""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            try:
+                self.handler(batch)
+                written = len(batch)
+            except Exception as e:
+                self.logger.error(f"Failed to write log batch: {e}")
+                written = 0
+                with self._cond:
+                    self._errors += 1
+
+            with self._cond:
+                self._written += written
+                self._completed += len(batch)
+                self._batches += 1
+                self._cond.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """Block until everything submitted so far has been handled."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._thread is None:
+                return not self._queue
+            target = self._submitted
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._completed < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: float = 5.0):
+        """Drain the queue and stop the writer thread."""
+        with self._cond:
+            if self._thread is None:
+                return
+            self._closing = True
+            self._cond.notify_all()
+            thread = self._thread
+
+        thread.join(timeout=timeout)
+        with self._cond:
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        with self._cond:
+            return {
+                "queue_depth": len(self._queue),
+                "max_queue_size": self.max_queue_size,
+                "overflow_policy": self.overflow_policy,
+                "submitted": self._submitted,
+                "written": self._written,
+                "dropped": self._dropped,
+                "overflows": self._overflows,
+                "batches": self._batches,
+                "errors": self._errors
+            }
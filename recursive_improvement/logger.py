@@ -2,64 +2,187 @@
 Recursive Logger - Advanced logging system for tracking all recursive improvements
 """
 
-import json
 import logging
-from datetime import datetime
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 import threading
 
+from .log_config import configure_logging
+from .blob_store import BLOB_REF, ContentAddressedBlobStore
+from .log_store import SegmentedLogStore
+from .log_writer import BackgroundLogWriter
+from .metrics_registry import registry as metrics
+from .metrics_index import SlidingWindowCounter, TimeSeriesIndex
+from .rollups import MetricRollups
+from .tracing import traced
+
+
+LOG_WRITE_SECONDS = metrics.histogram(
+    "recursive_log_write_seconds",
+    "Time to append entries to a log store, per write call",
+    ("store",),
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+)
+LOG_ENTRIES = metrics.counter(
+    "recursive_log_entries_total",
+    "Entries appended to each log store",
+    ("store",)
+)
+
 
 class RecursiveLogger:
     """Advanced logging system for recursive improvement tracking."""
     
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", config: Dict[str, Any] = None):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
+        self.config = config or {}
         
         self.general_log = self.log_dir / "recursive_improvements.log"
+        # Legacy JSON array logs, only read for migration
         self.metrics_log = self.log_dir / "metrics.json"
         self.actions_log = self.log_dir / "actions.json"
         
-        self.metrics_data = []
-        self.actions_data = []
+        # Append-only segment stores
+        segment_dir = self.log_dir / "segments"
+        store_options = {
+            "max_segment_bytes": self.config.get("max_segment_bytes", 4 * 1024 * 1024),
+            "fsync_policy": self.config.get("fsync_policy", "interval"),
+            "fsync_interval": self.config.get("fsync_interval", 1.0),
+            # Daily time partitions let retention drop whole segments
+            "max_segment_age": self.config.get("max_segment_age", 24 * 3600)
+        }
+        self.actions_store = SegmentedLogStore(segment_dir, "actions", **store_options)
+        self.metrics_store = SegmentedLogStore(segment_dir, "metrics", **store_options)
+        
+        # Large action results are stored once by content hash
+        self.blob_store = ContentAddressedBlobStore(self.log_dir / "blobs")
+        self.blob_threshold = self.config.get("blob_threshold_bytes", 4096)
+        
+        self.actions_store.migrate_legacy_json(self.actions_log)
+        self.metrics_store.migrate_legacy_json(self.metrics_log)
         self._lock = threading.Lock()
         
-        # Set up main logger
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.general_log),
-                logging.StreamHandler()
-            ]
-        )
+        # Downsampled metric tiers, kept when raw points expire
+        self.rollups_path = self.log_dir / "rollups.json"
+        self.rollups = MetricRollups(self.config.get("rollup_capacity"))
+        self.rollups.load(self.rollups_path)
+        self.raw_metric_retention_days = self.config.get("raw_metric_retention_days")
+        
+        # Only recent segments are loaded, older ones are paged from disk by
+        # queries. The window covers the summary's 8 day count
+        self.resident_days = self.config.get("resident_days", 8)
+        since = datetime.now().timestamp() - self.resident_days * 24 * 3600
+        self._resident_since = {
+            self.actions_store.name: since,
+            self.metrics_store.name: since
+        }
+        self._resident_from = {
+            store.name: store.mark_resident(self._resident_since[store.name])
+            for store in (self.actions_store, self.metrics_store)
+        }
+        # Cutoff of the last cleanup, applied to paged entries too
+        self._expired_before = {self.actions_store.name: 0.0, self.metrics_store.name: 0.0}
+        self._archived_actions: Optional[int] = None
+        
+        self.metrics_data = list(self.metrics_store.iter_entries(self._resident_from[self.metrics_store.name]))
+        self.actions_data = list(self.actions_store.iter_entries(self._resident_from[self.actions_store.name]))
+        
+        # Time indexes over the in-memory history
+        self.metrics_index = TimeSeriesIndex()
+        self.actions_index = TimeSeriesIndex()
+        
+        # Incrementally maintained improvement summary aggregates.
+        # The recent window keeps actions less than 8 whole days old, which
+        # matches the historical timedelta.days <= 7 check.
+        self._engine_last_seen: Dict[str, str] = {}
+        self._recent_actions = SlidingWindowCounter(timedelta(days=8).total_seconds())
+        # Older points the persisted rollups haven't folded in yet are streamed
+        # from disk rather than kept resident, and saved so a restart skips them
+        folded = self._fold_archived_metrics()
+        self._rebuild_indexes()
+        if folded:
+            self.save_rollups()
+        
+        # Set up the queue-based logging pipeline, formatting and handler I/O
+        # happen on the listener thread. Rate limiting is on by default, the
+        # logging config may override it
+        configure_logging(self.general_log, **self.config.get("logging", {}))
         
         self.logger = logging.getLogger("recursive_logger")
+        
+        # Optional background writer: callers only enqueue, a writer thread
+        # batches the disk I/O
+        self.writer_mode = self.config.get("writer_mode", "sync")
+        self.writer: Optional[BackgroundLogWriter] = None
+        if self.writer_mode == "async":
+            writer_config = self.config.get("writer", {})
+            self.writer = BackgroundLogWriter(
+                self._write_batch,
+                max_queue_size=writer_config.get("max_queue_size", 10000),
+                batch_size=writer_config.get("batch_size", 256),
+                flush_interval=writer_config.get("flush_interval", 0.5),
+                overflow_policy=writer_config.get("overflow_policy", "block"),
+                sample_rate=writer_config.get("sample_rate", 10)
+            )
+            self.writer.start()
+        
+        # Optional background retention and compaction of closed segments
+        self.retention_days = self.config.get("retention_days")
+        self.compaction_interval = self.config.get("compaction_interval")
+        self._maintenance_stop = threading.Event()
+        self._maintenance_thread = None
+        if self.compaction_interval:
+            self._maintenance_thread = threading.Thread(
+                target=self._maintenance_loop, name="recursive-log-compactor"
+            )
+            self._maintenance_thread.daemon = True
+            self._maintenance_thread.start()
     
+    @traced("logger.log_action")
     def log_action(self, engine_name: str, action_type: str, 
                    result: Dict[str, Any], metadata: Dict[str, Any] = None):
         """Log a recursive action execution."""
+        # Hash large payloads outside the lock, blobs are written with the entry
+        blobs = []
+        stored_result = self._externalize_result(result, blobs)
+        
         with self._lock:
+            now = datetime.now()
             action_entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "engine": engine_name,
                 "action_type": action_type,
-                "result": result,
+                "result": stored_result,
                 "metadata": metadata or {}
             }
             
             self.actions_data.append(action_entry)
-            self._save_json_log(self.actions_log, self.actions_data)
-            
-            self.logger.info(f"Action logged: {engine_name}.{action_type}")
+            self._index_action(action_entry, now.timestamp())
+        
+        # Encode now, the caller may mutate result or metadata once we return.
+        # Disk I/O, and a writer queue that blocks when full, stay outside the lock
+        line = self.actions_store.encode(action_entry)
+        if self.writer:
+            # Blobs share the entry's queue item, so overflow never drops one without the other
+            self.writer.submit((self.actions_store, line, blobs))
+        else:
+            if blobs:
+                self._append_log(self.blob_store, blobs)
+            self._append_log(self.actions_store, [line])
+        self.logger.info(f"Action logged: {engine_name}.{action_type}")
     
+    @traced("logger.log_metric")
     def log_metric(self, metric_name: str, value: Any, 
                    engine_name: str = None, tags: Dict[str, str] = None):
         """Log a metric for tracking improvements."""
         with self._lock:
+            now = datetime.now()
             metric_entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "metric": metric_name,
                 "value": value,
                 "engine": engine_name,
@@ -67,9 +190,15 @@ class RecursiveLogger:
             }
             
             self.metrics_data.append(metric_entry)
-            self._save_json_log(self.metrics_log, self.metrics_data)
-            
-            self.logger.info(f"Metric logged: {metric_name} = {value}")
+            self._index_metric(metric_entry, now.timestamp())
+            self.rollups.ingest(engine_name, metric_name, now.timestamp(), value)
+        
+        line = self.metrics_store.encode(metric_entry)
+        if self.writer:
+            self.writer.submit((self.metrics_store, line, ()))
+        else:
+            self._append_log(self.metrics_store, [line])
+        self.logger.info(f"Metric logged: {metric_name} = {value}")
     
     def log_compounding_action(self, engine_name: str, main_action: str, 
                               pre_action: str, overlap_duration: float):
@@ -90,64 +219,426 @@ class RecursiveLogger:
                           hours: int = 24) -> List[Dict[str, Any]]:
         """Get recent metrics for a specific engine."""
         cutoff = datetime.now().timestamp() - (hours * 3600)
+        return self.query_metrics(engine=engine_name, start=cutoff)
+    
+    def query_metrics(self, engine: str = None, metric: str = None,
+                      start: Union[datetime, float] = None,
+                      end: Union[datetime, float] = None,
+                      limit: int = None) -> List[Dict[str, Any]]:
+        """
+        Query metrics by engine and/or metric name within a time range.
+        
+        Bounds may be datetimes or epoch seconds (``start < t <= end``).
+        With ``limit`` only the most recent entries are returned, oldest first.
+        Ranges reaching past the resident window also read older segments.
+        """
+        if engine is not None and metric is not None:
+            key = ("engine_metric", engine, metric)
+        elif engine is not None:
+            key = ("engine", engine)
+        elif metric is not None:
+            key = ("metric", metric)
+        else:
+            key = None
         
-        return [
-            metric for metric in self.metrics_data
-            if metric.get("engine") == engine_name and
-            datetime.fromisoformat(metric["timestamp"]).timestamp() > cutoff
-        ]
+        start, end = self._epoch(start), self._epoch(end)
+        with self._lock:
+            recent = self.metrics_index.range(key, start, end, limit)
+        return self._with_archived(self.metrics_store, self._metric_keys, recent,
+                                   key, start, end, limit)
+    
+    def query_actions(self, engine: str = None,
+                      start: Union[datetime, float] = None,
+                      end: Union[datetime, float] = None,
+                      limit: int = None) -> List[Dict[str, Any]]:
+        """Query logged actions by engine within a time range, oldest first."""
+        key = ("engine", engine) if engine is not None else None
+        start, end = self._epoch(start), self._epoch(end)
+        with self._lock:
+            recent = self.actions_index.range(key, start, end, limit)
+        return self._with_archived(self.actions_store, self._action_keys, recent,
+                                   key, start, end, limit)
+    
+    def _with_archived(self, store: SegmentedLogStore, keys_of, recent: List[Dict[str, Any]],
+                       key, start: Optional[float], end: Optional[float],
+                       limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Prepend matching entries paged from segments older than the resident window."""
+        if limit is not None and len(recent) >= limit:
+            return recent
+        if self._resident_from[store.name] <= 1 or \
+                (start is not None and start >= self._resident_since[store.name]):
+            return recent
+        
+        index = TimeSeriesIndex()
+        for timestamp, entry in self._archived(store):
+            entry_keys = keys_of(entry)
+            if key is None or key in entry_keys:
+                index.add(entry_keys, timestamp, entry)
+        older = index.range(key, start, end, None if limit is None else limit - len(recent))
+        return older + recent
+    
+    def _archived(self, store: SegmentedLogStore) -> Iterator[tuple]:
+        """``(timestamp, entry)`` pairs from segments older than the resident window."""
+        expired_before = self._expired_before[store.name]
+        for entry in store.iter_entries(stop_sequence=self._resident_from[store.name]):
+            timestamp = datetime.fromisoformat(entry["timestamp"]).timestamp()
+            if timestamp > expired_before:
+                yield timestamp, entry
+    
+    def list_metric_series(self) -> Dict[str, List[str]]:
+        """List the engines and metric names with metrics in the resident window."""
+        with self._lock:
+            keys = self.metrics_index.keys()
+        return {
+            "engines": sorted(key[1] for key in keys if key[0] == "engine"),
+            "metrics": sorted(key[1] for key in keys if key[0] == "metric")
+        }
+    
+    def query_rollups(self, metric: str, engine: str = None, resolution: str = "1h",
+                      start: Union[datetime, float] = None,
+                      end: Union[datetime, float] = None) -> List[Dict[str, Any]]:
+        """
+        Query downsampled buckets (count/min/max/sum/last/avg) for a metric at
+        ``1m``, ``1h`` or ``1d`` resolution. Covers history whose raw points
+        have already expired.
+        """
+        with self._lock:
+            return self.rollups.query(metric, engine, resolution,
+                                      self._epoch(start), self._epoch(end))
+    
+    def rollup_series(self) -> List[tuple]:
+        """List the ``(engine, metric)`` series that have rollups."""
+        with self._lock:
+            return self.rollups.series_keys()
+    
+    @staticmethod
+    def _epoch(value: Union[datetime, float, None]) -> Optional[float]:
+        if isinstance(value, datetime):
+            return value.timestamp()
+        return value
+    
+    @staticmethod
+    def _metric_keys(entry: Dict[str, Any]) -> List[tuple]:
+        keys = [("metric", entry.get("metric"))]
+        engine = entry.get("engine")
+        if engine is not None:
+            keys.append(("engine", engine))
+            keys.append(("engine_metric", engine, entry.get("metric")))
+        return keys
+    
+    @staticmethod
+    def _action_keys(entry: Dict[str, Any]) -> List[tuple]:
+        return [("engine", entry.get("engine"))]
+    
+    def _index_metric(self, entry: Dict[str, Any], timestamp: float):
+        self.metrics_index.add(self._metric_keys(entry), timestamp, entry)
+    
+    def _index_action(self, entry: Dict[str, Any], timestamp: float):
+        self.actions_index.add(self._action_keys(entry), timestamp, entry)
+        self._engine_last_seen[entry.get("engine")] = entry["timestamp"]
+        self._recent_actions.add(timestamp)
+    
+    def _expire_summary(self, cutoff: float):
+        """Drop summary aggregates for actions removed before ``cutoff``."""
+        for engine in list(self._engine_last_seen):
+            if self.actions_index.count(("engine", engine)) == 0:
+                del self._engine_last_seen[engine]
+        
+        # Only a cutoff inside the recent window invalidates its buckets
+        if cutoff > datetime.now().timestamp() - self._recent_actions.window:
+            self._recent_actions.clear()
+            for timestamp in self.actions_index.timestamps(start=cutoff):
+                self._recent_actions.add(timestamp)
+    
+    def _rebuild_indexes(self):
+        """Index the resident history, parsing each timestamp once."""
+        self.metrics_index.clear()
+        self.actions_index.clear()
+        self._engine_last_seen.clear()
+        self._recent_actions.clear()
+        watermark = self.rollups.watermark
+        for entry in self.metrics_data:
+            timestamp = datetime.fromisoformat(entry["timestamp"]).timestamp()
+            self._index_metric(entry, timestamp)
+            # Points newer than the persisted rollups still need folding in
+            if timestamp > watermark:
+                self.rollups.ingest(entry.get("engine"), entry.get("metric"),
+                                    timestamp, entry.get("value"))
+        for entry in self.actions_data:
+            self._index_action(entry, datetime.fromisoformat(entry["timestamp"]).timestamp())
+    
+    def _fold_archived_metrics(self) -> int:
+        """Fold metric points older than the resident window into the rollups."""
+        watermark = self.rollups.watermark
+        if watermark >= self._resident_since[self.metrics_store.name]:
+            return 0
+        folded = 0
+        for timestamp, entry in self._archived(self.metrics_store):
+            if timestamp > watermark:
+                self.rollups.ingest(entry.get("engine"), entry.get("metric"),
+                                    timestamp, entry.get("value"))
+                folded += 1
+        return folded
     
     def get_action_history(self, engine_name: str = None, 
                           limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent action history."""
-        actions = self.actions_data[-limit:]
+        with self._lock:
+            actions = self.actions_data[-limit:]
+        if len(actions) < limit and self._resident_from[self.actions_store.name] > 1:
+            older = deque(maxlen=limit - len(actions))
+            older.extend(entry for _, entry in self._archived(self.actions_store))
+            actions = list(older) + actions
         if engine_name:
             actions = [a for a in actions if a.get("engine") == engine_name]
         return actions
     
     def get_improvement_summary(self) -> Dict[str, Any]:
-        """Generate a summary of recursive improvements."""
+        """
+        Generate a summary of recursive improvements. Engines are those with
+        actions in the resident window, the total also counts actions still
+        stored in older segments.
+        """
+        if self._archived_actions is None:
+            self._archived_actions = self.actions_store.count_entries(
+                stop_sequence=self._resident_from[self.actions_store.name]
+            )
+        
         with self._lock:
-            total_actions = len(self.actions_data)
-            engines = set(action.get("engine") for action in self.actions_data)
-            
-            recent_actions = [
-                action for action in self.actions_data
-                if (datetime.now() - datetime.fromisoformat(action["timestamp"])).days <= 7
-            ]
+            engines = list(self._engine_last_seen)
             
             return {
-                "total_actions": total_actions,
+                "total_actions": self._archived_actions + len(self.actions_data),
                 "active_engines": len(engines),
-                "engines": list(engines),
-                "recent_actions_7d": len(recent_actions),
+                "engines": engines,
+                "engine_last_seen": dict(self._engine_last_seen),
+                "recent_actions_7d": self._recent_actions.count(datetime.now().timestamp()),
                 "last_activity": self.actions_data[-1]["timestamp"] if self.actions_data else None
             }
     
-    def _save_json_log(self, filepath: Path, data: List[Dict[str, Any]]):
-        """Save JSON data to log file."""
+    def _append_log(self, store, entries: List[Any]):
+        """Append encoded entries (or a batch of blobs) to a store."""
+        started = time.perf_counter()
+        try:
+            store.append_many(entries)
+        except Exception as e:
+            self.logger.error(f"Failed to append to {store.name} log: {e}")
+            return
+        LOG_WRITE_SECONDS.labels(store.name).observe(time.perf_counter() - started)
+        LOG_ENTRIES.labels(store.name).inc(len(entries))
+    
+    def _externalize_result(self, result: Any, blobs: List[tuple]) -> Any:
+        """
+        Swap a large result for a blob reference plus a small summary.
+        Large nested values become blobs of their own so they dedupe across
+        entries (e.g. an engine result logged by both orchestrator and scheduler).
+        """
+        if not self.blob_threshold:
+            return result
+        
+        stored = self.blob_store.externalize(result, self.blob_threshold, blobs)
+        if stored is result:
+            return result
+        return {BLOB_REF: stored[BLOB_REF], "summary": self._summarize_result(result)}
+    
+    @staticmethod
+    def _summarize_result(result: Any) -> Dict[str, Any]:
+        """Keep top-level scalars and the sizes of nested collections."""
+        if not isinstance(result, dict):
+            return {"type": type(result).__name__}
+        
+        summary = {}
+        sizes = {}
+        for key, value in result.items():
+            if isinstance(value, (dict, list)):
+                sizes[key] = len(value)
+            elif isinstance(value, str):
+                summary[key] = value[:200]
+            else:
+                summary[key] = value
+        if sizes:
+            summary["sizes"] = sizes
+        return summary
+    
+    @traced("logger.store_payload")
+    def store_payload(self, value: Any) -> str:
+        """
+        Store ``value`` in the blob store and return its digest. Only the
+        encoding happens on the caller's thread, in async mode the write is
+        queued like any entry (and a lossy overflow policy may drop it).
+        """
+        digest, data = self.blob_store.encode(value)
+        self.store_encoded_payload(digest, data)
+        return digest
+    
+    def store_encoded_payload(self, digest: str, data: bytes):
+        """Store a payload already encoded by ``ContentAddressedBlobStore.encode``."""
+        if self.writer:
+            self.writer.submit((self.blob_store, (digest, data), ()))
+        else:
+            self._append_log(self.blob_store, [(digest, data)])
+    
+    def load_payload(self, digest: str) -> Any:
+        """Load a payload stored by ``store_payload``."""
+        return self.blob_store.resolve(self.blob_store.get(digest))
+    
+    def load_result(self, entry: Dict[str, Any]) -> Any:
+        """Return the full result of a logged action, loading blobs if needed."""
+        return self.blob_store.resolve(entry.get("result"))
+    
+    def _write_batch(self, batch: List[tuple]):
+        """Write a batch of queued entries, called on the writer thread."""
+        # Blobs go first so no entry on disk references a missing blob
+        grouped: Dict[str, tuple] = {self.blob_store.name: (self.blob_store, [])}
+        for store, entry, blobs in batch:
+            grouped[self.blob_store.name][1].extend(blobs)
+            grouped.setdefault(store.name, (store, []))[1].append(entry)
+        
+        for store, entries in grouped.values():
+            if not entries:
+                continue
+            started = time.perf_counter()
+            store.append_many(entries)
+            LOG_WRITE_SECONDS.labels(store.name).observe(time.perf_counter() - started)
+            LOG_ENTRIES.labels(store.name).inc(len(entries))
+        
+        self.logger.debug(f"Wrote batch of {len(batch)} log entries")
+    
+    def save_rollups(self):
+        """Persist the metric rollups."""
         try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._lock:
+                self.rollups.save(self.rollups_path)
         except Exception as e:
-            self.logger.error(f"Failed to save {filepath}: {e}")
+            self.logger.error(f"Failed to save rollups: {e}")
+    
+    def flush(self, timeout: float = None) -> bool:
+        """Flush pending log writes to disk."""
+        drained = self.writer.flush(timeout) if self.writer else True
+        self.actions_store.flush()
+        self.metrics_store.flush()
+        self.save_rollups()
+        return drained
+    
+    def close(self):
+        """Drain the writer and close the log stores."""
+        self._maintenance_stop.set()
+        if self._maintenance_thread:
+            self._maintenance_thread.join(timeout=5)
+        if self.writer:
+            self.writer.close()
+        self.actions_store.close()
+        self.metrics_store.close()
+        self.save_rollups()
     
-    def cleanup_old_logs(self, days: int = 30):
-        """Remove log entries older than specified days."""
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Get background writer statistics."""
+        if not self.writer:
+            return {"mode": self.writer_mode}
+        return {"mode": self.writer_mode, **self.writer.get_stats()}
+    
+    def cleanup_old_logs(self, days: int = 30) -> Dict[str, Any]:
+        """
+        Remove log entries older than specified days.
+        
+        In memory this is a bisect on the time index. On disk whole expired
+        segments are deleted, so entries sharing a segment with newer ones
+        are kept until the entire segment has expired.
+        """
         cutoff = datetime.now().timestamp() - (days * 24 * 3600)
         
         with self._lock:
-            self.metrics_data = [
-                metric for metric in self.metrics_data
-                if datetime.fromisoformat(metric["timestamp"]).timestamp() > cutoff
-            ]
-            
-            self.actions_data = [
-                action for action in self.actions_data
-                if datetime.fromisoformat(action["timestamp"]).timestamp() > cutoff
-            ]
-            
-            self._save_json_log(self.metrics_log, self.metrics_data)
-            self._save_json_log(self.actions_log, self.actions_data)
-            
-            self.logger.info(f"Cleaned up logs older than {days} days")
\ No newline at end of file
+            self._truncate(self.metrics_data, self.metrics_index, cutoff)
+            self._truncate(self.actions_data, self.actions_index, cutoff)
+            self._expire_summary(cutoff)
+            for name in self._expired_before:
+                self._expired_before[name] = max(self._expired_before[name], cutoff)
+        
+        # Queued entries must land before segments are inspected
+        if self.writer:
+            self.writer.flush()
+        
+        max_age = days * 24 * 3600
+        stats = {
+            "metrics": self.metrics_store.apply_retention(max_age),
+            "actions": self.actions_store.apply_retention(max_age)
+        }
+        self._archived_actions = None
+        
+        self.logger.info(f"Cleaned up logs older than {days} days")
+        return stats
+    
+    def expire_raw_metrics(self, days: float = None) -> int:
+        """
+        Drop raw metric points older than ``days`` (default: the configured
+        ``raw_metric_retention_days``). Rollups are kept, so trends survive.
+        """
+        days = self.raw_metric_retention_days if days is None else days
+        if days is None:
+            return 0
+        
+        cutoff = datetime.now().timestamp() - (days * 24 * 3600)
+        
+        with self._lock:
+            name = self.metrics_store.name
+            self._expired_before[name] = max(self._expired_before[name], cutoff)
+            removed = self._truncate(self.metrics_data, self.metrics_index, cutoff)
+            if not removed:
+                return 0
+            self.rollups.save(self.rollups_path)
+        
+        if self.writer:
+            self.writer.flush()
+        self.metrics_store.apply_retention(days * 24 * 3600)
+        
+        self.logger.info(f"Expired {removed} raw metric points older than {days} days")
+        return removed
+    
+    @staticmethod
+    def _truncate(data: List[Dict[str, Any]], index: TimeSeriesIndex, cutoff: float) -> int:
+        """
+        Drop entries at or before ``cutoff`` from ``index`` and from the
+        append-ordered ``data``. Entries loaded from disk or logged across a
+        clock step can be out of timestamp order, so the index's count is
+        only a prefix of ``data`` when the two orders agree.
+        """
+        expired = index.range(end=cutoff)
+        index.truncate_before(cutoff)
+        if all(kept is dropped for kept, dropped in zip(data, expired)):
+            del data[:len(expired)]
+        else:
+            expired_ids = {id(entry) for entry in expired}
+            data[:] = [entry for entry in data if id(entry) not in expired_ids]
+        return len(expired)
+    
+    def run_maintenance(self) -> Dict[str, Any]:
+        """Apply the configured retention and compact both segment stores."""
+        stats = {}
+        if self.retention_days is not None:
+            stats["retention"] = self.cleanup_old_logs(self.retention_days)
+        
+        compress_after = self.config.get("compress_after_days", 1) * 24 * 3600
+        min_segment_bytes = self.config.get("min_segment_bytes")
+        stats["compaction"] = {
+            store.name: store.compact(min_segment_bytes, compress_after)
+            for store in (self.actions_store, self.metrics_store)
+        }
+        # Keeps the watermark recent, so a restart after a crash folds little
+        self.save_rollups()
+        return stats
+    
+    def _maintenance_loop(self):
+        """Background compactor loop."""
+        while not self._maintenance_stop.wait(self.compaction_interval):
+            try:
+                self.run_maintenance()
+            except Exception as e:
+                self.logger.error(f"Log maintenance failed: {e}")
+    
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Get segment store statistics, including bytes reclaimed."""
+        return {
+            "actions": self.actions_store.get_stats(),
+            "metrics": self.metrics_store.get_stats(),
+            "blobs": self.blob_store.get_stats()
+        }
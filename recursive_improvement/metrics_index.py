@@ -0,0 +1,152 @@
+"""
+Time Series Index - In-memory time index over recursive improvement log entries
+"""
+
+from bisect import bisect_right
+from collections import deque
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+
+class _Series:
+    """Sorted epoch timestamps with the entries recorded at those times."""
+
+    __slots__ = ("timestamps", "entries")
+
+    def __init__(self):
+        self.timestamps: List[float] = []
+        self.entries: List[Dict[str, Any]] = []
+
+    def add(self, timestamp: float, entry: Dict[str, Any]):
+        if not self.timestamps or timestamp >= self.timestamps[-1]:
+            self.timestamps.append(timestamp)
+            self.entries.append(entry)
+        else:
+            # Out-of-order arrival, keep both arrays sorted
+            position = bisect_right(self.timestamps, timestamp)
+            self.timestamps.insert(position, timestamp)
+            self.entries.insert(position, entry)
+
+    def bounds(self, start: Optional[float], end: Optional[float]) -> tuple:
+        low = 0 if start is None else bisect_right(self.timestamps, start)
+        high = len(self.timestamps) if end is None else bisect_right(self.timestamps, end)
+        return low, high
+
+    def truncate_before(self, cutoff: float) -> int:
+        position = bisect_right(self.timestamps, cutoff)
+        del self.timestamps[:position]
+        del self.entries[:position]
+        return position
+
+
+class TimeSeriesIndex:
+    """
+    Maps arbitrary keys (e.g. ``("engine", "auto_refactor")``) to sorted
+    timestamp arrays, so time-range queries are a ``bisect`` instead of a
+    parse-and-filter scan over the whole history.
+
+    Range bounds follow the ``start < t <= end`` convention.
+    """
+
+    ALL = ("all",)
+
+    def __init__(self):
+        self._series: Dict[Hashable, _Series] = {}
+
+    def add(self, keys: Iterable[Hashable], timestamp: float, entry: Dict[str, Any]):
+        """Index an entry under every key in ``keys`` (and the global series)."""
+        for key in (self.ALL, *keys):
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series()
+            series.add(timestamp, entry)
+
+    def range(self, key: Hashable = None, start: float = None, end: float = None,
+              limit: int = None) -> List[Dict[str, Any]]:
+        """
+        Return entries for ``key`` with timestamps in the range, oldest first.
+        When ``limit`` is set, only the most recent ``limit`` entries are kept.
+        """
+        series = self._series.get(self.ALL if key is None else key)
+        if series is None:
+            return []
+
+        low, high = series.bounds(start, end)
+        if limit is not None:
+            low = max(low, high - limit)
+        return series.entries[low:high]
+
+    def timestamps(self, key: Hashable = None, start: float = None,
+                   end: float = None) -> List[float]:
+        """Return the epoch timestamps for ``key`` in the range."""
+        series = self._series.get(self.ALL if key is None else key)
+        if series is None:
+            return []
+        low, high = series.bounds(start, end)
+        return series.timestamps[low:high]
+
+    def count(self, key: Hashable = None, start: float = None, end: float = None) -> int:
+        """Count entries for ``key`` in the range without materializing them."""
+        series = self._series.get(self.ALL if key is None else key)
+        if series is None:
+            return 0
+        low, high = series.bounds(start, end)
+        return max(0, high - low)
+
+    def keys(self) -> List[Hashable]:
+        """Return all indexed keys except the global series."""
+        return [key for key in self._series if key != self.ALL]
+
+    def truncate_before(self, cutoff: float) -> int:
+        """Drop entries at or before ``cutoff`` from every series."""
+        removed = 0
+        for key, series in list(self._series.items()):
+            dropped = series.truncate_before(cutoff)
+            if key == self.ALL:
+                removed = dropped
+            if not series.timestamps:
+                del self._series[key]
+        return removed
+
+    def clear(self):
+        """Remove all indexed entries."""
+        self._series.clear()
+
+    def __len__(self) -> int:
+        series = self._series.get(self.ALL)
+        return len(series.timestamps) if series else 0
+
+
+class SlidingWindowCounter:
+    """
+    Counts events over a trailing time window using fixed-width buckets.
+    Expired buckets are subtracted as the window slides, so reading the
+    count costs O(expired buckets) rather than O(events).
+    """
+
+    def __init__(self, window: float, bucket_width: float = 60.0):
+        self.window = window
+        self.bucket_width = bucket_width
+        self._buckets = deque()
+        self._total = 0
+
+    def add(self, timestamp: float, count: int = 1):
+        """Record ``count`` events at ``timestamp``."""
+        bucket = int(timestamp // self.bucket_width) * self.bucket_width
+        if self._buckets and bucket <= self._buckets[-1][0]:
+            # Late events are credited to the newest bucket
+            self._buckets[-1][1] += count
+        else:
+            self._buckets.append([bucket, count])
+        self._total += count
+
+    def count(self, now: float) -> int:
+        """Return the number of events in the window ending at ``now``."""
+        cutoff = now - self.window
+        while self._buckets and self._buckets[0][0] + self.bucket_width <= cutoff:
+            self._total -= self._buckets.popleft()[1]
+        return self._total
+
+    def clear(self):
+        """Reset the counter."""
+        self._buckets.clear()
+        self._total = 0
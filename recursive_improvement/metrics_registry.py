@@ -0,0 +1,262 @@
+"""
+Metrics Registry - In-memory counters, gauges and histograms in Prometheus text format
+"""
+
+import bisect
+import logging
+import math
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """A named metric with zero or more labels; each label combination is a child."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Any:
+        """Child for one combination of label values, created on first use."""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def _samples(self) -> List[Tuple[str, str, float]]:
+        """``(suffix, labels, value)`` for every child, rendered label string included."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self._samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeValue(_Value):
+    __slots__ = ()
+
+    def set(self, value: float):
+        self.value = float(value)
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count. Names end in ``_total`` by convention."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+    def _samples(self):
+        return [("", _format_labels(self.labelnames, key), child.value)
+                for key, child in sorted(self._children.items())]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, typically set from a collector."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def set(self, value: float):
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+    def _samples(self):
+        return [("", _format_labels(self.labelnames, key), child.value)
+                for key, child in sorted(self._children.items())]
+
+
+class _HistogramValue:
+    __slots__ = ("upper_bounds", "counts", "sum", "count", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * len(upper_bounds)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.upper_bounds, value)
+        with self._lock:
+            if index < len(self.counts):
+                self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    """Observations counted into fixed cumulative buckets, plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        if "le" in self.labelnames:
+            raise ValueError("'le' is reserved for histogram buckets")
+        self.buckets = tuple(sorted(float(bound) for bound in buckets if not math.isinf(bound)))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        """Observe into the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _samples(self):
+        samples = []
+        for key, child in sorted(self._children.items()):
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                samples.append(("_bucket", labels, cumulative))
+            samples.append(("_bucket", _format_labels(self.labelnames + ("le",), key + ("+Inf",)), count))
+            samples.append(("_sum", _format_labels(self.labelnames, key), total))
+            samples.append(("_count", _format_labels(self.labelnames, key), count))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Holds metrics by name. Getters create a metric on first use and return
+    the existing one afterwards, so modules can declare what they update at
+    import time. Collectors run before each render to refresh gauges that
+    mirror live state such as queue depths.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Optional[Callable[[], None]]]] = []
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger("recursive.metrics")
+
+    def _get(self, cls: type, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a different {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def add_collector(self, collector: Callable[[], None]):
+        """
+        Run ``collector`` before each render. Bound methods are held weakly,
+        so an orchestrator that is dropped without shutting down stops
+        collecting instead of being kept alive.
+        """
+        ref = weakref.WeakMethod(collector) if hasattr(collector, "__self__") else (lambda: collector)
+        with self._lock:
+            self._collectors.append(ref)
+
+    def remove_collector(self, collector: Callable[[], None]):
+        """Stop running ``collector`` before renders."""
+        with self._lock:
+            self._collectors = [ref for ref in self._collectors if ref() not in (None, collector)]
+
+    def collect(self):
+        """Run the collectors, dropping ones whose owner is gone."""
+        with self._lock:
+            refs = list(self._collectors)
+        for ref in refs:
+            collector = ref()
+            if collector is None:
+                continue
+            try:
+                collector()
+            except Exception as e:
+                # A broken collector must not break the scrape
+                self.logger.error(f"Metrics collector {collector!r} failed: {e}")
+        with self._lock:
+            self._collectors = [ref for ref in self._collectors if ref() is not None]
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)."""
+        self.collect()
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry updated by the framework's instrumentation
+registry = MetricsRegistry()
@@ -2,15 +2,90 @@
 Recursive Orchestrator - Central coordinator for all recursive improvement engines
 """
 
+import os
 import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union
 import logging
 
+if TYPE_CHECKING:
+    import asyncio
+
+from .admission import AdmissionController
 from .base import RecursiveEngine, RecursiveHook
+from .checkpoint import EngineCheckpointStore
+from .deadline_scheduler import shared_delayed_executor
 from .logger import RecursiveLogger
+from .metrics_registry import registry as metrics
+from .process_pool import EngineProcessPool, record_engine_run, run_outcome
+from .registry import EngineSpec, LazyEngineRegistry
+from .resources import rank_engines
 from .scheduler import RecursiveScheduler
+from .tracing import bind_context, capture_trace, configure_tracing, resume_trace, tracer
+
+
+# Context groups matched as substrings of the trigger context, in priority order.
+# Engines without declared context_tags subscribe by engine-name substring.
+LEGACY_CONTEXT_GROUPS = {
+    "workflow": ["feedback_loop", "workflow_automation", "experimentation"],
+    "validation": ["escalation_logic", "kpi_mutation"],
+    "content": ["content_stack", "asset_library", "playbook_generator"],
+    "monitoring": ["debrief_bot", "cloning_agent"]
+}
+
+# Cached routes kept before the cache is reset
+ROUTE_CACHE_SIZE = 1024
+
+TRIGGERS = metrics.counter(
+    "recursive_triggers_total",
+    "Improvement triggers by source and admission outcome",
+    ("source", "admission")
+)
+SWEEP_SECONDS = metrics.histogram(
+    "recursive_sweep_duration_seconds",
+    "Wall time of admitted improvement sweeps, routing to hooks",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+)
+IMPROVEMENTS = metrics.counter(
+    "recursive_improvements_total",
+    "Engine actions executed by improvement sweeps"
+)
+ENGINE_TIMEOUTS = metrics.counter(
+    "recursive_engine_timeouts_total",
+    "Engines abandoned by a sweep after the engine timeout",
+    ("engine",)
+)
+QUEUE_DEPTH = metrics.gauge(
+    "recursive_queue_depth",
+    "Items waiting in the orchestrator's queues",
+    ("queue",)
+)
+TRIGGERS_IN_FLIGHT = metrics.gauge(
+    "recursive_triggers_in_flight",
+    "Improvement sweeps currently running"
+)
+ENGINES = metrics.gauge(
+    "recursive_engines",
+    "Registered engines, loaded or still pending import",
+    ("state",)
+)
+UPTIME = metrics.gauge(
+    "recursive_uptime_seconds",
+    "Seconds since the orchestrator was initialized"
+)
+
+# Hook events are dispatched on the event bus; bursts of the events that fan
+# out to engines collapse into one improvement sweep
+DEFAULT_HOOK_CONFIG = {
+    "mode": "bus",
+    "events": {
+        "workflow_start": {"debounce": 1.0, "max_wait": 10.0},
+        "workflow_complete": {"debounce": 1.0, "max_wait": 10.0},
+        "system_validation": {"debounce": 1.0, "max_wait": 10.0, "priority": 10}
+    }
+}
 
 
 class RecursiveOrchestrator:
@@ -20,20 +95,66 @@ class RecursiveOrchestrator:
         self.config = config or {}
         self.logger = logging.getLogger("recursive.orchestrator")
         
+        # Spans are process-wide, a configured orchestrator sets the sampling for all of them
+        if "tracing" in self.config:
+            configure_tracing(self.config["tracing"])
+        
         # Core components
-        self.recursive_logger = RecursiveLogger()
-        self.scheduler = RecursiveScheduler(self.recursive_logger)
-        self.hook_system = RecursiveHook()
+        log_dir = self.config.get("log_dir", "logs")
+        self.recursive_logger = RecursiveLogger(
+            log_dir=log_dir,
+            config=self.config.get("logger")
+        )
+        self.process_pool = EngineProcessPool(self.config.get("process_pool"))
+        self.scheduler = RecursiveScheduler(
+            self.recursive_logger,
+            self.process_pool,
+            self.config.get("scheduler")
+        )
+        self.hook_system = RecursiveHook(self.config.get("hooks", DEFAULT_HOOK_CONFIG))
+        self.admission = AdmissionController(self.config.get("admission"))
         
         # State management
-        self.engines: Dict[str, RecursiveEngine] = {}
+        self.engines = LazyEngineRegistry(on_load=self._activate_engine)
+        self.scheduler.engine_loader = self.engines.load_all
         self.is_initialized = False
+        
+        # Trigger routing: context tag -> subscribed engine names in registration order
+        self._tag_index: Dict[str, List[str]] = {tag: [] for tag in LEGACY_CONTEXT_GROUPS}
+        self._route_cache: Dict[str, tuple] = {}
         self.start_time = None
         
         # Metrics
         self.total_improvements = 0
         self.active_engines = 0
         
+        # Engine fan-out: "parallel" runs triggered engines on a shared bounded pool,
+        # "async" drives them all on one event loop, "sequential" runs them in turn
+        execution_config = self.config.get("execution", {})
+        self.execution_mode = execution_config.get("mode", "parallel")
+        self.max_workers = execution_config.get("max_workers", 8)
+        self.engine_timeout = execution_config.get("engine_timeout", 60.0)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._loop: Optional["asyncio.AbstractEventLoop"] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        
+        # Engine state checkpoints, restored on registration and saved periodically
+        checkpoint_config = self.config.get("checkpoint", {})
+        self.checkpoints: Optional[EngineCheckpointStore] = None
+        if checkpoint_config.get("enabled", True):
+            self.checkpoints = EngineCheckpointStore(
+                checkpoint_config.get("directory", os.path.join(log_dir, "checkpoints"))
+            )
+            self.scheduler.timer.add_job(
+                "engine_checkpoints",
+                self.save_checkpoints,
+                interval=checkpoint_config.get("interval", 300)
+            )
+        
+        # Gauges mirroring live state are refreshed when metrics are rendered
+        metrics.add_collector(self._collect_metrics)
+        
     def initialize(self) -> bool:
         """Initialize the orchestrator and all core systems."""
         try:
@@ -71,15 +192,11 @@ class RecursiveOrchestrator:
             
             # Store the engine
             self.engines[engine.name] = engine
-            
-            # Register with scheduler
-            self.scheduler.register_engine(engine)
+            self._activate_engine(engine)
             
             # Set up engine-specific hooks
             self._setup_engine_hooks(engine)
             
-            self.active_engines += 1
-            
             self.logger.info(f"Successfully registered engine: {engine.name}")
             
             # Log registration
@@ -96,6 +213,45 @@ class RecursiveOrchestrator:
             self.logger.error(f"Failed to register engine {engine.name}: {e}")
             return False
     
+    def register_lazy_engine(self, spec: EngineSpec) -> bool:
+        """
+        Register an engine by import path. It is routed by the spec's name and
+        context tags, and only imported and started when first used.
+        """
+        try:
+            self.engines.add_spec(spec)
+            self._index_engine(spec)
+            self._setup_engine_hooks(spec)
+            self.logger.debug(f"Registered lazy engine: {spec.name}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to register engine {spec.name}: {e}")
+            return False
+    
+    def _activate_engine(self, engine: RecursiveEngine):
+        """Connect a newly built engine to the logger, scheduler and checkpoints."""
+        self._index_engine(engine)
+        engine.recursive_logger = self.recursive_logger
+        
+        # Register with scheduler
+        self.scheduler.register_engine(engine)
+        
+        # Pick up where the previous process left off
+        if self.checkpoints is not None:
+            self.checkpoints.restore(engine)
+        
+        self.active_engines += 1
+    
+    def _resolve_engines(self, engine_names: List[str]) -> List[tuple]:
+        """Look up engines by name, loading lazy ones and skipping any that fail to load."""
+        engines = []
+        for engine_name in engine_names:
+            try:
+                engines.append((engine_name, self.engines[engine_name]))
+            except Exception as e:
+                self.logger.error(f"Failed to load engine {engine_name}: {e}")
+        return engines
+    
     def _setup_core_hooks(self):
         """Set up core system hooks."""
         # Hook for workflow execution
@@ -123,7 +279,7 @@ class RecursiveOrchestrator:
         
         self.logger.info("Core hooks established")
     
-    def _setup_engine_hooks(self, engine: RecursiveEngine):
+    def _setup_engine_hooks(self, engine: Union[RecursiveEngine, EngineSpec]):
         """Set up hooks for a specific engine."""
         engine_hooks = {
             f"{engine.name}_action_complete": self._on_engine_action_complete,
@@ -134,8 +290,39 @@ class RecursiveOrchestrator:
         for event, callback in engine_hooks.items():
             self.hook_system.register_hook(event, callback)
     
-    def trigger_recursive_improvement(self, context: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Trigger recursive improvements based on context."""
+    def trigger_recursive_improvement(self, context: str, metadata: Dict[str, Any] = None,
+                                      source: str = None) -> Dict[str, Any]:
+        """
+        Trigger recursive improvements based on context.
+        
+        Triggers pass admission control first: a trigger for a context whose
+        sweep is already running joins it, and triggers over the rate or
+        in-flight limits are rejected with ``reason`` and ``retry_after``.
+        The result's ``admission`` field says which of these happened.
+        """
+        source = source or (metadata or {}).get("source", "internal")
+        with tracer.span("orchestrator.trigger", context=context, source=source) as span:
+            outcome, result = self.admission.run(
+                context, context, source,
+                lambda: self._run_improvement_sweep(context, metadata)
+            )
+            span.set_attribute("admission", outcome)
+        TRIGGERS.labels(source, outcome).inc()
+        
+        if outcome == "rejected":
+            return {
+                "context": context,
+                "timestamp": datetime.now().isoformat(),
+                "engines_triggered": [],
+                "total_improvements": 0,
+                "metadata": metadata or {},
+                "admission": outcome,
+                **result
+            }
+        return {**result, "admission": outcome}
+    
+    def _run_improvement_sweep(self, context: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run every engine routed for ``context`` and record the results."""
         self.logger.info(f"Triggering recursive improvements for context: {context}")
         
         improvement_results = {
@@ -147,23 +334,40 @@ class RecursiveOrchestrator:
         }
         
         # Trigger relevant engines based on context
-        for engine_name, engine in self.engines.items():
-            if self._should_trigger_engine(engine, context):
-                try:
-                    result = engine.execute_with_compounding()
-                    improvement_results["engines_triggered"].append({
-                        "engine": engine_name,
-                        "result": result
-                    })
-                    
-                    if result.get("actions_executed"):
-                        improvement_results["total_improvements"] += len(result["actions_executed"])
-                    
-                except Exception as e:
-                    self.logger.error(f"Engine {engine_name} failed during trigger: {e}")
+        with tracer.span("orchestrator.route", context=context) as span:
+            engines = self._resolve_engines(self.route(context))
+            span.set_attribute("engines", len(engines))
+        
+        started = time.monotonic()
+        with tracer.span("orchestrator.fan_out", mode=self.execution_mode, engines=len(engines)):
+            if self.execution_mode == "async" and engines:
+                results, timed_out = self._execute_async(engines)
+            elif self.execution_mode == "parallel" and len(engines) > 1:
+                results, timed_out = self._execute_parallel(engines)
+            else:
+                results, timed_out = self._execute_sequential(engines), []
+        
+        # Report in registration order regardless of completion order
+        for engine_name, _ in engines:
+            if engine_name not in results:
+                continue
+            result = results[engine_name]
+            improvement_results["engines_triggered"].append({
+                "engine": engine_name,
+                "result": result
+            })
+            
+            if result.get("actions_executed"):
+                improvement_results["total_improvements"] += len(result["actions_executed"])
+        
+        improvement_results["engines_timed_out"] = timed_out
+        improvement_results["duration_seconds"] = round(time.monotonic() - started, 4)
+        for engine_name in timed_out:
+            ENGINE_TIMEOUTS.labels(engine_name).inc()
         
         # Update global counter
         self.total_improvements += improvement_results["total_improvements"]
+        IMPROVEMENTS.inc(improvement_results["total_improvements"])
         
         # Log the trigger event
         self.recursive_logger.log_action(
@@ -176,23 +380,206 @@ class RecursiveOrchestrator:
         # Trigger hooks
         self.hook_system.trigger_hook("recursive_improvement_complete", improvement_results)
         
+        SWEEP_SECONDS.observe(time.monotonic() - started)
         return improvement_results
     
-    def _should_trigger_engine(self, engine: RecursiveEngine, context: str) -> bool:
-        """Determine if an engine should be triggered for a given context."""
-        # Default logic - can be overridden per engine
-        engine_contexts = {
-            "workflow": ["feedback_loop", "workflow_automation", "experimentation"],
-            "validation": ["escalation_logic", "kpi_mutation"],
-            "content": ["content_stack", "asset_library", "playbook_generator"],
-            "monitoring": ["debrief_bot", "cloning_agent"]
+    def _execute_sequential(self, engines: List[tuple]) -> Dict[str, Dict[str, Any]]:
+        """Run engines one after another."""
+        results = {}
+        for engine_name, engine in engines:
+            try:
+                results[engine_name] = self.process_pool.execute(engine)
+            except Exception as e:
+                self.logger.error(f"Engine {engine_name} failed during trigger: {e}")
+        return results
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared engine pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="recursive-engine"
+                )
+            return self._executor
+    
+    def _execute_parallel(self, engines: List[tuple]) -> tuple:
+        """
+        Run engines on the shared pool and collect results as they complete.
+        Each engine's timeout counts from when it starts running, so engines
+        queued behind a full pool are not penalised for the wait. A timed-out
+        engine keeps its worker until it returns; it is reported, not killed.
+        """
+        executor = self._get_executor()
+        start_times: Dict[str, float] = {}
+        
+        def run(engine_name: str, engine: RecursiveEngine) -> Dict[str, Any]:
+            start_times[engine_name] = time.monotonic()
+            return self.process_pool.execute(engine)
+        
+        futures = {
+            executor.submit(bind_context(run), engine_name, engine): engine_name
+            for engine_name, engine in engines
         }
+        results = {}
+        timed_out = []
+        pending = set(futures)
         
-        for context_group, engines in engine_contexts.items():
-            if context_group in context.lower():
-                return any(eng in engine.name.lower() for eng in engines)
+        while pending:
+            deadlines = [
+                start_times[futures[future]] + self.engine_timeout
+                for future in pending if futures[future] in start_times
+            ]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else self.engine_timeout
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                engine_name = futures[future]
+                try:
+                    results[engine_name] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Engine {engine_name} failed during trigger: {e}")
+            
+            now = time.monotonic()
+            for future in list(pending):
+                engine_name = futures[future]
+                if engine_name in start_times and now - start_times[engine_name] >= self.engine_timeout:
+                    pending.discard(future)
+                    timed_out.append(engine_name)
+                    self.logger.warning(
+                        f"Engine {engine_name} timed out after {self.engine_timeout}s during trigger"
+                    )
         
-        return True  # Default to trigger all engines
+        order = {engine_name: index for index, (engine_name, _) in enumerate(engines)}
+        timed_out.sort(key=order.get)
+        return results, timed_out
+    
+    def _get_event_loop(self) -> "asyncio.AbstractEventLoop":
+        """Get the orchestrator's event loop, starting its thread on first use."""
+        # asyncio is only imported once async mode is used, it dominates CLI start-up time
+        import asyncio
+        with self._executor_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                # Sync engines wrapped by run_in_executor share this bounded pool
+                loop.set_default_executor(ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="recursive-async"
+                ))
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="recursive-event-loop",
+                    daemon=True
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+    
+    async def _run_engine_async(self, engine: RecursiveEngine) -> Dict[str, Any]:
+        """Run one engine on the event loop, CPU-class engines still go to worker processes."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        if self.process_pool.uses_process(engine):
+            return await loop.run_in_executor(None, bind_context(self.process_pool.execute), engine)
+        
+        started = time.perf_counter()
+        outcome = "error"
+        with tracer.span("engine.execute", engine=engine.name, backend="async") as span:
+            try:
+                # Fingerprinting hashes files, keep it off the event loop
+                fingerprint, cached = await loop.run_in_executor(None, bind_context(engine.memoized_result))
+                span.set_attribute("cached", cached is not None)
+                if cached is not None:
+                    outcome = "cached"
+                    return cached
+                result = await engine.execute_with_compounding_async()
+                engine.remember_result(fingerprint, result)
+                outcome = run_outcome(result)
+                return result
+            finally:
+                record_engine_run(engine.name, "async", started, outcome)
+    
+    async def _gather_engines(self, engines: List[tuple], trace: Any = None) -> tuple:
+        """Run engines concurrently with a per-engine timeout, within the caller's ``trace``."""
+        import asyncio
+        
+        async def run(engine_name: str, engine: RecursiveEngine):
+            try:
+                return "ok", await asyncio.wait_for(self._run_engine_async(engine), self.engine_timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    f"Engine {engine_name} timed out after {self.engine_timeout}s during trigger"
+                )
+                return "timeout", None
+            except Exception as e:
+                self.logger.error(f"Engine {engine_name} failed during trigger: {e}")
+                return "error", None
+        
+        # Tasks copy the current context when created, so they inherit the trace
+        with resume_trace(trace):
+            outcomes = await asyncio.gather(*(run(engine_name, engine) for engine_name, engine in engines))
+        
+        results = {}
+        timed_out = []
+        for (engine_name, _), (status, result) in zip(engines, outcomes):
+            if status == "ok":
+                results[engine_name] = result
+            elif status == "timeout":
+                timed_out.append(engine_name)
+        return results, timed_out
+    
+    def _execute_async(self, engines: List[tuple]) -> tuple:
+        """Drive engines on the orchestrator's event loop and wait for them."""
+        import asyncio
+        future = asyncio.run_coroutine_threadsafe(
+            self._gather_engines(engines, capture_trace()),
+            self._get_event_loop()
+        )
+        return future.result()
+    
+    def _engine_tags(self, engine: Union[RecursiveEngine, EngineSpec]) -> List[str]:
+        """Get the context tags an engine subscribes to."""
+        if engine.context_tags is not None:
+            return [tag.lower() for tag in engine.context_tags]
+        
+        name = engine.name.lower()
+        return [
+            tag for tag, engine_names in LEGACY_CONTEXT_GROUPS.items()
+            if any(engine_name in name for engine_name in engine_names)
+        ]
+    
+    def _index_engine(self, engine: Union[RecursiveEngine, EngineSpec]):
+        """Add an engine to the context tag index, replacing any previous entry."""
+        for subscribers in self._tag_index.values():
+            if engine.name in subscribers:
+                subscribers.remove(engine.name)
+        
+        for tag in self._engine_tags(engine):
+            self._tag_index.setdefault(tag, []).append(engine.name)
+        
+        self._route_cache.clear()
+    
+    def route(self, context: str) -> List[str]:
+        """
+        Return the names of the engines a trigger for ``context`` would fire,
+        without running them. The first known tag that occurs in the context
+        selects its subscribers; a context matching no tag fires every engine.
+        """
+        engine_names = self._route_cache.get(context)
+        if engine_names is None:
+            lowered = context.lower()
+            tag = next((tag for tag in self._tag_index if tag in lowered), None)
+            engine_names = tuple(self._tag_index[tag] if tag is not None else self.engines)
+            
+            if len(self._route_cache) >= ROUTE_CACHE_SIZE:
+                self._route_cache.clear()
+            self._route_cache[context] = engine_names
+        
+        return list(engine_names)
+    
+    def _should_trigger_engine(self, engine: RecursiveEngine, context: str) -> bool:
+        """Determine if an engine should be triggered for a given context."""
+        return engine.name in self.route(context)
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status."""
@@ -204,33 +591,70 @@ class RecursiveOrchestrator:
                 "active_engines": self.active_engines
             },
             "scheduler": self.scheduler.get_scheduler_status(),
+            "process_pool": self.process_pool.get_stats(),
+            "checkpoints": self.checkpoints.get_stats() if self.checkpoints else None,
+            "hooks": self.hook_system.get_stats(),
+            "admission": self.admission.get_stats(),
+            "registry": self.engines.get_stats(),
+            "tracing": tracer.get_stats(),
             "engines": {
-                name: engine.get_status() 
-                for name, engine in self.engines.items()
+                name: self.engines.status_of(name)
+                for name in self.engines
             },
+            # Loaded engines ranked by the wall time their actions have used
+            "resources": rank_engines({
+                name: engine.resources.summary()
+                for name, engine in self.engines.loaded().items()
+            }),
             "recent_activity": self.recursive_logger.get_improvement_summary()
         }
         
         return status
     
+    def _collect_metrics(self):
+        """Refresh the gauges that mirror queue depths and engine state."""
+        QUEUE_DEPTH.labels("hook_bus").set(self.hook_system.get_stats().get("queued", 0))
+        QUEUE_DEPTH.labels("log_writer").set(self.recursive_logger.get_writer_stats().get("queue_depth", 0))
+        QUEUE_DEPTH.labels("delayed_pre_actions").set(shared_delayed_executor().get_stats()["pending"])
+        TRIGGERS_IN_FLIGHT.set(self.admission.get_stats()["in_flight"])
+        
+        registered = self.engines.get_stats()
+        ENGINES.labels("loaded").set(registered["loaded"])
+        ENGINES.labels("pending").set(registered["registered"] - registered["loaded"])
+        UPTIME.set((datetime.now() - self.start_time).total_seconds() if self.start_time else 0)
+    
     def execute_engine(self, engine_name: str) -> Dict[str, Any]:
         """Manually execute a specific engine."""
         if engine_name not in self.engines:
             return {"error": f"Engine '{engine_name}' not found"}
         
+        if not self._resolve_engines([engine_name]):
+            return {"error": f"Engine '{engine_name}' failed to load"}
         return self.scheduler.execute_engine_now(engine_name)
     
+    def save_checkpoints(self) -> int:
+        """Checkpoint every engine whose state changed since the last save."""
+        if self.checkpoints is None:
+            return 0
+        return self.checkpoints.save_all(list(self.engines.loaded().values()))
+    
     def shutdown(self):
         """Gracefully shutdown the orchestrator."""
         self.logger.info("Shutting down Recursive Orchestrator")
+        metrics.remove_collector(self._collect_metrics)
         
         # Stop scheduler
         self.scheduler.stop_scheduler()
         
+        # Run any debounced hook events while the engines are still up
+        self.hook_system.stop()
+        
         # Stop all engines
-        for engine in self.engines.values():
+        for engine in self.engines.loaded().values():
             engine.stop()
         
+        self.save_checkpoints()
+        
         # Log shutdown
         self.recursive_logger.log_action(
             "orchestrator",
@@ -241,17 +665,36 @@ class RecursiveOrchestrator:
             },
             {"graceful": True}
         )
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop_thread.join(timeout=5)
+            if not loop.is_running():
+                loop.close()
+        self.process_pool.shutdown(wait=False)
+        self.recursive_logger.close()
+        
+        export_path = tracer.settings.get("export_path")
+        if export_path and tracer.spans:
+            try:
+                tracer.export_chrome_trace(export_path)
+            except Exception as e:
+                self.logger.error(f"Failed to export trace to {export_path}: {e}")
         
         self.logger.info("Recursive Orchestrator shut down complete")
     
     # Hook callback methods
     def _on_workflow_start(self, *args, **kwargs):
         """Handle workflow start events."""
-        self.trigger_recursive_improvement("workflow_start", kwargs)
+        self.trigger_recursive_improvement("workflow_start", kwargs, source="hook")
     
     def _on_workflow_complete(self, *args, **kwargs):
         """Handle workflow completion events."""
-        self.trigger_recursive_improvement("workflow_complete", kwargs)
+        self.trigger_recursive_improvement("workflow_complete", kwargs, source="hook")
     
     def _on_status_update(self, *args, **kwargs):
         """Handle status update events."""
@@ -263,7 +706,7 @@ class RecursiveOrchestrator:
     
     def _on_system_validation(self, *args, **kwargs):
         """Handle system validation events."""
-        self.trigger_recursive_improvement("system_validation", kwargs)
+        self.trigger_recursive_improvement("system_validation", kwargs, source="hook")
     
     def _on_engine_action_complete(self, *args, **kwargs):
         """Handle engine action completion."""
@@ -0,0 +1,223 @@
+"""
+Engine Process Pool - Runs CPU-bound recursive engines in worker processes
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .base import RecursiveEngine
+from .log_config import DEFAULT_FORMAT
+from .metrics_registry import registry
+from .tracing import tracer
+
+# multiprocessing is imported when the pool is first used, most commands never need it
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+ENGINE_SECONDS = registry.histogram(
+    "recursive_engine_duration_seconds",
+    "Wall time of engine runs, including memo checks and worker round trips",
+    ("engine", "backend"),
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+)
+ENGINE_RUNS = registry.counter(
+    "recursive_engine_runs_total",
+    "Engine runs by outcome: ok, error or cached",
+    ("engine", "outcome")
+)
+
+
+def record_engine_run(engine_name: str, backend: str, started: float, outcome: str):
+    """Observe an engine run that began at ``started`` (``time.perf_counter``)."""
+    ENGINE_SECONDS.labels(engine_name, backend).observe(time.perf_counter() - started)
+    ENGINE_RUNS.labels(engine_name, outcome).inc()
+
+
+def run_outcome(result: Any) -> str:
+    """Outcome label for an engine result dict."""
+    return "error" if not isinstance(result, dict) or "error" in result else "ok"
+
+
+# Engine instances kept alive inside each worker process, keyed by class
+_worker_engines: Dict[type, Tuple[Dict[str, Any], RecursiveEngine]] = {}
+
+# Directory holding the recursive_improvement package, the default worker cwd
+PACKAGE_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+def _init_worker(level: int, cwd: str):
+    """Give worker processes a plain stderr logging setup and a fixed cwd."""
+    os.chdir(cwd)
+    logging.basicConfig(level=level, format=DEFAULT_FORMAT)
+
+
+def _execute_in_worker(engine_cls: type, config: Dict[str, Any],
+                       state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[tuple]]:
+    """
+    Run one compounding execution of an engine and return its result, new
+    state and the result's encoded payload.
+    """
+    cached = _worker_engines.get(engine_cls)
+    if cached is None or cached[0] != config:
+        engine = engine_cls(config)
+        if not engine.start():
+            raise RuntimeError(f"Failed to start {engine.name} in worker process")
+        _worker_engines[engine_cls] = (config, engine)
+    else:
+        engine = cached[1]
+
+    engine.import_state(state)
+    engine.unstored_payload = None
+    result = engine.execute_with_compounding()
+    return result, engine.export_state(), engine.unstored_payload
+
+
+class EngineProcessPool:
+    """
+    Dispatches engines with ``execution_class = "cpu"`` to a
+    ``ProcessPoolExecutor`` so GIL-bound analysis can use every core.
+    Engines are rebuilt from their class and config in the worker, run with
+    the parent's exported state, and the resulting state is imported back
+    into the parent engine, so runs of one engine are dispatched one at a
+    time. Workers run from ``worker_cwd`` (by default the directory holding
+    the package), not the parent's cwd. Other engines run inline on the
+    calling thread.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.config = config or {}
+        self.enabled = self.config.get("enabled", True)
+        self.max_workers = self.config.get("max_workers")
+        self.worker_cwd = self.config.get("worker_cwd", PACKAGE_ROOT)
+        self.logger = logging.getLogger("recursive.process_pool")
+        self._executor: Optional["ProcessPoolExecutor"] = None
+        self._lock = threading.Lock()
+        # Held from a CPU engine's memo check until its worker state is imported back
+        self._engine_locks: Dict[str, threading.Lock] = {}
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "fallbacks": 0}
+
+    def uses_process(self, engine: RecursiveEngine) -> bool:
+        """Check whether an engine is dispatched to a worker process."""
+        return self.enabled and engine.execution_class == "cpu"
+
+    def _get_executor(self) -> "ProcessPoolExecutor":
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        with self._lock:
+            if self._executor is None:
+                # Spawn rather than fork, the parent runs logging and writer threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(logging.getLogger().getEffectiveLevel(), self.worker_cwd)
+                )
+            return self._executor
+
+    def _dispatch_lock(self, engine: RecursiveEngine, backend: str):
+        if backend == "inline":
+            return nullcontext()
+        with self._lock:
+            return self._engine_locks.setdefault(engine.name, threading.Lock())
+
+    def _ensure_cwd(self):
+        # Starting a spawn worker reads the parent's cwd, which fails once that
+        # directory is removed. Relative paths are already broken then, so move on
+        try:
+            os.getcwd()
+        except FileNotFoundError:
+            self.logger.warning(f"Working directory was removed, moving to {self.worker_cwd}")
+            os.chdir(self.worker_cwd)
+
+    def submit(self, engine: RecursiveEngine) -> Future:
+        """Start an execution of ``engine`` in a worker process."""
+        with self._lock:
+            self._stats["submitted"] += 1
+        # Workers are started on demand by submit
+        self._ensure_cwd()
+        return self._get_executor().submit(
+            _execute_in_worker, type(engine), engine.config, engine.export_state()
+        )
+
+    def collect(self, engine: RecursiveEngine, future: Future,
+                timeout: float = None) -> Dict[str, Any]:
+        """Wait for a submitted execution and marshal its state back into ``engine``."""
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            result, state, payload = future.result(timeout)
+        except BrokenProcessPool as e:
+            self.logger.error(f"Worker process for {engine.name} died: {e}, running inline")
+            with self._lock:
+                self._stats["fallbacks"] += 1
+                self._executor = None
+            return engine.execute_with_compounding()
+        except Exception:
+            with self._lock:
+                self._stats["failed"] += 1
+            raise
+
+        engine.import_state(state)
+        # The worker has no logger and encoded the result already, the parent only stores it
+        if engine.recursive_logger is not None and payload is not None:
+            engine.recursive_logger.store_encoded_payload(*payload)
+        with self._lock:
+            self._stats["completed"] += 1
+        return result
+
+    def execute(self, engine: RecursiveEngine, timeout: float = None) -> Dict[str, Any]:
+        """
+        Run ``engine.execute_with_compounding`` in the right execution backend,
+        or return the engine's memoized result if its inputs are unchanged.
+        """
+        backend = "process" if self.uses_process(engine) else "inline"
+        started = time.perf_counter()
+        outcome = "error"
+        with tracer.span("engine.execute", engine=engine.name, backend=backend) as span:
+            try:
+                # A worker returns a whole state snapshot, so a concurrent run of the
+                # same engine would overwrite the other's. The second one waits, and
+                # may find the first one's memoized result
+                with self._dispatch_lock(engine, backend):
+                    # Fingerprint in the parent so an unchanged CPU engine never reaches a worker
+                    fingerprint, cached = engine.memoized_result()
+                    span.set_attribute("cached", cached is not None)
+                    if cached is not None:
+                        outcome = "cached"
+                        return cached
+                    
+                    if backend == "inline":
+                        result = engine.execute_with_compounding()
+                    elif not engine.is_running:
+                        return {"error": "Engine not running"}
+                    else:
+                        # Spans inside the worker process are not recorded, this one covers the whole run
+                        result = self.collect(engine, self.submit(engine), timeout)
+                    engine.remember_result(fingerprint, result)
+                    outcome = run_outcome(result)
+                    return result
+            finally:
+                record_engine_run(engine.name, backend, started, outcome)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get process pool statistics."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "active": self._executor is not None,
+                "max_workers": self.max_workers or os.cpu_count(),
+                **self._stats
+            }
@@ -0,0 +1,141 @@
+"""
+Engine Registry - Lazily imported and initialized recursive engines
+"""
+
+import importlib
+import logging
+import threading
+import time
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from .base import RecursiveEngine
+
+
+class EngineSpec:
+    """
+    An engine named by import path (``"package.module:ClassName"``). The
+    name and context tags are declared up front so the orchestrator can
+    route to the engine before its module has been imported.
+    """
+
+    __slots__ = ("name", "path", "context_tags", "config")
+
+    def __init__(self, name: str, path: str, context_tags: Optional[tuple] = None,
+                 config: Dict[str, Any] = None):
+        self.name = name
+        self.path = path
+        self.context_tags = context_tags
+        self.config = config
+
+    def load_class(self) -> type:
+        """Import the engine module and return the engine class."""
+        module_name, _, class_name = self.path.partition(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def __repr__(self) -> str:
+        return f"EngineSpec({self.name!r}, {self.path!r})"
+
+
+class LazyEngineRegistry(MutableMapping):
+    """
+    Engine name -> engine mapping in registration order. Entries added with
+    ``add_spec`` are imported, constructed and passed to ``on_load`` the first
+    time they are looked up; membership tests, iteration over names and
+    ``len`` never load anything.
+    """
+
+    def __init__(self, on_load: Callable[[RecursiveEngine], Any] = None):
+        self.on_load = on_load
+        self.logger = logging.getLogger("recursive.registry")
+        self._entries: Dict[str, Union[RecursiveEngine, EngineSpec]] = {}
+        self._lock = threading.RLock()
+        self.load_stats: Dict[str, Dict[str, float]] = {}
+
+    def add_spec(self, spec: EngineSpec):
+        """Register an engine to be loaded on first use."""
+        with self._lock:
+            self._entries[spec.name] = spec
+
+    def __getitem__(self, name: str) -> RecursiveEngine:
+        entry = self._entries[name]
+        if isinstance(entry, EngineSpec):
+            return self._load(name)
+        return entry
+
+    def __setitem__(self, name: str, engine: RecursiveEngine):
+        with self._lock:
+            self._entries[name] = engine
+
+    def __delitem__(self, name: str):
+        with self._lock:
+            del self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether an engine has been imported and constructed."""
+        return not isinstance(self._entries.get(name), EngineSpec)
+
+    def loaded(self) -> Dict[str, RecursiveEngine]:
+        """Engines that have been loaded, without loading any others."""
+        return {
+            name: entry for name, entry in list(self._entries.items())
+            if not isinstance(entry, EngineSpec)
+        }
+
+    def pending(self) -> List[str]:
+        """Names of engines not loaded yet."""
+        return [name for name, entry in list(self._entries.items()) if isinstance(entry, EngineSpec)]
+
+    def load_all(self) -> Dict[str, RecursiveEngine]:
+        """Load every pending engine, skipping ones that fail to load."""
+        for name in self.pending():
+            try:
+                self[name]
+            except Exception as e:
+                self.logger.error(f"Failed to load engine {name}: {e}")
+        return self.loaded()
+
+    def _load(self, name: str) -> RecursiveEngine:
+        with self._lock:
+            spec = self._entries[name]
+            if not isinstance(spec, EngineSpec):
+                return spec  # Loaded by another thread while we waited
+
+            started = time.perf_counter()
+            engine_cls = spec.load_class()
+            imported = time.perf_counter()
+            engine = engine_cls(spec.config)
+            if engine.name != spec.name:
+                self.logger.warning(f"Engine spec {spec.name} built an engine named {engine.name}")
+            self._entries[name] = engine
+            if self.on_load is not None:
+                self.on_load(engine)
+            finished = time.perf_counter()
+
+        self.load_stats[name] = {"import": imported - started, "init": finished - imported}
+        self.logger.info(f"Loaded engine {name} in {(finished - started) * 1000:.1f}ms")
+        return engine
+
+    def status_of(self, name: str) -> Dict[str, Any]:
+        """Engine status, with a placeholder for engines not loaded yet."""
+        entry = self._entries[name]
+        if isinstance(entry, EngineSpec):
+            return {"name": name, "running": False, "loaded": False, "path": entry.path, "total_executions": 0}
+        return {**entry.get_status(), "loaded": True}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics."""
+        return {
+            "registered": len(self._entries),
+            "loaded": len(self.loaded()),
+            "load_seconds": {name: round(stats["import"] + stats["init"], 4) for name, stats in self.load_stats.items()}
+        }
@@ -0,0 +1,227 @@
+"""
+Resource Meter - Per-run wall time, CPU time, peak RSS and allocation sites for engines
+"""
+
+import math
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows, RSS deltas are left out there
+    resource = None
+
+
+PERCENTILES = (50, 90, 99)
+
+# tracemalloc is process-wide. Meters share it and stop it once the last traced
+# run ends, unless something else had already started it
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+def _start_tracing():
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_owned = True
+        _tracemalloc_users += 1
+
+
+def _stop_tracing():
+    global _tracemalloc_users, _tracemalloc_owned
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_owned:
+            tracemalloc.stop()
+            _tracemalloc_owned = False
+
+
+def peak_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes, None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def percentiles(values: Iterable[float], points: tuple = PERCENTILES) -> Dict[str, float]:
+    """Nearest-rank percentiles and the maximum of ``values``."""
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+    summary = {
+        f"p{point}": ordered[max(0, math.ceil(point / 100 * len(ordered)) - 1)]
+        for point in points
+    }
+    summary["max"] = ordered[-1]
+    return summary
+
+
+class ResourceSample:
+    """Resources used by one run of an engine action."""
+
+    __slots__ = ("timestamp", "wall", "cpu", "rss_delta", "allocations")
+
+    def __init__(self, timestamp: float, wall: float, cpu: Optional[float],
+                 rss_delta: Optional[int], allocations: Optional[List[Dict[str, Any]]] = None):
+        self.timestamp = timestamp
+        self.wall = wall
+        self.cpu = cpu
+        self.rss_delta = rss_delta
+        self.allocations = allocations
+
+
+class ResourceMeter:
+    """
+    Measures engine actions and keeps a window of samples per action type
+    ("main", "pre") for percentile summaries. CPU time is the running
+    thread's, so it is exact for an action even while others run
+    concurrently. The RSS figure is how far a run raised the process's
+    peak RSS, and tracemalloc sites are process-wide, so both can include
+    other engines running at the same time.
+    """
+
+    DEFAULT_SETTINGS = {
+        "window": 200,           # Samples kept per action type
+        "tracemalloc": False,    # Record top allocation sites, slows runs noticeably
+        "tracemalloc_top": 5
+    }
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.settings = {**self.DEFAULT_SETTINGS, **(config or {})}
+        self.samples: Dict[str, deque] = {}
+        self.runs: Dict[str, int] = {}
+        self.totals: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, action_type: str, cpu: bool = True):
+        """
+        Record the resources used by the enclosed block, even if it raises.
+        Pass ``cpu=False`` when the block shares its thread with unrelated
+        work (e.g. a native coroutine), so only wall time is meaningful.
+        """
+        traced = self.settings["tracemalloc"]
+        if traced:
+            _start_tracing()
+            before = tracemalloc.take_snapshot()
+        rss_before = peak_rss()
+        cpu_before = time.thread_time() if cpu else None
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - started
+            cpu_time = time.thread_time() - cpu_before if cpu else None
+            rss_after = peak_rss()
+            allocations = None
+            if traced:
+                allocations = self._top_allocations(before, tracemalloc.take_snapshot())
+                _stop_tracing()
+            self.record(action_type, ResourceSample(
+                time.time(),
+                wall,
+                cpu_time,
+                rss_after - rss_before if rss_before is not None else None,
+                allocations
+            ))
+
+    def _top_allocations(self, before, after) -> List[Dict[str, Any]]:
+        """Source lines that grew the most between two snapshots."""
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        diffs = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        top = []
+        for diff in diffs:
+            if diff.size_diff <= 0:
+                continue
+            frame = diff.traceback[0]
+            top.append({
+                "site": f"{frame.filename}:{frame.lineno}",
+                "size_diff": diff.size_diff,
+                "count_diff": diff.count_diff
+            })
+            if len(top) >= self.settings["tracemalloc_top"]:
+                break
+        return top
+
+    def record(self, action_type: str, sample: ResourceSample):
+        """Add a sample for ``action_type``."""
+        with self._lock:
+            window = self.samples.get(action_type)
+            if window is None:
+                window = self.samples[action_type] = deque(maxlen=self.settings["window"])
+            window.append(sample)
+            self.runs[action_type] = self.runs.get(action_type, 0) + 1
+            totals = self.totals.setdefault(action_type, {"wall": 0.0, "cpu": 0.0})
+            totals["wall"] += sample.wall
+            totals["cpu"] += sample.cpu or 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Per action type: run count, totals and percentiles over the sample window."""
+        with self._lock:
+            windows = {action_type: list(window) for action_type, window in self.samples.items()}
+            runs = dict(self.runs)
+            totals = {action_type: dict(values) for action_type, values in self.totals.items()}
+
+        summary = {}
+        for action_type, samples in windows.items():
+            allocations = next((s.allocations for s in reversed(samples) if s.allocations is not None), None)
+            summary[action_type] = {
+                "runs": runs[action_type],
+                "wall_total": totals[action_type]["wall"],
+                "cpu_total": totals[action_type]["cpu"],
+                "wall": percentiles(s.wall for s in samples),
+                "cpu": percentiles(s.cpu for s in samples if s.cpu is not None),
+                "rss_delta": percentiles(s.rss_delta for s in samples if s.rss_delta is not None),
+                "top_allocations": allocations
+            }
+        return summary
+
+    def export_state(self) -> Dict[str, Any]:
+        """Samples and totals as plain data, for checkpoints and worker processes."""
+        with self._lock:
+            return {
+                "samples": {action_type: list(window) for action_type, window in self.samples.items()},
+                "runs": dict(self.runs),
+                "totals": {action_type: dict(values) for action_type, values in self.totals.items()}
+            }
+
+    def import_state(self, state: Dict[str, Any]):
+        """Replace samples and totals, keeping this meter's settings."""
+        with self._lock:
+            self.samples = {
+                action_type: deque(samples, maxlen=self.settings["window"])
+                for action_type, samples in state.get("samples", {}).items()
+            }
+            self.runs = dict(state.get("runs", {}))
+            self.totals = {action_type: dict(values) for action_type, values in state.get("totals", {}).items()}
+
+
+def rank_engines(summaries: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Engines ordered by total wall time across their actions, with each one's
+    share of the combined total.
+    """
+    ranking = []
+    for name, summary in summaries.items():
+        ranking.append({
+            "engine": name,
+            "runs": summary.get("main", {}).get("runs", 0),
+            "wall_total": sum(action["wall_total"] for action in summary.values()),
+            "cpu_total": sum(action["cpu_total"] for action in summary.values()),
+            "wall_p90": summary.get("main", {}).get("wall", {}).get("p90")
+        })
+
+    combined = sum(entry["wall_total"] for entry in ranking)
+    for entry in ranking:
+        entry["wall_share"] = entry["wall_total"] / combined if combined else 0.0
+    ranking.sort(key=lambda entry: entry["wall_total"], reverse=True)
+    return ranking
@@ -0,0 +1,244 @@
+"""
+Metric Rollups - Multi-resolution downsampling of recursive improvement metrics
+"""
+
+import base64
+import json
+import logging
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Resolution name -> bucket width in seconds
+RESOLUTIONS = {"1m": 60, "1h": 3600, "1d": 86400}
+
+# Buckets kept per series: one day of minutes, 90 days of hours, 10 years of days
+DEFAULT_CAPACITY = {"1m": 1440, "1h": 24 * 90, "1d": 3650}
+
+
+class RollupTier:
+    """
+    Fixed-width bucket arrays (start/count/min/max/sum/last and the time of
+    the last point) for one series at one resolution. Once over capacity the
+    oldest quarter is discarded.
+    """
+
+    __slots__ = ("resolution", "capacity", "start", "count", "min", "max", "sum", "last", "last_at")
+
+    COLUMNS = ("start", "count", "min", "max", "sum", "last", "last_at")
+
+    def __init__(self, resolution: int, capacity: int):
+        self.resolution = resolution
+        self.capacity = capacity
+        self.start = array("q")
+        self.count = array("q")
+        self.min = array("d")
+        self.max = array("d")
+        self.sum = array("d")
+        self.last = array("d")
+        self.last_at = array("d")
+
+    def add(self, timestamp: float, value: float) -> bool:
+        """Fold a point into its bucket. Returns False for points older than the tier."""
+        bucket = int(timestamp // self.resolution) * self.resolution
+
+        if self.start and bucket < self.start[-1]:
+            position = bisect_left(self.start, bucket)
+            if position == len(self.start) or self.start[position] != bucket:
+                return False
+        elif not self.start or bucket > self.start[-1]:
+            self.start.append(bucket)
+            self.count.append(0)
+            self.min.append(value)
+            self.max.append(value)
+            self.sum.append(0.0)
+            self.last.append(value)
+            self.last_at.append(timestamp)
+            position = len(self.start) - 1
+            if len(self.start) > self.capacity + self.capacity // 4:
+                self._trim()
+                position = len(self.start) - 1
+        else:
+            position = len(self.start) - 1
+
+        self.count[position] += 1
+        self.sum[position] += value
+        if value < self.min[position]:
+            self.min[position] = value
+        if value > self.max[position]:
+            self.max[position] = value
+        if timestamp >= self.last_at[position]:
+            self.last[position] = value
+            self.last_at[position] = timestamp
+        return True
+
+    def _trim(self):
+        excess = len(self.start) - self.capacity
+        for column in self._columns():
+            del column[:excess]
+
+    def _columns(self) -> Tuple[array, ...]:
+        return (self.start, self.count, self.min, self.max, self.sum, self.last, self.last_at)
+
+    def buckets(self, start: float = None, end: float = None) -> List[Dict[str, Any]]:
+        """Return buckets whose start lies in ``start <= t <= end``."""
+        low = 0 if start is None else bisect_left(self.start, int(start // self.resolution) * self.resolution)
+        high = len(self.start) if end is None else bisect_right(self.start, end)
+        return [
+            {
+                "start": self.start[i],
+                "count": self.count[i],
+                "min": self.min[i],
+                "max": self.max[i],
+                "sum": self.sum[i],
+                "last": self.last[i],
+                "last_at": self.last_at[i],
+                "avg": self.sum[i] / self.count[i] if self.count[i] else 0.0
+            }
+            for i in range(low, high)
+        ]
+
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            name: base64.b64encode(column.tobytes()).decode("ascii")
+            for name, column in zip(self.COLUMNS, self._columns())
+        }
+
+    def load(self, data: Dict[str, str]):
+        for name, column in zip(self.COLUMNS, self._columns()):
+            del column[:]
+            if name in data:
+                column.frombytes(base64.b64decode(data[name]))
+        # Saved before last_at was kept, the bucket start is the best guess
+        if len(self.last_at) != len(self.start):
+            self.last_at = array("d", self.start)
+
+
+class MetricRollups:
+    """
+    Maintains 1-minute, 1-hour and 1-day rollups per ``(engine, metric)``
+    series, updated on ingest. Only numeric values are rolled up.
+    """
+
+    def __init__(self, capacity: Dict[str, int] = None):
+        self.capacity = {**DEFAULT_CAPACITY, **(capacity or {})}
+        self.series: Dict[Tuple[Optional[str], str], Dict[str, RollupTier]] = {}
+        # Timestamp of the newest point folded in, used to resume after restart
+        self.watermark = 0.0
+        self.logger = logging.getLogger("recursive.rollups")
+
+    def ingest(self, engine: Optional[str], metric: str, timestamp: float, value: Any) -> bool:
+        """Fold a metric point into every tier. Non-numeric values are ignored."""
+        # Ignored points advance the watermark too, a restart need not revisit them
+        if timestamp > self.watermark:
+            self.watermark = timestamp
+        if isinstance(value, bool):
+            value = float(value)
+        elif isinstance(value, (int, float)):
+            value = float(value)
+        else:
+            return False
+
+        tiers = self.series.get((engine, metric))
+        if tiers is None:
+            tiers = self.series[(engine, metric)] = {
+                name: RollupTier(width, self.capacity[name])
+                for name, width in RESOLUTIONS.items()
+            }
+
+        for tier in tiers.values():
+            tier.add(timestamp, value)
+        return True
+
+    def query(self, metric: str, engine: str = None, resolution: str = "1h",
+              start: float = None, end: float = None) -> List[Dict[str, Any]]:
+        """
+        Return rollup buckets for a metric. Without ``engine`` the buckets of
+        every engine reporting that metric are merged.
+        """
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution '{resolution}', expected one of {list(RESOLUTIONS)}")
+
+        if engine is not None:
+            tiers = self.series.get((engine, metric))
+            return tiers[resolution].buckets(start, end) if tiers else []
+
+        merged: Dict[int, Dict[str, Any]] = {}
+        for (_, name), tiers in self.series.items():
+            if name != metric:
+                continue
+            for bucket in tiers[resolution].buckets(start, end):
+                current = merged.get(bucket["start"])
+                if current is None:
+                    merged[bucket["start"]] = bucket
+                    continue
+                current["count"] += bucket["count"]
+                current["sum"] += bucket["sum"]
+                current["min"] = min(current["min"], bucket["min"])
+                current["max"] = max(current["max"], bucket["max"])
+                if bucket["last_at"] >= current["last_at"]:
+                    current["last"] = bucket["last"]
+                    current["last_at"] = bucket["last_at"]
+                current["avg"] = current["sum"] / current["count"]
+        return [merged[key] for key in sorted(merged)]
+
+    def series_keys(self) -> List[Tuple[Optional[str], str]]:
+        """Return all rolled-up ``(engine, metric)`` series."""
+        return list(self.series)
+
+    def save(self, path: Path):
+        """Persist all tiers to ``path`` atomically."""
+        data = {
+            "watermark": self.watermark,
+            "series": [
+                {
+                    "engine": engine,
+                    "metric": metric,
+                    "tiers": {name: tier.to_dict() for name, tier in tiers.items()}
+                }
+                for (engine, metric), tiers in self.series.items()
+            ]
+        }
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def load(self, path: Path) -> bool:
+        """Load tiers previously written by ``save``."""
+        path = Path(path)
+        if not path.exists():
+            return False
+
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            for item in data.get("series", []):
+                tiers = {}
+                for name, width in RESOLUTIONS.items():
+                    tier = RollupTier(width, self.capacity[name])
+                    if name in item["tiers"]:
+                        tier.load(item["tiers"][name])
+                    tiers[name] = tier
+                self.series[(item["engine"], item["metric"])] = tiers
+            self.watermark = data.get("watermark", 0.0)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to load rollups from {path}: {e}")
+            self.series.clear()
+            self.watermark = 0.0
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rollup statistics."""
+        return {
+            "series": len(self.series),
+            "buckets": {
+                name: sum(len(tiers[name].start) for tiers in self.series.values())
+                for name in RESOLUTIONS
+            },
+            "watermark": self.watermark
+        }
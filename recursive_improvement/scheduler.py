@@ -2,41 +2,57 @@
 Recursive Scheduler - Manages timing and orchestration of recursive improvements
 """
 
-import asyncio
-import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Callable
 import logging
-import schedule
 
 from .base import RecursiveEngine
+from .deadline_scheduler import DeadlineScheduler
+from .engine_dag import EngineDAG
 from .logger import RecursiveLogger
+from .process_pool import EngineProcessPool
+from .tracing import traced
+
+
+# Built-in jobs; each entry takes "interval" (seconds) or "cron", plus optional "jitter"
+DEFAULT_SCHEDULES = {
+    "weekly_cycle": {"cron": "0 2 * * 1"},      # Monday 02:00
+    "daily_health_check": {"cron": "0 1 * * *"},
+    "collect_metrics": {"interval": 3600}
+}
 
 
 class RecursiveScheduler:
     """Scheduler that manages recursive improvement engine execution."""
     
-    def __init__(self, logger: RecursiveLogger):
+    def __init__(self, logger: RecursiveLogger, process_pool: EngineProcessPool = None,
+                 config: Dict[str, Any] = None):
         self.engines: Dict[str, RecursiveEngine] = {}
         self.logger_instance = logger
+        self.process_pool = process_pool or EngineProcessPool({"enabled": False})
+        self.config = config or {}
         self.logger = logging.getLogger("recursive.scheduler")
         self.is_running = False
-        self.scheduler_thread = None
+        self.timer = DeadlineScheduler(max_workers=self.config.get("max_workers", 4))
+        self.last_cycle: Optional[Dict[str, Any]] = None
+        # Called before the weekly cycle so lazily registered engines take part
+        self.engine_loader: Optional[Callable[[], Any]] = None
         
         # Schedule recurring tasks
         self._setup_schedules()
     
     def _setup_schedules(self):
         """Set up the basic scheduling framework."""
-        # Weekly main cycles
-        schedule.every().monday.at("02:00").do(self._execute_weekly_cycle)
-        
-        # Daily health checks
-        schedule.every().day.at("01:00").do(self._daily_health_check)
+        callbacks = {
+            "weekly_cycle": self._execute_weekly_cycle,
+            "daily_health_check": self._daily_health_check,
+            "collect_metrics": self._collect_metrics
+        }
+        schedules = {**DEFAULT_SCHEDULES, **self.config.get("schedules", {})}
         
-        # Hourly metrics collection
-        schedule.every().hour.do(self._collect_metrics)
+        for job_name, callback in callbacks.items():
+            self.timer.add_job(job_name, callback, **schedules[job_name])
     
     def register_engine(self, engine: RecursiveEngine):
         """Register a recursive engine for scheduling."""
@@ -48,21 +64,30 @@ class RecursiveScheduler:
             self.logger.info(f"Engine {engine.name} started successfully")
         else:
             self.logger.error(f"Failed to start engine: {engine.name}")
+        
+        # Engines may run on their own cadence in addition to the weekly cycle
+        engine_schedule = engine.config.get("schedule")
+        if engine_schedule:
+            try:
+                self.timer.add_job(
+                    f"engine:{engine.name}",
+                    lambda: self._execute_scheduled_engine(engine.name),
+                    **engine_schedule
+                )
+            except (TypeError, ValueError) as e:
+                self.logger.error(f"Invalid schedule for engine {engine.name}: {e}")
     
     def start_scheduler(self):
         """Start the scheduler in a background thread."""
         if not self.is_running:
             self.is_running = True
-            self.scheduler_thread = threading.Thread(target=self._run_scheduler)
-            self.scheduler_thread.daemon = True
-            self.scheduler_thread.start()
+            self.timer.start()
             self.logger.info("Recursive scheduler started")
     
     def stop_scheduler(self):
         """Stop the scheduler."""
         self.is_running = False
-        if self.scheduler_thread:
-            self.scheduler_thread.join(timeout=5)
+        self.timer.stop()
         
         # Stop all engines
         for engine in self.engines.values():
@@ -70,48 +95,76 @@ class RecursiveScheduler:
         
         self.logger.info("Recursive scheduler stopped")
     
-    def _run_scheduler(self):
-        """Main scheduler loop."""
-        while self.is_running:
-            try:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-            except Exception as e:
-                self.logger.error(f"Scheduler error: {e}")
-                time.sleep(60)  # Continue running even if there's an error
+    @traced("scheduler.scheduled_engine")
+    def _execute_scheduled_engine(self, engine_name: str):
+        """Run an engine from its own schedule."""
+        engine = self.engines.get(engine_name)
+        if engine is None:
+            return
+        
+        result = self.process_pool.execute(engine)
+        self.logger_instance.log_action(
+            engine_name,
+            "scheduled_execution",
+            result,
+            {"triggered_by": "engine_schedule", "scheduled": True}
+        )
     
-    def _execute_weekly_cycle(self):
-        """Execute the weekly recursive improvement cycle."""
+    @traced("scheduler.weekly_cycle")
+    def _execute_weekly_cycle(self) -> Dict[str, Any]:
+        """Execute the weekly recursive improvement cycle as a dependency DAG."""
         self.logger.info("Starting weekly recursive improvement cycle")
         
         cycle_results = {
             "timestamp": datetime.now().isoformat(),
             "engines_executed": [],
+            "engines_skipped": [],
             "total_actions": 0,
             "errors": []
         }
         
-        # Execute all engines with compounding logic
-        for engine_name, engine in self.engines.items():
-            try:
-                self.logger.info(f"Executing weekly cycle for {engine_name}")
-                result = engine.execute_with_compounding()
-                
-                cycle_results["engines_executed"].append(engine_name)
-                cycle_results["total_actions"] += len(result.get("actions_executed", []))
-                
-                # Log the execution
-                self.logger_instance.log_action(
-                    engine_name, 
-                    "weekly_cycle", 
-                    result,
-                    {"cycle_type": "weekly", "scheduled": True}
-                )
-                
-            except Exception as e:
-                error_msg = f"Engine {engine_name} failed: {e}"
+        if self.engine_loader is not None:
+            self.engine_loader()
+        
+        # Independent engines run side by side, CPU-class ones in worker processes
+        started = time.monotonic()
+        dag = EngineDAG(self.engines)
+        outcomes = dag.run(self.process_pool.execute, max_workers=self.config.get("cycle_workers", 4))
+        
+        # The DAG's snapshot, an engine registered mid-cycle has no outcome yet
+        for engine_name in dag.engines:
+            outcome = outcomes[engine_name]
+            if outcome["status"] == "skipped":
+                cycle_results["engines_skipped"].append({"engine": engine_name, "reason": outcome["reason"]})
+                self.logger.warning(f"Skipped {engine_name} in weekly cycle: {outcome['reason']}")
+                continue
+            if outcome["status"] == "failed":
+                error_msg = f"Engine {engine_name} failed: {outcome['error']}"
                 cycle_results["errors"].append(error_msg)
                 self.logger.error(error_msg)
+                continue
+            
+            result = outcome["result"]
+            cycle_results["engines_executed"].append(engine_name)
+            cycle_results["total_actions"] += len(result.get("actions_executed", []))
+            
+            # Log the execution
+            self.logger_instance.log_action(
+                engine_name, 
+                "weekly_cycle", 
+                result,
+                {"cycle_type": "weekly", "scheduled": True, "started_offset": outcome["started"]}
+            )
+        
+        cycle_results["critical_path"] = dag.critical_path(outcomes)
+        cycle_results["duration_seconds"] = round(time.monotonic() - started, 4)
+        self.last_cycle = {
+            "timestamp": cycle_results["timestamp"],
+            "duration_seconds": cycle_results["duration_seconds"],
+            "critical_path": cycle_results["critical_path"],
+            "skipped": len(cycle_results["engines_skipped"]),
+            "errors": len(cycle_results["errors"])
+        }
         
         # Log overall cycle completion
         self.logger_instance.log_action(
@@ -122,7 +175,9 @@ class RecursiveScheduler:
         )
         
         self.logger.info("Weekly recursive improvement cycle completed")
+        return cycle_results
     
+    @traced("scheduler.daily_health_check")
     def _daily_health_check(self):
         """Perform daily health check of all engines."""
         self.logger.info("Starting daily health check")
@@ -148,6 +203,9 @@ class RecursiveScheduler:
                 else:
                     self.logger.error(f"Failed to restart engine {engine_name}")
         
+        # Expire raw metric points, the rollups keep the long-range trends
+        self.logger_instance.expire_raw_metrics()
+        
         # Log health check results
         self.logger_instance.log_action(
             "scheduler",
@@ -156,6 +214,7 @@ class RecursiveScheduler:
             {"check_type": "health", "automated": True}
         )
     
+    @traced("scheduler.collect_metrics")
     def _collect_metrics(self):
         """Collect hourly metrics from all engines."""
         self.logger.debug("Collecting hourly metrics")
@@ -181,14 +240,18 @@ class RecursiveScheduler:
                 
             except Exception as e:
                 self.logger.error(f"Failed to collect metrics for {engine_name}: {e}")
+        
+        # Persist the rollups hourly, a restart then only folds in the last hour
+        self.logger_instance.save_rollups()
     
+    @traced("scheduler.execute_engine")
     def execute_engine_now(self, engine_name: str) -> Dict[str, any]:
         """Manually trigger execution of a specific engine."""
         if engine_name not in self.engines:
             return {"error": f"Engine {engine_name} not found"}
         
         engine = self.engines[engine_name]
-        result = engine.execute_with_compounding()
+        result = self.process_pool.execute(engine)
         
         self.logger_instance.log_action(
             engine_name,
@@ -206,22 +269,14 @@ class RecursiveScheduler:
             "engines_registered": len(self.engines),
             "engines": {name: engine.get_status() for name, engine in self.engines.items()},
             "next_weekly_cycle": self._get_next_schedule_time("weekly"),
+            "last_weekly_cycle": self.last_cycle,
+            "dependency_graph": EngineDAG(self.engines).to_dict(),
+            "jobs": self.timer.jobs(),
+            "timer": self.timer.get_stats(),
             "uptime": "active" if self.is_running else "stopped"
         }
     
     def _get_next_schedule_time(self, schedule_type: str) -> Optional[str]:
         """Get next scheduled execution time."""
-        try:
-            if schedule_type == "weekly":
-                # Next Monday at 2 AM
-                now = datetime.now()
-                days_ahead = 0 - now.weekday()  # Monday is 0
-                if days_ahead <= 0:  # Target day already happened this week
-                    days_ahead += 7
-                next_monday = now + timedelta(days=days_ahead)
-                next_execution = next_monday.replace(hour=2, minute=0, second=0, microsecond=0)
-                return next_execution.isoformat()
-        except Exception as e:
-            self.logger.error(f"Failed to calculate next schedule time: {e}")
-        
-        return None
\ No newline at end of file
+        next_run = self.timer.next_run(f"{schedule_type}_cycle")
+        return next_run.isoformat() if next_run else None
@@ -0,0 +1,49 @@
+"""
+Startup Profile - Import and initialization timings for command line tools
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+
+class StartupProfile:
+    """Collects named phase timings, grouped by kind ("import", "init", "run")."""
+
+    def __init__(self):
+        self.phases: List[Tuple[str, str, float]] = []
+
+    def record(self, name: str, seconds: float, kind: str = "init"):
+        """Add a measured phase."""
+        self.phases.append((kind, name, seconds))
+
+    @contextmanager
+    def phase(self, name: str, kind: str = "init"):
+        """Time the enclosed block as one phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started, kind)
+
+    def add_engine_loads(self, load_stats: Dict[str, Dict[str, float]]):
+        """Add per-engine import and construction times from a ``LazyEngineRegistry``."""
+        for name, stats in load_stats.items():
+            self.record(f"engine {name}", stats["import"], "import")
+            self.record(f"engine {name}", stats["init"], "init")
+
+    def report(self) -> str:
+        """Render the phases as a table with per-kind and overall totals."""
+        lines = ["Startup profile:"]
+        total = 0.0
+        for kind in ("import", "init", "run"):
+            phases = [(name, seconds) for phase_kind, name, seconds in self.phases if phase_kind == kind]
+            if not phases:
+                continue
+            subtotal = sum(seconds for _, seconds in phases)
+            total += subtotal
+            lines.append(f"  {kind} ({subtotal * 1000:.1f}ms)")
+            for name, seconds in phases:
+                lines.append(f"    {seconds * 1000:8.1f}ms  {name}")
+        lines.append(f"  total {total * 1000:.1f}ms")
+        return "\n".join(lines)
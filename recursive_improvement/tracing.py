@@ -0,0 +1,319 @@
+"""
+Tracing - Lightweight in-process spans with Chrome trace-event export
+
+Spans nest through a context variable, so children find their parent
+without it being passed around. Asyncio tasks inherit it automatically;
+work handed to thread pools must be wrapped with ``bind_context`` at
+submission. Sampling is decided once per trace, at its root span.
+"""
+
+import functools
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start", "end",
+                 "attributes", "lane", "status", "_tracer", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: Optional[int],
+                 attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = next(_span_ids)
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start = 0.0
+        self.end = None
+        self.lane = None
+        self.status = "ok"
+        self._tracer = tracer
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach ``key=value`` to the span."""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self.lane = _current_lane()
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.perf_counter()
+        if exc_type is not None:
+            self.status = "error"
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._tracer._finish(self)
+        return False
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.end is None else self.end - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration": self.duration,
+            "lane": self.lane,
+            "status": self.status,
+            "attributes": self.attributes
+        }
+
+
+class _NoopSpan:
+    """Stands in for a span that is not recorded."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _UnsampledRoot(_NoopSpan):
+    """Root of a trace that lost the sampling draw; marks its children unsampled too."""
+
+    __slots__ = ("_token",)
+
+    def __enter__(self) -> "_UnsampledRoot":
+        self._token = _current_span.set(_UNSAMPLED)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        return False
+
+
+_NOOP = _NoopSpan()
+_UNSAMPLED = _NoopSpan()
+_INHERIT = object()
+
+_current_span: ContextVar[Any] = ContextVar("recursive_span", default=None)
+_span_ids = itertools.count(1)
+
+
+def _current_lane() -> str:
+    """Thread name, plus the task name inside asyncio tasks so concurrent tasks don't overlap."""
+    lane = threading.current_thread().name
+    asyncio = sys.modules.get("asyncio")  # Never import it just to ask
+    if asyncio is not None:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            lane = f"{lane}/{task.get_name()}"
+    return lane
+
+
+def current_span() -> Optional[Span]:
+    """The innermost recorded span in this context, if any."""
+    span = _current_span.get()
+    return span if isinstance(span, Span) else None
+
+
+def bind_context(fn: Callable) -> Callable:
+    """Wrap ``fn`` to run in a copy of the caller's context, for thread pool submission."""
+    context = copy_context()
+    return functools.partial(context.run, fn)
+
+
+def capture_trace() -> Any:
+    """Opaque trace position of the caller, for ``resume_trace`` on another thread or loop."""
+    return _current_span.get()
+
+
+class resume_trace:
+    """Make a position from ``capture_trace`` current for the enclosed block."""
+
+    __slots__ = ("state", "_token")
+
+    def __init__(self, state: Any):
+        self.state = state
+        self._token = None
+
+    def __enter__(self):
+        self._token = _current_span.set(self.state)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        return False
+
+
+class Tracer:
+    """
+    Creates spans and keeps the most recent finished ones in memory. With a
+    ``sample_rate`` of 0 (the default) spans cost one context lookup and
+    nothing is recorded.
+    """
+
+    DEFAULT_SETTINGS = {
+        "sample_rate": 0.0,      # Fraction of traces recorded, decided at the root span
+        "max_spans": 100000,     # Finished spans kept for export
+        "export_path": None      # Chrome trace written here on orchestrator shutdown
+    }
+
+    def __init__(self, config: Dict[str, Any] = None):
+        self.logger = logging.getLogger("recursive.tracing")
+        self.settings = dict(self.DEFAULT_SETTINGS)
+        self.spans: deque = deque(maxlen=self.settings["max_spans"])
+        self._stats = {"traces_sampled": 0, "traces_unsampled": 0, "spans_recorded": 0}
+        self._stats_lock = threading.Lock()
+        self.configure(config)
+
+    def configure(self, config: Dict[str, Any] = None):
+        """Apply settings; the span buffer keeps its contents if resized."""
+        self.settings.update(config or {})
+        if self.settings["max_spans"] != self.spans.maxlen:
+            self.spans = deque(self.spans, maxlen=self.settings["max_spans"])
+
+    @property
+    def sample_rate(self) -> float:
+        return self.settings["sample_rate"]
+
+    def span(self, name: str, parent: Any = _INHERIT, **attributes) -> Any:
+        """
+        Start a span, to be used as a context manager. It is a child of the
+        current span unless ``parent`` is given; ``parent=None`` starts a new
+        trace. Returns a no-op span when the trace is not sampled.
+        """
+        if parent is _INHERIT:
+            parent = _current_span.get()
+        if parent is _UNSAMPLED:
+            return _NOOP
+        if parent is None:
+            rate = self.settings["sample_rate"]
+            if rate <= 0:
+                return _NOOP
+            sampled = rate >= 1 or random.random() < rate
+            with self._stats_lock:
+                self._stats["traces_sampled" if sampled else "traces_unsampled"] += 1
+            if not sampled:
+                return _UnsampledRoot()
+            return Span(self, name, f"{random.getrandbits(64):016x}", None, attributes)
+        return Span(self, name, parent.trace_id, parent.span_id, attributes)
+
+    def _finish(self, span: Span):
+        self.spans.append(span)
+        with self._stats_lock:
+            self._stats["spans_recorded"] += 1
+
+    def finished_spans(self, trace_id: str = None) -> List[Span]:
+        """Finished spans, oldest first, optionally of one trace."""
+        spans = list(self.spans)
+        if trace_id is not None:
+            spans = [span for span in spans if span.trace_id == trace_id]
+        return spans
+
+    def clear(self):
+        """Drop all finished spans."""
+        self.spans.clear()
+
+    def export_chrome_trace(self, path: str, trace_id: str = None) -> int:
+        """Write finished spans to ``path`` as Chrome trace-event JSON. Returns the span count."""
+        spans = self.finished_spans(trace_id)
+        write_chrome_trace(spans, path)
+        self.logger.info(f"Wrote {len(spans)} spans to {path}")
+        return len(spans)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracing statistics."""
+        with self._stats_lock:
+            return {
+                "sample_rate": self.settings["sample_rate"],
+                "spans_buffered": len(self.spans),
+                **self._stats
+            }
+
+
+def chrome_trace_events(spans: Iterable[Span]) -> Dict[str, Any]:
+    """
+    Build a Chrome trace-event document (chrome://tracing, Perfetto,
+    speedscope) with one complete event per span and one row per lane.
+    """
+    spans = [span for span in spans if span.end is not None]
+    origin = min((span.start for span in spans), default=0.0)
+    lanes: Dict[str, int] = {}
+    pid = os.getpid()
+    events = []
+
+    for span in sorted(spans, key=lambda span: span.start):
+        tid = lanes.setdefault(span.lane, len(lanes) + 1)
+        events.append({
+            "name": span.name,
+            "cat": span.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": (span.start - origin) * 1e6,
+            "dur": (span.end - span.start) * 1e6,
+            "pid": pid,
+            "tid": tid,
+            "args": {
+                **span.attributes,
+                "trace_id": span.trace_id,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "status": span.status
+            }
+        })
+    for lane, tid in lanes.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": lane}})
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(spans: Iterable[Span], path: str):
+    """Write spans to ``path`` as Chrome trace-event JSON, replacing it atomically."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(chrome_trace_events(spans), f, default=str)
+    os.replace(temp_path, path)
+
+
+# Process-wide tracer used by the framework's instrumentation
+tracer = Tracer()
+
+
+def configure_tracing(config: Dict[str, Any] = None) -> Tracer:
+    """Apply settings to the process-wide tracer."""
+    tracer.configure(config)
+    return tracer
+
+
+def traced(name: str = None):
+    """Decorator recording each call of a function as a span."""
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with tracer.span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
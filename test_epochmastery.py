@@ -154,6 +154,29 @@ class TestEpochmasterySync(unittest.TestCase):
             self.assertIn("type", agent)
             self.assertIn("status", agent)
     
+    def test_discovery_does_not_load_engines(self):
+        """Test that engines registered by import path are discovered unloaded."""
+        from recursive_improvement.engines import ENGINE_SPECS
+        from recursive_improvement.orchestrator import RecursiveOrchestrator
+        
+        orchestrator = RecursiveOrchestrator({"log_dir": "logs"})
+        self.addCleanup(orchestrator.shutdown)
+        for spec in ENGINE_SPECS:
+            orchestrator.register_lazy_engine(spec)
+        self.sync_system.orchestrator = orchestrator
+        self.sync_system.agent_registry.orchestrator = orchestrator
+        
+        engines = self.sync_system._discover_orchestrator_engines()
+        agents = [agent for agent in self.sync_system.agent_registry.discover_agents()
+                  if agent["type"] == "recursive_engine"]
+        
+        self.assertEqual(orchestrator.engines.loaded(), {})
+        for discovered in (engines, agents):
+            self.assertEqual(len(discovered), len(ENGINE_SPECS))
+            kpi = next(agent for agent in discovered if agent["id"] == "kpi_mutation_engine")
+            self.assertEqual(kpi["class_name"], "KPIMutationEngine")
+            self.assertFalse(kpi["loaded"])
+    
     def test_data_sync(self):
         """Test full data synchronization."""
         # Discover agents first
@@ -0,0 +1,154 @@
+"""Tests for the orchestrator daemon and its socket protocol"""
+import contextlib
+import io
+import os
+import shutil
+import socket
+import stat
+import statistics
+import sys
+import tempfile
+import time
+import unittest
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import integration
+from recursive_improvement.daemon import DaemonClient, DaemonError, OrchestratorDaemon, recv_frame, send_frame
+from recursive_improvement.orchestrator import RecursiveOrchestrator
+from tests.test_orchestrator import SleepyEngine
+
+
+class TestFraming(unittest.TestCase):
+    """Test cases for length-prefixed JSON frames."""
+
+    def test_round_trip(self):
+        """Frames survive a round trip and a closed peer reads as None."""
+        left, right = socket.socketpair()
+        self.addCleanup(right.close)
+
+        send_frame(left, {"method": "status", "params": {"n": 1}})
+        send_frame(left, [1, "two"])
+        left.close()
+
+        self.assertEqual(recv_frame(right), {"method": "status", "params": {"n": 1}})
+        self.assertEqual(recv_frame(right), [1, "two"])
+        self.assertIsNone(recv_frame(right))
+
+
+class TestOrchestratorDaemon(unittest.TestCase):
+    """Test cases for RPC against a resident orchestrator."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.socket_path = os.path.join(self.temp_dir, "orchestrator.sock")
+
+        self.orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir})
+        self.orchestrator.register_engine(SleepyEngine("sleepy", 0.0))
+        self.addCleanup(self.orchestrator.shutdown)
+
+        self.daemon = OrchestratorDaemon(self.orchestrator, self.socket_path)
+        self.daemon.start()
+        self.addCleanup(self.daemon.stop)
+
+        self.client = DaemonClient(self.socket_path, timeout=10)
+        self.addCleanup(self.client.close)
+
+    def test_builtin_methods(self):
+        """Status, triggers and stats are served from the resident orchestrator."""
+        self.assertTrue(self.client.available())
+        self.assertEqual(self.client.call("ping"), "pong")
+
+        status = self.client.call("status")
+        self.assertIn("sleepy", status["engines"])
+
+        result = self.client.call("trigger", context="manual_trigger", source="cli")
+        self.assertEqual(result["admission"], "admitted")
+        self.assertEqual([entry["engine"] for entry in result["engines_triggered"]], ["sleepy"])
+
+        self.assertEqual(self.client.call("daemon_stats")["requests"], 3)
+
+    def test_errors_keep_connection(self):
+        """A failed call raises on the client and the connection stays usable."""
+        with self.assertRaises(DaemonError):
+            self.client.call("no_such_method")
+        with self.assertRaises(DaemonError):
+            self.client.call("ping", unexpected=True)
+
+        self.assertEqual(self.client.call("ping"), "pong")
+        self.assertEqual(self.daemon.get_stats()["errors"], 2)
+
+    def test_socket_lifecycle(self):
+        """A live daemon blocks a second one; a stale socket file is replaced."""
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
+        second = OrchestratorDaemon(self.orchestrator, self.socket_path)
+        with self.assertRaises(RuntimeError):
+            second.bind()
+
+        self.client.call("shutdown")
+        deadline = time.time() + 5
+        while os.path.exists(self.socket_path) and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(os.path.exists(self.socket_path))
+        self.assertFalse(DaemonClient(self.socket_path).available())
+
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.socket_path)
+        stale.close()
+
+        second.start()
+        self.addCleanup(second.stop)
+        self.assertEqual(DaemonClient(self.socket_path).call("ping"), "pong")
+
+    def test_warm_round_trip_latency(self):
+        """Status round trips against warm state stay well under 10ms."""
+        self.client.call("status")
+
+        latencies = []
+        for _ in range(50):
+            started = time.perf_counter()
+            self.client.call("status")
+            latencies.append(time.perf_counter() - started)
+
+        self.assertLess(statistics.median(latencies), 0.01)
+
+    def test_cli_forwards_to_daemon(self):
+        """CLI commands answer from the daemon without building an orchestrator."""
+        self.addCleanup(setattr, integration, "_daemon_socket", integration._daemon_socket)
+        self.addCleanup(setattr, integration, "_daemon_client", None)
+        # Earlier tests may have built the CLI's own orchestrator
+        self.addCleanup(setattr, integration, "_orchestrator", integration._orchestrator)
+        integration._daemon_socket = self.socket_path
+        integration._daemon_client = None
+        integration._orchestrator = None
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            result = integration.get_recursive_status()
+
+        self.assertEqual(result["status"], "operational")
+        self.assertIn("sleepy: ✓ Running", output.getvalue())
+        self.assertIsNone(integration._orchestrator)
+
+    def test_stop_daemon(self):
+        """A refused shutdown is reported, an accepted one stops the daemon."""
+        def refuse():
+            raise RuntimeError("busy")
+
+        accept = self.daemon.methods["shutdown"]
+        self.daemon.register("shutdown", refuse)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(integration.stop_daemon(self.socket_path)["status"], "error")
+            self.daemon.register("shutdown", accept)
+            self.assertEqual(integration.stop_daemon(self.socket_path)["status"], "stopped")
+
+        deadline = time.time() + 5
+        while os.path.exists(self.socket_path) and time.time() < deadline:
+            time.sleep(0.01)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(integration.stop_daemon(self.socket_path)["status"], "not_running")
+
+
+if __name__ == "__main__":
+    unittest.main()
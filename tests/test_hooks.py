@@ -0,0 +1,149 @@
+"""Tests for hook dispatch and the coalescing event bus"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recursive_improvement.base import RecursiveHook
+from recursive_improvement.orchestrator import RecursiveOrchestrator
+from tests.test_orchestrator import SleepyEngine
+
+
+class TestSyncHooks(unittest.TestCase):
+    """Test cases for the default synchronous hook mode."""
+
+    def test_results_returned_inline(self):
+        """Callbacks run on the caller's thread and failures are isolated."""
+        hooks = RecursiveHook()
+        hooks.register_hook("evt", lambda x: x * 2)
+        hooks.register_hook("evt", lambda x: 1 / 0)
+
+        self.assertEqual(hooks.trigger_hook("evt", 21), [42])
+        self.assertEqual(hooks.trigger_hook("unknown"), [])
+        self.assertEqual(hooks.get_stats()["mode"], "sync")
+
+
+class TestEventBus(unittest.TestCase):
+    """Test cases for bus-mode dispatch."""
+
+    def setUp(self):
+        self.hooks = RecursiveHook({"mode": "bus"})
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        self.hooks.stop()
+
+    def record(self, *args, **kwargs):
+        with self.lock:
+            self.calls.append((args, kwargs))
+
+    def test_trigger_returns_immediately(self):
+        """Publishing does not wait for slow callbacks."""
+        self.hooks.register_hook("slow", lambda: time.sleep(0.3))
+        started = time.monotonic()
+        self.assertEqual(self.hooks.trigger_hook("slow"), [])
+        self.assertLess(time.monotonic() - started, 0.1)
+        self.assertTrue(self.hooks.flush(timeout=2))
+        self.assertEqual(self.hooks.get_stats()["events"]["slow"]["dispatched"], 1)
+
+    def test_burst_is_coalesced(self):
+        """Events inside the debounce window merge into one dispatch."""
+        self.hooks.register_hook("workflow_start", self.record)
+        self.hooks.configure_event("workflow_start", debounce=0.1)
+
+        for i in range(10):
+            self.hooks.trigger_hook("workflow_start", i, run=i)
+        time.sleep(0.3)
+
+        self.assertEqual(len(self.calls), 1)
+        args, kwargs = self.calls[0]
+        self.assertEqual(args, (9,))
+        self.assertEqual(kwargs["run"], 9)
+        self.assertEqual(kwargs["coalesced"]["count"], 10)
+        self.assertEqual([m["run"] for m in kwargs["coalesced"]["metadata"]], list(range(10)))
+
+        stats = self.hooks.get_stats()["events"]["workflow_start"]
+        self.assertEqual((stats["published"], stats["dispatched"], stats["coalesced"]), (10, 1, 9))
+        self.assertGreaterEqual(stats["latency_last"], 0.1)
+
+    def test_max_wait_bounds_debounce(self):
+        """A continuous stream still dispatches once max_wait has passed."""
+        self.hooks.register_hook("tick", self.record)
+        self.hooks.configure_event("tick", debounce=0.1, max_wait=0.2)
+
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            self.hooks.trigger_hook("tick")
+            time.sleep(0.02)
+        self.hooks.flush(timeout=1)
+
+        self.assertGreaterEqual(len(self.calls), 2)
+
+    def test_priority_order(self):
+        """Higher-priority events are dispatched first once ready."""
+        gate = threading.Event()
+        self.hooks.register_hook("block", gate.wait)
+        self.hooks.register_hook("low", lambda: self.record("low"))
+        self.hooks.register_hook("high", lambda: self.record("high"))
+        self.hooks.configure_event("high", priority=10)
+
+        self.hooks.trigger_hook("block")
+        time.sleep(0.05)
+        self.hooks.trigger_hook("low")
+        self.hooks.trigger_hook("high")
+        self.assertEqual(self.hooks.get_stats()["queued"], 2)
+        gate.set()
+        self.hooks.flush(timeout=1)
+
+        self.assertEqual([c[0][0] for c in self.calls], ["high", "low"])
+        self.assertEqual(self.hooks.get_stats()["events"]["low"]["max_queue_depth"], 1)
+
+    def test_stop_flushes_pending(self):
+        """Stopping the bus dispatches events still inside their debounce window."""
+        self.hooks.register_hook("evt", self.record)
+        self.hooks.configure_event("evt", debounce=10.0)
+        self.hooks.trigger_hook("evt")
+        self.hooks.stop()
+        self.assertEqual(len(self.calls), 1)
+
+
+class TestOrchestratorHooks(unittest.TestCase):
+    """Test cases for workflow events reaching engines through the bus."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_workflow_burst_runs_one_sweep(self):
+        """A burst of workflow_start events triggers the engines once."""
+        orchestrator = RecursiveOrchestrator({
+            "log_dir": self.tmp_dir,
+            "hooks": {"mode": "bus", "events": {"workflow_start": {"debounce": 0.1}}}
+        })
+        orchestrator.initialize()
+        engine = SleepyEngine("feedback_loop", 0.0)
+        engine.start()
+        orchestrator.register_engine(engine)
+        try:
+            for i in range(5):
+                orchestrator.hook_system.trigger_hook("workflow_start", workflow=f"wf-{i}")
+            orchestrator.hook_system.flush(timeout=5)
+
+            self.assertEqual(orchestrator.total_improvements, 1)
+            stats = orchestrator.get_system_status()["hooks"]["events"]["workflow_start"]
+            self.assertEqual(stats["coalesced"], 4)
+        finally:
+            orchestrator.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
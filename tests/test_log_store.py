@@ -0,0 +1,611 @@
+"""Tests for the segmented recursive improvement log store"""
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recursive_improvement import log_config, logger as logger_module
+from recursive_improvement.blob_store import ContentAddressedBlobStore
+from recursive_improvement.log_config import RateLimitFilter
+from recursive_improvement.log_store import SegmentedLogStore
+from recursive_improvement.log_writer import BackgroundLogWriter
+from recursive_improvement.logger import RecursiveLogger
+from recursive_improvement.metrics_index import SlidingWindowCounter, TimeSeriesIndex
+from recursive_improvement.rollups import MetricRollups
+
+
+class TestSegmentedLogStore(unittest.TestCase):
+    """Test cases for the append-only segment store."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_append_and_read_back(self):
+        """Entries are read back in write order."""
+        store = SegmentedLogStore(self.test_dir, "actions", fsync_policy="none")
+        for i in range(5):
+            store.append({"index": i})
+        store.close()
+
+        entries = list(SegmentedLogStore(self.test_dir, "actions").iter_entries())
+        self.assertEqual([e["index"] for e in entries], list(range(5)))
+
+    def test_size_rotation(self):
+        """Segments rotate once they reach the size limit."""
+        store = SegmentedLogStore(self.test_dir, "metrics",
+                                  max_segment_bytes=64, fsync_policy="none")
+        for i in range(20):
+            store.append({"metric": "m", "value": i})
+        store.close()
+
+        self.assertGreater(len(store.segments()), 1)
+        self.assertEqual(len(list(store.iter_entries())), 20)
+
+    def test_retention_drops_expired_segments(self):
+        """Retention deletes whole segments older than the cutoff."""
+        store = SegmentedLogStore(self.test_dir, "actions",
+                                  max_segment_bytes=64, fsync_policy="none")
+        for i in range(10):
+            store.append({"index": i})
+        old_segments = store.segments()[:-1]
+        for path in old_segments:
+            os.utime(path, (0, 0))
+
+        stats = store.apply_retention(3600)
+        self.assertEqual(stats["segments_dropped"], len(old_segments))
+        self.assertGreater(stats["bytes_reclaimed"], 0)
+        self.assertEqual(len(store.segments()), 1)
+
+    def test_compaction_merges_and_compresses(self):
+        """Small closed segments are merged, cold ones gzipped and still readable."""
+        store = SegmentedLogStore(self.test_dir, "metrics",
+                                  max_segment_bytes=16, fsync_policy="none")
+        for i in range(12):
+            store.append({"value": i})
+        store.close()
+        segment_count = len(store.segments())
+
+        store = SegmentedLogStore(self.test_dir, "metrics", max_segment_bytes=1024)
+
+        stats = store.compact(min_segment_bytes=64, compress_after=-1)
+        self.assertGreater(stats["segments_merged"], 0)
+        self.assertGreater(stats["segments_compressed"], 0)
+        self.assertLess(len(store.segments()), segment_count)
+        self.assertEqual([e["value"] for e in store.iter_entries()], list(range(12)))
+
+        store.append({"value": 12})
+        self.assertEqual(len(list(store.iter_entries())), 13)
+
+    def test_compaction_concurrent_with_appends(self):
+        """A segment opened by an append racing compaction's listing is never compacted."""
+        store = SegmentedLogStore(self.test_dir, "metrics", max_segment_age=0.05, fsync_policy="none")
+        for i in range(3):
+            store.append({"value": i})
+            time.sleep(0.06)
+        list_segments = store.segments
+        appenders = []
+
+        def racing_segments():
+            # Another thread appends, rotating to a fresh partition, while compaction lists segments
+            if not appenders:
+                appenders.append(threading.Thread(target=store.append, args=({"value": 3},)))
+                appenders[0].start()
+                appenders[0].join(timeout=0.2)
+            return list_segments()
+
+        store.segments = racing_segments
+        store.compact(min_segment_bytes=1024, compress_after=-1)
+        appenders[0].join()
+        store.segments = list_segments
+        store.append({"value": 4})
+        store.close()
+
+        self.assertEqual([e["value"] for e in store.iter_entries()], list(range(5)))
+
+    def test_time_partitions_are_not_merged(self):
+        """Time-partitioned segments are only compressed, so retention can still drop each one."""
+        store = SegmentedLogStore(self.test_dir, "actions", max_segment_age=0, fsync_policy="none")
+        for i in range(4):
+            store.append({"index": i})
+        for path in store.segments()[:2]:
+            os.utime(path, (0, 0))
+
+        stats = store.compact(min_segment_bytes=1024, compress_after=3600)
+        self.assertEqual(stats["segments_merged"], 0)
+        self.assertEqual(stats["segments_compressed"], 2)
+        self.assertEqual(store.apply_retention(3600)["segments_dropped"], 2)
+        self.assertEqual([e["index"] for e in store.iter_entries()], [2, 3])
+
+    def test_time_partitioned_rotation(self):
+        """Segments rotate once they are older than max_segment_age."""
+        store = SegmentedLogStore(self.test_dir, "actions", max_segment_age=0)
+        store.append({"index": 0})
+        store.append({"index": 1})
+        self.assertEqual(len(store.segments()), 2)
+
+    def test_invalid_fsync_policy(self):
+        """Unknown fsync policies are rejected."""
+        with self.assertRaises(ValueError):
+            SegmentedLogStore(self.test_dir, "actions", fsync_policy="sometimes")
+
+    def test_legacy_migration(self):
+        """Legacy JSON array logs are imported once into an empty store."""
+        legacy = os.path.join(self.test_dir, "actions.json")
+        with open(legacy, "w") as f:
+            json.dump([{"engine": "a"}, {"engine": "b"}], f, indent=2)
+
+        store = SegmentedLogStore(os.path.join(self.test_dir, "segments"), "actions")
+        self.assertEqual(store.migrate_legacy_json(legacy), 2)
+        self.assertEqual(store.migrate_legacy_json(legacy), 0)
+        self.assertEqual(len(list(store.iter_entries())), 2)
+
+    def test_logger_persists_across_instances(self):
+        """RecursiveLogger reloads its history from the segment store."""
+        logger = RecursiveLogger(self.test_dir, {"fsync_policy": "none"})
+        logger.log_action("engine", "run", {"status": "ok"})
+        logger.log_metric("latency", 1.5, "engine")
+        logger.close()
+
+        reloaded = RecursiveLogger(self.test_dir)
+        self.assertEqual(len(reloaded.actions_data), 1)
+        self.assertEqual(reloaded.get_engine_metrics("engine")[0]["value"], 1.5)
+        reloaded.close()
+
+    def test_logger_pages_history_older_than_resident_window(self):
+        """Only recent segments are loaded, older history is read from disk on demand."""
+        old = (datetime.now() - timedelta(days=30)).replace(microsecond=0)
+        stamps = [(old + timedelta(minutes=i)).isoformat() for i in range(3)]
+        segment_dir = os.path.join(self.test_dir, "segments")
+        for name, entries in (
+            ("actions", [{"timestamp": t, "engine": "engine", "action_type": "old"} for t in stamps]),
+            ("metrics", [{"timestamp": t, "metric": "latency", "value": i, "engine": "engine"}
+                         for i, t in enumerate(stamps)])
+        ):
+            store = SegmentedLogStore(segment_dir, name)
+            store.append_many(entries)
+            store.close()
+            for path in store.segments():
+                os.utime(path, (old.timestamp() + 120, old.timestamp() + 120))
+        # The first start folds the old points into rollups, later ones need not load them
+        RecursiveLogger(self.test_dir).close()
+
+        logger = RecursiveLogger(self.test_dir)
+        logger.log_action("engine", "new", {"status": "ok"})
+        logger.log_metric("latency", 10, "engine")
+        self.assertEqual([a["action_type"] for a in logger.actions_data], ["new"])
+        self.assertEqual([m["value"] for m in logger.metrics_data], [10])
+
+        self.assertEqual([m["value"] for m in logger.query_metrics(metric="latency")], [0, 1, 2, 10])
+        self.assertEqual([m["value"] for m in logger.query_metrics(metric="latency", limit=2)], [2, 10])
+        self.assertEqual([m["value"] for m in logger.get_engine_metrics("engine")], [10])
+        self.assertEqual(len(logger.query_actions(engine="engine")), 4)
+        self.assertEqual([a["action_type"] for a in logger.get_action_history(limit=2)], ["old", "new"])
+        self.assertEqual(logger.get_improvement_summary()["total_actions"], 4)
+
+        logger.cleanup_old_logs(days=7)
+        self.assertEqual(len(logger.query_actions()), 1)
+        self.assertEqual(logger.get_improvement_summary()["total_actions"], 1)
+        logger.close()
+
+    def test_first_start_folds_old_metrics_without_loading_them(self):
+        """Metrics older than the resident window reach the rollups but not memory."""
+        old = (datetime.now() - timedelta(days=30)).replace(microsecond=0)
+        store = SegmentedLogStore(os.path.join(self.test_dir, "segments"), "metrics")
+        store.append_many({"timestamp": (old + timedelta(minutes=i)).isoformat(),
+                           "metric": "latency", "value": i, "engine": "engine"} for i in range(3))
+        store.close()
+        for path in store.segments():
+            os.utime(path, (old.timestamp() + 300, old.timestamp() + 300))
+
+        # Neither logger is closed, as after a crash
+        logger = RecursiveLogger(self.test_dir)
+        self.assertEqual(logger.metrics_data, [])
+        self.assertEqual(logger.query_rollups("latency", "engine", "1d")[0]["count"], 3)
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, "rollups.json")))
+
+        logger.log_metric("latency", 10, "engine")
+        logger.run_maintenance()
+        restarted = RecursiveLogger(self.test_dir)
+        self.assertEqual(restarted.rollups.watermark, logger.rollups.watermark)
+        self.assertEqual(sum(b["count"] for b in restarted.query_rollups("latency", "engine", "1d")), 4)
+        logger.close()
+        restarted.close()
+
+
+class TestBackgroundLogWriter(unittest.TestCase):
+    """Test cases for the batched background writer."""
+
+    def test_flush_writes_everything(self):
+        """flush() returns once all submitted entries were handled."""
+        written = []
+        writer = BackgroundLogWriter(written.extend, batch_size=4, flush_interval=10)
+        writer.start()
+        for i in range(10):
+            writer.submit(i)
+        self.assertTrue(writer.flush(timeout=5))
+        writer.close()
+
+        self.assertEqual(written, list(range(10)))
+        self.assertGreaterEqual(writer.get_stats()["batches"], 3)
+
+    def test_drop_oldest_overflow(self):
+        """drop_oldest keeps the newest entries when the queue is full."""
+        written = []
+        writer = BackgroundLogWriter(written.extend, max_queue_size=3,
+                                     overflow_policy="drop_oldest")
+        for i in range(5):
+            writer.submit(i)
+        writer.start()
+        writer.close()
+
+        self.assertEqual(written, [2, 3, 4])
+        self.assertEqual(writer.get_stats()["dropped"], 2)
+
+    def test_sample_overflow(self):
+        """sample keeps one in every sample_rate overflowing entries."""
+        written = []
+        writer = BackgroundLogWriter(written.extend, max_queue_size=2,
+                                     overflow_policy="sample", sample_rate=2)
+        for i in range(6):
+            writer.submit(i)
+        writer.start()
+        writer.close()
+
+        self.assertEqual(len(written), 2)
+        self.assertIn(5, written)
+
+    def test_async_logger_mode(self):
+        """RecursiveLogger in async mode persists entries on flush."""
+        test_dir = tempfile.mkdtemp()
+        try:
+            logger = RecursiveLogger(test_dir, {"writer_mode": "async"})
+            for i in range(50):
+                logger.log_metric("value", i, "engine")
+            self.assertTrue(logger.flush(timeout=5))
+            self.assertEqual(len(list(logger.metrics_store.iter_entries())), 50)
+            logger.close()
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+    def test_async_logging_outside_the_lock(self):
+        """Queued entries are snapshots, and waiting on a full queue doesn't hold the logger lock."""
+        test_dir = tempfile.mkdtemp()
+        try:
+            logger = RecursiveLogger(test_dir, {"writer_mode": "async"})
+            logger.writer.close()
+            logger.writer = BackgroundLogWriter(logger._write_batch, max_queue_size=1)
+
+            metadata = {"attempt": 1}
+            with self.assertLogs("recursive_logger", "INFO") as logs:
+                logger.log_action("engine", "run", {"status": "ok"}, metadata)
+            self.assertIn("Action logged: engine.run", logs.output[0])
+            metadata["attempt"] = 2
+
+            # The queue is full and nothing drains it, so this caller blocks
+            blocked = threading.Thread(target=logger.log_metric, args=("value", 1, "engine"))
+            blocked.start()
+            blocked.join(timeout=0.1)
+            self.assertTrue(blocked.is_alive())
+
+            reader = threading.Thread(target=logger.get_improvement_summary)
+            reader.start()
+            reader.join(timeout=1)
+            self.assertFalse(reader.is_alive())
+
+            logger.writer.start()
+            blocked.join(timeout=5)
+            logger.close()
+            self.assertEqual(next(logger.actions_store.iter_entries())["metadata"], {"attempt": 1})
+            self.assertEqual(len(list(logger.metrics_store.iter_entries())), 1)
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+
+class TestTimeSeriesIndex(unittest.TestCase):
+    """Test cases for the time-indexed metrics query engine."""
+
+    def test_range_and_limit(self):
+        """Range queries bisect on timestamps and keep the newest entries."""
+        index = TimeSeriesIndex()
+        for ts in (30.0, 10.0, 20.0, 40.0):
+            index.add([("engine", "a")], ts, {"ts": ts})
+
+        self.assertEqual([e["ts"] for e in index.range(("engine", "a"))],
+                         [10.0, 20.0, 30.0, 40.0])
+        self.assertEqual([e["ts"] for e in index.range(("engine", "a"), start=10.0, end=30.0)],
+                         [20.0, 30.0])
+        self.assertEqual([e["ts"] for e in index.range(limit=2)], [30.0, 40.0])
+        self.assertEqual(index.count(start=15.0), 3)
+
+    def test_truncate_before(self):
+        """Truncation drops old entries and empty series."""
+        index = TimeSeriesIndex()
+        index.add([("engine", "old")], 1.0, {})
+        index.add([("engine", "new")], 5.0, {})
+
+        self.assertEqual(index.truncate_before(2.0), 1)
+        self.assertEqual(index.keys(), [("engine", "new")])
+
+    def test_logger_query_api(self):
+        """RecursiveLogger.query_metrics filters by engine and metric."""
+        test_dir = tempfile.mkdtemp()
+        try:
+            logger = RecursiveLogger(test_dir)
+            logger.log_metric("latency", 1, "a")
+            logger.log_metric("errors", 2, "a")
+            logger.log_metric("latency", 3, "b")
+
+            self.assertEqual(len(logger.query_metrics(engine="a")), 2)
+            self.assertEqual([m["value"] for m in logger.query_metrics(metric="latency")], [1, 3])
+            self.assertEqual(logger.query_metrics(engine="b", metric="latency")[0]["value"], 3)
+            self.assertEqual(logger.list_metric_series()["engines"], ["a", "b"])
+            logger.close()
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+    def test_expiry_with_out_of_order_history(self):
+        """Expiry removes the old entries even when they are not first on disk."""
+        test_dir = tempfile.mkdtemp()
+        try:
+            now = datetime.now()
+            store = SegmentedLogStore(os.path.join(test_dir, "segments"), "metrics")
+            for value, age in ((1, 0), (2, 10), (3, 0)):
+                store.append({"timestamp": (now - timedelta(days=age)).isoformat(),
+                              "metric": "m", "value": value, "engine": "a", "tags": {}})
+            store.close()
+
+            logger = RecursiveLogger(test_dir)
+            self.assertEqual(logger.expire_raw_metrics(days=5), 1)
+            self.assertEqual([m["value"] for m in logger.metrics_data], [1, 3])
+            self.assertEqual([m["value"] for m in logger.query_metrics(metric="m")], [1, 3])
+            logger.close()
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+    def test_sliding_window_counter(self):
+        """Buckets leave the window once fully older than it."""
+        counter = SlidingWindowCounter(window=120, bucket_width=60)
+        for ts in (0, 30, 60, 200):
+            counter.add(ts)
+
+        self.assertEqual(counter.count(now=150), 4)
+        self.assertEqual(counter.count(now=200), 2)
+        self.assertEqual(counter.count(now=250), 1)
+        self.assertEqual(counter.count(now=400), 0)
+
+    def test_improvement_summary(self):
+        """The summary reflects incrementally maintained counters."""
+        test_dir = tempfile.mkdtemp()
+        try:
+            logger = RecursiveLogger(test_dir)
+            logger.log_action("a", "run", {})
+            logger.log_action("b", "run", {})
+            logger.log_action("a", "run", {})
+
+            summary = logger.get_improvement_summary()
+            self.assertEqual(summary["total_actions"], 3)
+            self.assertEqual(sorted(summary["engines"]), ["a", "b"])
+            self.assertEqual(summary["recent_actions_7d"], 3)
+
+            logger.cleanup_old_logs(days=-1)
+            summary = logger.get_improvement_summary()
+            self.assertEqual((summary["total_actions"], summary["active_engines"],
+                              summary["recent_actions_7d"]), (0, 0, 0))
+            logger.close()
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+
+class TestMetricRollups(unittest.TestCase):
+    """Test cases for multi-resolution metric rollups."""
+
+    def test_bucket_aggregates(self):
+        """Points fold into count/min/max/sum/last per bucket."""
+        rollups = MetricRollups()
+        for ts, value in ((0, 4), (30, 1), (59, 7), (60, 2)):
+            rollups.ingest("a", "latency", ts, value)
+
+        minutes = rollups.query("latency", "a", "1m")
+        self.assertEqual(len(minutes), 2)
+        self.assertEqual((minutes[0]["count"], minutes[0]["min"], minutes[0]["max"],
+                          minutes[0]["sum"], minutes[0]["last"]), (3, 1.0, 7.0, 12.0, 7.0))
+        self.assertEqual(rollups.query("latency", "a", "1h")[0]["count"], 4)
+        self.assertFalse(rollups.ingest("a", "status", 0, "ok"))
+
+    def test_merge_across_engines_and_capacity(self):
+        """Engine-less queries merge series; tiers stay bounded."""
+        rollups = MetricRollups({"1m": 8})
+        for i in range(40):
+            rollups.ingest("a", "runs", i * 60, 1)
+            rollups.ingest("b", "runs", i * 60, 1)
+
+        merged = rollups.query("runs", resolution="1h")
+        self.assertEqual(merged[0]["count"], 80)
+        self.assertLessEqual(len(rollups.query("runs", "a", "1m")), 10)
+
+    def test_merged_last_is_latest_point(self):
+        """Merged buckets take ``last`` from the series with the latest point."""
+        rollups = MetricRollups()
+        for engine, ts, value in (("a", 10, 1), ("b", 20, 2), ("a", 50, 3), ("b", 40, 4)):
+            rollups.ingest(engine, "latency", ts, value)
+        self.assertEqual(rollups.query("latency", resolution="1m")[0]["last"], 3.0)
+
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        rollups.save(os.path.join(test_dir, "rollups.json"))
+        reloaded = MetricRollups()
+        reloaded.load(os.path.join(test_dir, "rollups.json"))
+        self.assertEqual(reloaded.query("latency", resolution="1m")[0]["last"], 3.0)
+
+    def test_rollups_survive_raw_expiry(self):
+        """Rollups persist across restarts after raw points expire."""
+        test_dir = tempfile.mkdtemp()
+        try:
+            logger = RecursiveLogger(test_dir)
+            logger.log_metric("runs", 3, "a")
+            logger.expire_raw_metrics(days=-1)
+            self.assertEqual(logger.query_metrics(metric="runs"), [])
+            logger.close()
+
+            reloaded = RecursiveLogger(test_dir)
+            self.assertEqual(reloaded.query_rollups("runs", "a", "1d")[0]["sum"], 3.0)
+            reloaded.close()
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+
+class TestBlobStorage(unittest.TestCase):
+    """Test cases for content-addressed action result storage."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_put_dedupes(self):
+        """Identical payloads are stored once."""
+        store = ContentAddressedBlobStore(self.test_dir)
+        first = store.put({"b": 1, "a": [1, 2]})
+        second = store.put({"a": [1, 2], "b": 1})
+
+        self.assertEqual(first, second)
+        self.assertEqual(store.get_stats()["dedup_hits"], 1)
+        self.assertEqual(store.get(first), {"a": [1, 2], "b": 1})
+
+    def test_large_results_are_externalized(self):
+        """Large results are logged as a hash plus summary and resolve back."""
+        logger = RecursiveLogger(self.test_dir, {"blob_threshold_bytes": 256})
+        engine_result = {"findings": ["finding %d" % i for i in range(50)], "status": "ok"}
+        logger.log_action("engine", "weekly_cycle", engine_result)
+        logger.log_action("orchestrator", "recursive_trigger",
+                          {"engines_triggered": [{"engine": "engine", "result": engine_result}]})
+        logger.log_action("engine", "small", {"status": "ok"})
+
+        entry = logger.actions_data[0]
+        self.assertIn("$blob", entry["result"])
+        self.assertEqual(entry["result"]["summary"]["sizes"]["findings"], 50)
+        self.assertEqual(logger.load_result(entry), engine_result)
+        self.assertEqual(logger.load_result(logger.actions_data[1])["engines_triggered"][0]["result"],
+                         engine_result)
+        self.assertEqual(logger.actions_data[2]["result"], {"status": "ok"})
+        self.assertGreaterEqual(logger.blob_store.get_stats()["dedup_hits"], 1)
+        logger.close()
+
+    def test_async_overflow_keeps_blobs_with_entries(self):
+        """Entries that survive a lossy writer queue still resolve their blobs."""
+        logger = RecursiveLogger(self.test_dir, {"blob_threshold_bytes": 256, "writer_mode": "async"})
+        logger.writer.close()
+        logger.writer = BackgroundLogWriter(logger._write_batch, max_queue_size=2,
+                                            overflow_policy="drop_oldest")
+        for i in range(5):
+            # The findings list and the result around it become two blobs
+            logger.log_action("engine", "run", {"findings": ["finding %d.%d" % (i, j) for j in range(50)]})
+        logger.writer.start()
+        logger.close()
+
+        entries = list(logger.actions_store.iter_entries())
+        self.assertEqual(len(entries), 2)
+        for entry in entries:
+            self.assertEqual(len(logger.load_result(entry)["findings"]), 50)
+
+    def test_async_store_payload_is_queued(self):
+        """In async mode store_payload returns the digest and leaves the write to the writer."""
+        logger = RecursiveLogger(self.test_dir, {"writer_mode": "async"})
+        logger.writer.close()
+        logger.writer = BackgroundLogWriter(logger._write_batch)
+        digest = logger.store_payload({"findings": list(range(20))})
+
+        self.assertFalse(logger.blob_store.exists(digest))
+        logger.writer.start()
+        logger.close()
+        self.assertEqual(logger.load_payload(digest), {"findings": list(range(20))})
+
+
+class TestRateLimitFilter(unittest.TestCase):
+    """Test cases for repeated log message limiting."""
+
+    def _record(self, msg):
+        return logging.LogRecord("recursive.test", logging.INFO, __file__, 1, msg, None, None)
+
+    def test_burst_then_sampling(self):
+        """Repeats beyond the burst are sampled and counted as suppressed."""
+        rate_filter = RateLimitFilter(window=60, burst=2, sample_every=3)
+        passed = [rate_filter.filter(self._record("same")) for _ in range(8)]
+
+        self.assertEqual(passed, [True, True, False, False, True, False, False, True])
+        self.assertEqual(rate_filter.suppressed_total, 4)
+        self.assertTrue(rate_filter.filter(self._record("different")))
+
+    def test_suppressed_count_reported(self):
+        """The first record of a new window reports suppressed repeats."""
+        rate_filter = RateLimitFilter(window=0.01, burst=1)
+        rate_filter.filter(self._record("repeat"))
+        rate_filter.filter(self._record("repeat"))
+
+        import time
+        time.sleep(0.02)
+        record = self._record("repeat")
+        self.assertTrue(rate_filter.filter(record))
+        self.assertIn("suppressed 1 similar messages", record.msg)
+
+    def test_logger_config_keeps_rate_limit(self):
+        """A logging config without rate_limit keeps the default limiter."""
+        calls = []
+        self.addCleanup(setattr, logger_module, "configure_logging", logger_module.configure_logging)
+        logger_module.configure_logging = lambda *args, **kwargs: calls.append(kwargs)
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+
+        RecursiveLogger(test_dir, {"logging": {"level": "DEBUG"}}).close()
+        RecursiveLogger(test_dir, {"logging": {"rate_limit": None}}).close()
+        self.assertEqual(calls, [{"level": "DEBUG"}, {"rate_limit": None}])
+
+
+class TestConfigureLogging(unittest.TestCase):
+    """Test cases for repeated configure_logging calls."""
+
+    def setUp(self):
+        log_config.shutdown_logging()
+        self.addCleanup(log_config.shutdown_logging)
+        root = logging.getLogger()
+        self.addCleanup(root.setLevel, root.level)
+
+    def _rate_filters(self):
+        return [f for f in log_config._queue_handler.filters if isinstance(f, RateLimitFilter)]
+
+    def test_bare_call_then_configured_call(self):
+        """A later call with settings applies them over the defaults."""
+        log_config.configure_logging(console=False, force=True)
+        self.assertEqual(len(self._rate_filters()), 1)
+
+        log_config.configure_logging(level="DEBUG", rate_limit={"burst": 2})
+        self.assertEqual([f.burst for f in self._rate_filters()], [2])
+        self.assertEqual(logging.getLogger().level, logging.DEBUG)
+
+        log_config.configure_logging(rate_limit=None)
+        self.assertEqual(self._rate_filters(), [])
+
+    def test_configured_call_then_bare_call(self):
+        """A later bare call keeps the earlier caller's settings."""
+        log_config.configure_logging(console=False, force=True, level="DEBUG", rate_limit={"burst": 2})
+        limiter = self._rate_filters()[0]
+
+        log_config.configure_logging()
+        self.assertEqual(self._rate_filters(), [limiter])
+        self.assertEqual(logging.getLogger().level, logging.DEBUG)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""Tests for the metrics registry and its Prometheus text output"""
+import gc
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard
+from recursive_improvement.metrics_registry import CONTENT_TYPE, MetricsRegistry, registry
+from recursive_improvement.orchestrator import RecursiveOrchestrator
+from tests.test_orchestrator import BusyEngine
+
+
+def sample(text, line_prefix):
+    """Value of the first sample line starting with ``line_prefix``."""
+    for line in text.splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"No sample {line_prefix} in:\n{text}")
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for metric types and the exposition format."""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge(self):
+        """Labelled children render with escaped values under HELP and TYPE lines."""
+        requests = self.registry.counter("app_requests_total", "Requests served", ("path",))
+        requests.labels("/").inc()
+        requests.labels("/").inc(2)
+        requests.labels('say "hi"\n').inc()
+        depth = self.registry.gauge("app_queue_depth", "Queued items")
+        depth.set(5)
+        depth.labels().dec(2)
+
+        text = self.registry.render()
+        self.assertIn("# HELP app_requests_total Requests served\n# TYPE app_requests_total counter\n", text)
+        self.assertEqual(sample(text, 'app_requests_total{path="/"}'), 3)
+        self.assertEqual(sample(text, 'app_requests_total{path="say \\"hi\\"\\n"}'), 1)
+        self.assertEqual(sample(text, "app_queue_depth"), 3)
+        self.assertLess(text.index("app_queue_depth"), text.index("app_requests_total"))
+        self.assertTrue(text.endswith("\n"))
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Buckets count observations at or below their bound, +Inf counts all."""
+        latency = self.registry.histogram("app_latency_seconds", "Latency", ("op",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.labels("read").observe(value)
+
+        text = self.registry.render()
+        self.assertEqual(sample(text, 'app_latency_seconds_bucket{op="read",le="0.1"}'), 2)
+        self.assertEqual(sample(text, 'app_latency_seconds_bucket{op="read",le="1.0"}'), 3)
+        self.assertEqual(sample(text, 'app_latency_seconds_bucket{op="read",le="+Inf"}'), 4)
+        self.assertEqual(sample(text, 'app_latency_seconds_count{op="read"}'), 4)
+        self.assertAlmostEqual(sample(text, 'app_latency_seconds_sum{op="read"}'), 3.65)
+
+    def test_registration_conflicts(self):
+        """Getters return the existing metric and reject a conflicting redefinition."""
+        counter = self.registry.counter("app_total", "Things", ("kind",))
+        self.assertIs(self.registry.counter("app_total", "Things", ("kind",)), counter)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("app_total", "Things", ("kind",))
+        with self.assertRaises(ValueError):
+            self.registry.counter("app_total", "Things")
+        with self.assertRaises(ValueError):
+            counter.labels("a", "b")
+        with self.assertRaises(ValueError):
+            self.registry.histogram("app_seconds", "Time", ("le",))
+
+    def test_collectors(self):
+        """Collectors refresh gauges before a render; failing or dropped ones are skipped."""
+        gauge = self.registry.gauge("app_live", "Live value")
+
+        class Source:
+            value = 7
+
+            def collect(self):
+                gauge.set(self.value)
+
+        def broken():
+            raise RuntimeError("unavailable")
+
+        source = Source()
+        self.registry.add_collector(source.collect)
+        self.registry.add_collector(broken)
+        with self.assertLogs("recursive.metrics", "ERROR"):
+            self.assertEqual(sample(self.registry.render(), "app_live"), 7)
+
+        self.registry.remove_collector(broken)
+        del source
+        gc.collect()
+        gauge.set(1)
+        self.assertEqual(sample(self.registry.render(), "app_live"), 1)
+        self.assertEqual(self.registry._collectors, [])
+
+
+class TestFrameworkMetrics(unittest.TestCase):
+    """Test cases for metrics recorded by the framework's instrumentation."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir})
+        self.addCleanup(self.orchestrator.shutdown)
+        self.orchestrator.register_engine(BusyEngine("metrics_busy_a"))
+        self.orchestrator.register_engine(BusyEngine("metrics_busy_b"))
+
+    def test_trigger_updates_metrics(self):
+        """A sweep records engine latency, triggers, log writes and queue gauges."""
+        self.orchestrator.trigger_recursive_improvement("metrics_busy", source="metrics_test")
+        self.orchestrator.recursive_logger.flush()
+        text = registry.render()
+
+        self.assertEqual(sample(text, 'recursive_triggers_total{source="metrics_test",admission="admitted"}'), 1)
+        for engine in ("metrics_busy_a", "metrics_busy_b"):
+            self.assertEqual(sample(text, f'recursive_engine_duration_seconds_count{{engine="{engine}",backend="inline"}}'), 1)
+            self.assertEqual(sample(text, f'recursive_engine_runs_total{{engine="{engine}",outcome="ok"}}'), 1)
+            self.assertEqual(
+                sample(text, f'recursive_engine_action_duration_seconds_count{{engine="{engine}",action="main"}}'), 1
+            )
+        self.assertGreater(sample(text, 'recursive_log_write_seconds_count{store="actions"}'), 0)
+        self.assertIn('recursive_queue_depth{queue="log_writer"}', text)
+        self.assertEqual(sample(text, 'recursive_engines{state="loaded"}'), 2)
+        self.assertEqual(sample(text, "recursive_triggers_in_flight"), 0)
+
+    def test_dashboard_endpoint(self):
+        """GET /metrics serves the registry with the Prometheus content type."""
+        handler = dashboard.DashboardHandler.__new__(dashboard.DashboardHandler)
+        handler.path = "/metrics"
+        handler.wfile = io.BytesIO()
+        headers = {}
+        handler.send_response = lambda status: headers.setdefault("status", status)
+        handler.send_header = headers.__setitem__
+        handler.end_headers = lambda: None
+
+        self.addCleanup(setattr, dashboard, "_orchestrator", dashboard._orchestrator)
+        dashboard._orchestrator = self.orchestrator
+        handler.do_GET()
+
+        self.assertEqual(headers["status"], 200)
+        self.assertEqual(headers["Content-type"], CONTENT_TYPE)
+        body = handler.wfile.getvalue().decode()
+        self.assertIn("# TYPE recursive_triggers_total counter", body)
+        self.assertEqual(int(headers["Content-Length"]), len(body.encode()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,742 @@
+"""Tests for the recursive improvement orchestrator"""
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+
+# Add the parent directory to the path so we can import the modules
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from recursive_improvement.admission import AdmissionController
+from recursive_improvement.base import RecursiveEngine
+from recursive_improvement.fingerprint import fingerprint_files
+from recursive_improvement.orchestrator import RecursiveOrchestrator
+
+
+def pin_cwd(test):
+    """Run ``test`` from the repository root, earlier tests may remove their cwd."""
+    os.chdir(REPO_ROOT)
+    test.addCleanup(os.chdir, REPO_ROOT)
+
+
+class SleepyEngine(RecursiveEngine):
+    """Engine whose main action just sleeps, for timing the fan-out."""
+
+    def __init__(self, name, delay, fail=False, config=None):
+        super().__init__(name, config)
+        self.delay = delay
+        self.fail = fail
+
+    def initialize(self):
+        return True
+
+    def execute_main_action(self):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"slept": self.delay}
+
+    def execute_with_compounding(self):
+        # Skip the overlapping pre-action so timings only reflect the main action
+        result = {"engine": self.name, "actions_executed": ["main"]}
+        result["main_action"] = self.execute_main_action()
+        return result
+
+
+class CountingCpuEngine(RecursiveEngine):
+    """CPU-class engine that reports its process and counts runs in its state."""
+
+    execution_class = "cpu"
+    state_attributes = ("runs",)
+
+    def __init__(self, config=None):
+        super().__init__("counting_cpu", config)
+        self.runs = 0
+
+    def initialize(self):
+        return True
+
+    def execute_main_action(self):
+        self.runs += 1
+        return {"pid": os.getpid(), "cwd": os.getcwd(), "runs": self.runs}
+
+
+class FileReadingEngine(RecursiveEngine):
+    """Engine whose main action reads one file, fingerprinted by its contents."""
+
+    def __init__(self, path, config=None):
+        super().__init__("file_reader", {"intervals": {"main": 0, "pre": 0}, **(config or {})})
+        self.path = path
+        self.reads = 0
+
+    def initialize(self):
+        return True
+
+    def input_fingerprint(self):
+        return fingerprint_files([self.path])
+
+    def execute_main_action(self):
+        self.reads += 1
+        with open(self.path) as f:
+            return {"content": f.read()}
+
+
+class FingerprintedCpuEngine(CountingCpuEngine):
+    """CPU-class engine with a fixed input fingerprint."""
+
+    def input_fingerprint(self):
+        return "unchanged"
+
+
+class BusyEngine(RecursiveEngine):
+    """Engine whose main action burns CPU and allocates, for resource accounting."""
+
+    def __init__(self, name="busy", config=None):
+        super().__init__(name, {"intervals": {"main": 0, "pre": 0}, "pre_action_delay": 0, **(config or {})})
+        self.retained = []
+
+    def initialize(self):
+        return True
+
+    def execute_main_action(self):
+        self.retained.append([str(i) for i in range(20000)])
+        return {"total": sum(i * i for i in range(200000))}
+
+
+class AsyncSleepyEngine(RecursiveEngine):
+    """Engine with a native async main action."""
+
+    def __init__(self, name, delay, config=None):
+        super().__init__(name, config)
+        self.delay = delay
+
+    def initialize(self):
+        return True
+
+    def execute_main_action(self):
+        raise AssertionError("async engines should not use the sync path")
+
+    async def run_main(self):
+        await asyncio.sleep(self.delay)
+        return {"slept": self.delay}
+
+    async def run_pre(self):
+        return {"status": "pre-action_completed"}
+
+
+class TestParallelFanOut(unittest.TestCase):
+    """Test cases for parallel engine execution on trigger."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _orchestrator(self, **execution):
+        orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir, "execution": execution})
+        self.addCleanup(orchestrator.shutdown)
+        return orchestrator
+
+    def test_latency_tracks_slowest_engine(self):
+        """Parallel triggers take about as long as the slowest engine."""
+        orchestrator = self._orchestrator(mode="parallel", max_workers=4)
+        for index, delay in enumerate([0.3, 0.1, 0.2, 0.05]):
+            orchestrator.register_engine(SleepyEngine(f"engine_{index}", delay))
+
+        started = time.monotonic()
+        result = orchestrator.trigger_recursive_improvement("test_trigger")
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(
+            [item["engine"] for item in result["engines_triggered"]],
+            ["engine_0", "engine_1", "engine_2", "engine_3"]
+        )
+        self.assertEqual(result["total_improvements"], 4)
+
+    def test_timeout_and_failure(self):
+        """Slow engines are reported as timed out and failures are skipped."""
+        orchestrator = self._orchestrator(mode="parallel", max_workers=4, engine_timeout=0.2)
+        orchestrator.register_engine(SleepyEngine("slow", 1.0))
+        orchestrator.register_engine(SleepyEngine("broken", 0.0, fail=True))
+        orchestrator.register_engine(SleepyEngine("fast", 0.0))
+
+        result = orchestrator.trigger_recursive_improvement("test_trigger")
+
+        self.assertEqual([item["engine"] for item in result["engines_triggered"]], ["fast"])
+        self.assertEqual(result["engines_timed_out"], ["slow"])
+
+    def test_sequential_mode(self):
+        """Sequential mode keeps the original one-by-one behaviour."""
+        orchestrator = self._orchestrator(mode="sequential")
+        orchestrator.register_engine(SleepyEngine("first", 0.0))
+        orchestrator.register_engine(SleepyEngine("second", 0.0))
+
+        result = orchestrator.trigger_recursive_improvement("test_trigger")
+
+        self.assertEqual([item["engine"] for item in result["engines_triggered"]], ["first", "second"])
+        self.assertEqual(result["engines_timed_out"], [])
+
+
+class TestAsyncMode(unittest.TestCase):
+    """Test cases for driving engines on the orchestrator event loop."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.orchestrator = RecursiveOrchestrator({
+            "log_dir": self.temp_dir,
+            "execution": {"mode": "async", "max_workers": 2, "engine_timeout": 2.0}
+        })
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.addCleanup(self.orchestrator.shutdown)
+
+    def test_async_engines_overlap_without_threads(self):
+        """Many async engines overlap on one loop regardless of pool size."""
+        for index in range(20):
+            self.orchestrator.register_engine(AsyncSleepyEngine(f"async_{index}", 0.5))
+
+        started = time.monotonic()
+        result = self.orchestrator.trigger_recursive_improvement("test_trigger")
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 2.0)
+        self.assertEqual(len(result["engines_triggered"]), 20)
+        self.assertEqual(result["engines_triggered"][0]["engine"], "async_0")
+        self.assertEqual(result["engines_triggered"][0]["result"]["main_action"], {"slept": 0.5})
+        self.assertIn("pre", self.orchestrator.engines["async_0"].last_execution)
+
+    def test_sync_engines_wrapped_and_timeout(self):
+        """Sync engines run via the executor and slow ones time out."""
+        self.orchestrator.engine_timeout = 0.3
+        self.orchestrator.register_engine(SleepyEngine("sync_fast", 0.0))
+        self.orchestrator.register_engine(AsyncSleepyEngine("async_slow", 5.0))
+
+        result = self.orchestrator.trigger_recursive_improvement("test_trigger")
+
+        self.assertEqual([item["engine"] for item in result["engines_triggered"]], ["sync_fast"])
+        self.assertEqual(result["engines_timed_out"], ["async_slow"])
+
+
+def legacy_should_trigger(engine_name, context):
+    """The name-substring routing the tag index replaced."""
+    engine_contexts = {
+        "workflow": ["feedback_loop", "workflow_automation", "experimentation"],
+        "validation": ["escalation_logic", "kpi_mutation"],
+        "content": ["content_stack", "asset_library", "playbook_generator"],
+        "monitoring": ["debrief_bot", "cloning_agent"]
+    }
+    for context_group, engines in engine_contexts.items():
+        if context_group in context.lower():
+            return any(eng in engine_name.lower() for eng in engines)
+    return True
+
+
+class TestContextRouting(unittest.TestCase):
+    """Test cases for the context tag routing index."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir})
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.addCleanup(self.orchestrator.shutdown)
+
+    def test_matches_legacy_routing(self):
+        """Routing the bundled engines gives the same result as before."""
+        from recursive_improvement import engines
+
+        for engine_cls in (getattr(engines, name) for name in engines.__all__):
+            self.orchestrator.register_engine(engine_cls())
+
+        contexts = ["workflow_start", "workflow_complete", "system_validation", "Content_update",
+                    "monitoring", "validation_workflow", "dashboard_trigger", "demo_setup", ""]
+        for context in contexts:
+            expected = [name for name in self.orchestrator.engines if legacy_should_trigger(name, context)]
+            self.assertEqual(self.orchestrator.route(context), expected, context)
+
+    def test_declared_tags(self):
+        """Engines can subscribe to new tags and re-registration replaces tags."""
+        engine = SleepyEngine("tagged", 0.0)
+        engine.context_tags = ("deploy",)
+        self.orchestrator.register_engine(engine)
+        self.orchestrator.register_engine(SleepyEngine("untagged", 0.0))
+
+        self.assertEqual(self.orchestrator.route("deploy_finished"), ["tagged"])
+        self.assertEqual(self.orchestrator.route("anything"), ["tagged", "untagged"])
+        self.assertEqual(self.orchestrator.route("monitoring"), [])
+
+        engine.context_tags = ("monitoring",)
+        self.orchestrator.register_engine(engine)
+        self.assertEqual(self.orchestrator.route("deploy_finished"), [])
+        self.assertEqual(self.orchestrator.route("monitoring"), ["tagged"])
+
+
+class TestExecutionHistory(unittest.TestCase):
+    """Test cases for the bounded execution history."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir})
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.addCleanup(self.orchestrator.shutdown)
+
+    def test_history_is_bounded(self):
+        """Only the most recent records are kept but every run is counted."""
+        engine = AsyncSleepyEngine("bounded", 0.0, config={
+            "history_size": 3,
+            "intervals": {"main": 0, "pre": 0}
+        })
+        self.orchestrator.register_engine(engine)
+
+        for _ in range(5):
+            asyncio.run(engine.execute_with_compounding_async())
+
+        self.assertEqual(len(engine.execution_history), 3)
+        self.assertEqual(engine.total_executions, 5)
+        self.assertEqual(engine.get_status()["total_executions"], 5)
+
+    def test_record_payload_is_spilled(self):
+        """Records are compact and their full result is loadable from the logger."""
+        engine = CountingCpuEngine({"history_size": 2})
+        engine.execution_class = "io"
+        self.orchestrator.register_engine(engine)
+        result = self.orchestrator.execute_engine("counting_cpu")
+
+        record = engine.execution_history[-1]
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual(record.status, "completed")
+        self.assertEqual(record.actions, 1)
+        self.assertEqual(self.orchestrator.recursive_logger.load_payload(record.result_digest)["main_action"],
+                         result["main_action"])
+        self.assertEqual(engine.execution_history.maxlen, 2)
+
+
+class TestCheckpoints(unittest.TestCase):
+    """Test cases for engine state checkpoints across restarts."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def _orchestrator(self):
+        return RecursiveOrchestrator({"log_dir": self.temp_dir, "checkpoint": {"interval": 3600}})
+
+    def test_restart_restores_state(self):
+        """A restarted orchestrator does not rerun completed work."""
+        from recursive_improvement.engines import AutonomousExperimentationTreeEngine
+
+        first = self._orchestrator()
+        engine = AutonomousExperimentationTreeEngine()
+        first.register_engine(engine)
+        first.execute_engine(engine.name)
+        branches = len(engine.active_branches)
+        first.shutdown()
+
+        second = self._orchestrator()
+        self.addCleanup(second.shutdown)
+        restored = AutonomousExperimentationTreeEngine()
+        second.register_engine(restored)
+
+        self.assertFalse(restored.should_execute("main"))
+        self.assertEqual(len(restored.execution_history), 1)
+        self.assertEqual(len(restored.active_branches), branches)
+        self.assertEqual(restored.experiment_tree.id, engine.experiment_tree.id)
+        self.assertEqual(second.checkpoints.get_stats()["restored"], 1)
+
+    def test_unchanged_state_not_rewritten(self):
+        """Saving again without changes writes nothing."""
+        orchestrator = self._orchestrator()
+        self.addCleanup(orchestrator.shutdown)
+        engine = CountingCpuEngine()
+        orchestrator.register_engine(engine)
+
+        self.assertEqual(orchestrator.save_checkpoints(), 1)
+        self.assertEqual(orchestrator.save_checkpoints(), 0)
+        engine.runs = 5
+        self.assertEqual(orchestrator.save_checkpoints(), 1)
+
+    def test_mismatched_class_ignored(self):
+        """A checkpoint written by a different engine class is not applied."""
+        orchestrator = self._orchestrator()
+        self.addCleanup(orchestrator.shutdown)
+        impostor = SleepyEngine("counting_cpu", 0.0)
+        impostor.last_execution["main"] = "not a datetime"
+        orchestrator.checkpoints.save(impostor)
+
+        engine = CountingCpuEngine()
+        orchestrator.register_engine(engine)
+        self.assertEqual(engine.last_execution, {})
+
+
+class TestProcessPoolBackend(unittest.TestCase):
+    """Test cases for running CPU-class engines in worker processes."""
+
+    def setUp(self):
+        pin_cwd(self)
+        self.temp_dir = tempfile.mkdtemp()
+        self.orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir})
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.addCleanup(self.orchestrator.shutdown)
+
+    def test_cpu_engine_runs_in_worker_and_state_returns(self):
+        """State produced in the worker process is marshalled back."""
+        engine = CountingCpuEngine()
+        self.orchestrator.register_engine(engine)
+
+        first = self.orchestrator.execute_engine("counting_cpu")
+        # The worker takes its state from the parent, so this lifts the weekly gate
+        engine.last_execution.clear()
+        second = self.orchestrator.execute_engine("counting_cpu")
+
+        self.assertNotEqual(first["main_action"]["pid"], os.getpid())
+        self.assertEqual(second["main_action"]["runs"], 2)
+        self.assertEqual(engine.runs, 2)
+        self.assertEqual(len(engine.execution_history), 2)
+        self.assertIn("main", engine.last_execution)
+        self.assertEqual(self.orchestrator.process_pool.get_stats()["completed"], 2)
+
+    def test_concurrent_runs_of_one_engine_keep_both_states(self):
+        """Overlapping dispatches of one CPU engine don't overwrite each other's state."""
+        engine = CountingCpuEngine({"intervals": {"main": 0, "pre": 0}})
+        self.orchestrator.register_engine(engine)
+
+        threads = [threading.Thread(target=self.orchestrator.process_pool.execute, args=(engine,))
+                   for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(engine.runs, 2)
+        self.assertEqual(len(engine.execution_history), 2)
+
+    def test_workers_start_after_cwd_is_removed(self):
+        """Workers start from worker_cwd even when the parent's cwd is gone."""
+        engine = CountingCpuEngine()
+        self.orchestrator.register_engine(engine)
+        removed = tempfile.mkdtemp()
+        os.chdir(removed)
+        os.rmdir(removed)
+
+        with self.assertLogs("recursive.process_pool", "WARNING"):
+            result = self.orchestrator.execute_engine("counting_cpu")
+
+        self.assertEqual(result["main_action"]["cwd"], self.orchestrator.process_pool.worker_cwd)
+
+    def test_io_engines_stay_inline(self):
+        """Engines of the default io class do not use the process pool."""
+        engine = SleepyEngine("inline", 0.0)
+        self.orchestrator.register_engine(engine)
+
+        self.assertFalse(self.orchestrator.process_pool.uses_process(engine))
+        self.orchestrator.execute_engine("inline")
+        self.assertEqual(self.orchestrator.process_pool.get_stats()["submitted"], 0)
+
+
+class TestAdmissionControl(unittest.TestCase):
+    """Test cases for rate limiting and joining of improvement triggers."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def _orchestrator(self, **admission):
+        orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir, "admission": admission})
+        self.addCleanup(orchestrator.shutdown)
+        orchestrator.register_engine(SleepyEngine("slow_engine", 0.3))
+        return orchestrator
+
+    def _trigger_concurrently(self, orchestrator, contexts):
+        results = [None] * len(contexts)
+
+        def trigger(index, context):
+            results[index] = orchestrator.trigger_recursive_improvement(context)
+
+        threads = [threading.Thread(target=trigger, args=item) for item in enumerate(contexts)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_triggers_join_running_sweep(self):
+        """Concurrent triggers for one context share a single sweep."""
+        orchestrator = self._orchestrator()
+        results = self._trigger_concurrently(orchestrator, ["same_context"] * 4)
+
+        self.assertEqual(sorted(r["admission"] for r in results), ["admitted", "joined", "joined", "joined"])
+        self.assertEqual(len({r["timestamp"] for r in results}), 1)
+        self.assertEqual(orchestrator.total_improvements, 1)
+        self.assertEqual(orchestrator.admission.get_stats()["joined"], 3)
+
+    def test_rate_limit_per_context(self):
+        """A context over its bucket is rejected with a retry hint."""
+        orchestrator = self._orchestrator(context_burst=2, context_rate=0.1)
+        orchestrator.engines["slow_engine"].delay = 0.0
+
+        results = [orchestrator.trigger_recursive_improvement("busy") for _ in range(3)]
+        other = orchestrator.trigger_recursive_improvement("quiet")
+
+        self.assertEqual([r["admission"] for r in results], ["admitted", "admitted", "rejected"])
+        self.assertEqual(results[2]["reason"], "context_rate_limited")
+        self.assertGreater(results[2]["retry_after"], 0)
+        self.assertEqual(results[2]["engines_triggered"], [])
+        self.assertEqual(other["admission"], "admitted")
+
+    def test_rate_limit_per_source(self):
+        """A single source cannot get around the limit by varying the context."""
+        orchestrator = self._orchestrator(source_burst=2, source_rate=0.1)
+        orchestrator.engines["slow_engine"].delay = 0.0
+
+        results = [
+            orchestrator.trigger_recursive_improvement(f"context_{i}", source="dashboard")
+            for i in range(3)
+        ]
+        self.assertEqual(results[2]["reason"], "source_rate_limited")
+        self.assertEqual(orchestrator.trigger_recursive_improvement("context_2")["admission"], "admitted")
+
+    def test_in_flight_limit_sheds_load(self):
+        """Triggers beyond max_in_flight are shed instead of starting more sweeps."""
+        orchestrator = self._orchestrator(max_in_flight=1)
+        results = self._trigger_concurrently(orchestrator, ["first", "second"])
+
+        outcomes = sorted((r["admission"], r.get("reason")) for r in results)
+        self.assertEqual(outcomes, [("admitted", None), ("rejected", "overloaded")])
+        self.assertEqual(orchestrator.get_system_status()["admission"]["max_in_flight_seen"], 1)
+
+    def test_reentrant_trigger_is_rejected(self):
+        """A trigger from inside the sweep it would join is rejected instead of deadlocking."""
+        controller = AdmissionController()
+        inner = {}
+
+        def sweep():
+            inner["outcome"], inner["result"] = controller.run("key", "context", "source", lambda: {})
+            return {"status": "done"}
+
+        self.assertEqual(controller.run("key", "context", "source", sweep), ("admitted", {"status": "done"}))
+        self.assertEqual(inner["outcome"], "rejected")
+        self.assertEqual(inner["result"]["reason"], "reentrant")
+        self.assertEqual(controller.get_stats()["reentrant"], 1)
+
+    def test_join_times_out(self):
+        """A joined trigger gives up after join_timeout."""
+        controller = AdmissionController({"join_timeout": 0.05})
+        started, release = threading.Event(), threading.Event()
+
+        def sweep():
+            started.set()
+            release.wait(5)
+            return {"status": "done"}
+
+        owner = threading.Thread(target=controller.run, args=("key", "context", "source", sweep))
+        owner.start()
+        self.addCleanup(owner.join)
+        self.addCleanup(release.set)
+        started.wait(5)
+
+        outcome, result = controller.run("key", "context", "source", lambda: {})
+        self.assertEqual((outcome, result["reason"]), ("rejected", "join_timeout"))
+        self.assertEqual(controller.get_stats()["join_timeouts"], 1)
+
+
+class TestMemoization(unittest.TestCase):
+    """Test cases for reusing results while engine inputs are unchanged."""
+
+    def setUp(self):
+        pin_cwd(self)
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_path = os.path.join(self.temp_dir, "input.txt")
+        with open(self.input_path, "w") as f:
+            f.write("first")
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def _orchestrator(self, **execution):
+        orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir, "execution": execution})
+        self.addCleanup(orchestrator.shutdown)
+        return orchestrator
+
+    def test_unchanged_inputs_reuse_result(self):
+        """A matching fingerprint returns the cached result until the input changes."""
+        orchestrator = self._orchestrator()
+        engine = FileReadingEngine(self.input_path)
+        orchestrator.register_engine(engine)
+
+        first = orchestrator.execute_engine("file_reader")
+        second = orchestrator.execute_engine("file_reader")
+        self.assertEqual(engine.reads, 1)
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["main_action"], first["main_action"])
+        self.assertEqual(second["actions_executed"], [])
+
+        with open(self.input_path, "w") as f:
+            f.write("second, longer")
+        third = orchestrator.execute_engine("file_reader")
+        self.assertEqual(engine.reads, 2)
+        self.assertEqual(third["main_action"], {"content": "second, longer"})
+        self.assertEqual(engine.get_status()["memoization"], {"hits": 1, "misses": 2})
+
+    def test_async_mode_and_opt_out(self):
+        """Async triggers use the memo, and engines can disable it in config."""
+        orchestrator = self._orchestrator(mode="async")
+        engine = FileReadingEngine(self.input_path)
+        orchestrator.register_engine(engine)
+
+        orchestrator.trigger_recursive_improvement("file_reader")
+        result = orchestrator.trigger_recursive_improvement("file_reader")
+        self.assertTrue(result["engines_triggered"][0]["result"]["cached"])
+        self.assertEqual(result["total_improvements"], 0)
+
+        uncached = FileReadingEngine(self.input_path, config={"memoize": False})
+        uncached.start()
+        uncached.execute_with_compounding()
+        self.assertEqual(uncached.memoized_result(), (None, None))
+
+    def test_cpu_engine_hit_skips_worker(self):
+        """Memo hits for CPU engines are answered without a worker process."""
+        orchestrator = self._orchestrator()
+        orchestrator.register_engine(FingerprintedCpuEngine())
+
+        orchestrator.execute_engine("counting_cpu")
+        result = orchestrator.execute_engine("counting_cpu")
+
+        self.assertTrue(result["cached"])
+        self.assertEqual(orchestrator.process_pool.get_stats()["submitted"], 1)
+
+
+class TestResourceAccounting(unittest.TestCase):
+    """Test cases for per-engine resource percentiles."""
+
+    def setUp(self):
+        pin_cwd(self)
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def _orchestrator(self, **execution):
+        orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir, "execution": execution})
+        self.addCleanup(orchestrator.shutdown)
+        return orchestrator
+
+    def test_actions_are_measured_and_ranked(self):
+        """Main and pre-actions get percentiles, and the system status ranks engines by wall time."""
+        orchestrator = self._orchestrator()
+        busy = BusyEngine()
+        orchestrator.register_engine(busy)
+        orchestrator.register_engine(SleepyEngine("idle", 0.0))
+        for _ in range(5):
+            orchestrator.execute_engine("busy")
+        orchestrator.execute_engine("idle")
+
+        main = busy.get_status()["resources"]["main"]
+        self.assertEqual(main["runs"], 5)
+        self.assertEqual(busy.get_status()["resources"]["pre"]["runs"], 5)
+        self.assertGreater(main["cpu"]["p50"], 0)
+        self.assertLessEqual(main["wall"]["p50"], main["wall"]["p90"])
+        self.assertLessEqual(main["wall"]["p99"], main["wall"]["max"])
+        self.assertAlmostEqual(main["wall_total"], sum(r.duration for r in busy.execution_history), delta=0.5)
+        if main["rss_delta"]:
+            self.assertGreaterEqual(main["rss_delta"]["max"], 0)
+
+        ranking = orchestrator.get_system_status()["resources"]
+        self.assertEqual([entry["engine"] for entry in ranking], ["busy", "idle"])
+        self.assertAlmostEqual(sum(entry["wall_share"] for entry in ranking), 1.0)
+
+    def test_tracemalloc_sites(self):
+        """Opted-in engines report their top allocation sites and tracing stops afterwards."""
+        was_tracing = tracemalloc.is_tracing()
+        engine = BusyEngine(config={"resources": {"tracemalloc": True, "tracemalloc_top": 3}})
+        engine.start()
+        engine.execute_with_compounding()
+
+        sites = engine.get_status()["resources"]["main"]["top_allocations"]
+        self.assertLessEqual(len(sites), 3)
+        self.assertTrue(any(__file__ in site["site"] for site in sites), sites)
+        self.assertEqual(tracemalloc.is_tracing(), was_tracing)
+
+    def test_worker_and_async_runs(self):
+        """Samples come back from worker processes; native async actions record wall time only."""
+        orchestrator = self._orchestrator()
+        engine = CountingCpuEngine()
+        orchestrator.register_engine(engine)
+        orchestrator.execute_engine("counting_cpu")
+        self.assertEqual(engine.resources.summary()["main"]["runs"], 1)
+
+        async_engine = AsyncSleepyEngine("async_sleepy", 0.05)
+        async_engine.start()
+        asyncio.run(async_engine.execute_with_compounding_async())
+        main = async_engine.resources.summary()["main"]
+        self.assertGreaterEqual(main["wall"]["p50"], 0.05)
+        self.assertEqual(main["cpu"], {})
+
+
+class TestLazyRegistry(unittest.TestCase):
+    """Test cases for engines registered by import path."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+    def test_specs_match_engine_classes(self):
+        """Each spec's name and context tags agree with the class it points to."""
+        from recursive_improvement.engines import ENGINE_SPECS
+
+        self.assertEqual(len(ENGINE_SPECS), 15)
+        for spec in ENGINE_SPECS:
+            engine_cls = spec.load_class()
+            self.assertEqual(engine_cls().name, spec.name)
+            self.assertEqual(engine_cls.context_tags, spec.context_tags)
+
+    def test_engines_load_on_first_lookup(self):
+        """Routing and status do not load engines, looking one up does."""
+        from recursive_improvement.engines import ENGINE_SPECS
+
+        orchestrator = RecursiveOrchestrator({"log_dir": self.temp_dir})
+        self.addCleanup(orchestrator.shutdown)
+        for spec in ENGINE_SPECS:
+            self.assertTrue(orchestrator.register_lazy_engine(spec))
+
+        self.assertEqual(
+            orchestrator.route("content_refresh"),
+            ["asset_library_engine", "content_stack_tree", "self_improving_playbook_generator"]
+        )
+        status = orchestrator.get_system_status()
+        self.assertEqual(len(status["engines"]), 15)
+        self.assertFalse(status["engines"]["auto_refactor"]["loaded"])
+        self.assertEqual(status["registry"]["loaded"], 0)
+
+        engine = orchestrator.engines["asset_library_engine"]
+        self.assertTrue(engine.is_running)
+        self.assertIs(engine.recursive_logger, orchestrator.recursive_logger)
+        self.assertEqual(list(orchestrator.engines.loaded()), ["asset_library_engine"])
+        self.assertEqual(orchestrator.active_engines, 1)
+        self.assertIn("asset_library_engine", orchestrator.engines.load_stats)
+
+    def test_cli_cold_start_imports(self):
+        """The CLI imports no engine modules or asyncio until they are needed."""
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        probe = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, integration; "
+             "print(sorted(m for m in sys.modules if m.startswith('recursive_improvement.engines.') "
+             "or m in ('asyncio', 'multiprocessing', 'yaml')))"],
+            cwd=repo_root, capture_output=True, text=True, timeout=60
+        )
+        self.assertEqual(probe.stdout.strip(), "[]", probe.stderr)
+
+        profile = subprocess.run(
+            [sys.executable, "integration.py", "--startup-profile", "status"],
+            cwd=repo_root, capture_output=True, text=True, timeout=60
+        )
+        self.assertEqual(profile.returncode, 0, profile.stderr)
+        self.assertIn("Startup profile:", profile.stdout)
+        self.assertIn("integration", profile.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
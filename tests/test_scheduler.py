@@ -0,0 +1,343 @@
+"""Tests for the deadline-heap scheduler"""
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recursive_improvement.base import RecursiveEngine
+from recursive_improvement.deadline_scheduler import CronExpression, DeadlineScheduler, DelayedExecutor
+from recursive_improvement.engine_dag import EngineDAG
+from recursive_improvement.engines import (
+    AutoRefactorEngine, DocUpdaterEngine, KPIMutationEngine, RecursiveFeedbackLoopEngine,
+    SelfImprovingPlaybookGeneratorEngine, WeeklyAutoDebriefBotEngine
+)
+from recursive_improvement.logger import RecursiveLogger
+from recursive_improvement.scheduler import RecursiveScheduler
+from tests.test_orchestrator import SleepyEngine
+
+
+class TestCronExpression(unittest.TestCase):
+    """Test cases for cron expression parsing and matching."""
+
+    def test_weekly_cycle(self):
+        """The weekly cycle fires on the next Monday at 02:00."""
+        cron = CronExpression("0 2 * * 1")
+        # 2026-10-16 is a Friday
+        self.assertEqual(cron.next_after(datetime(2026, 10, 16, 12, 30)), datetime(2026, 10, 19, 2, 0))
+        self.assertEqual(cron.next_after(datetime(2026, 10, 19, 2, 0)), datetime(2026, 10, 26, 2, 0))
+
+    def test_steps_lists_and_ranges(self):
+        """Steps, lists and ranges expand to the expected minutes."""
+        cron = CronExpression("*/15 9-10,14 * * *")
+        self.assertEqual(cron.next_after(datetime(2026, 1, 1, 9, 50)), datetime(2026, 1, 1, 10, 0))
+        self.assertEqual(cron.next_after(datetime(2026, 1, 1, 10, 45)), datetime(2026, 1, 1, 14, 0))
+        self.assertEqual(cron.next_after(datetime(2026, 1, 1, 14, 45)), datetime(2026, 1, 2, 9, 0))
+
+    def test_day_or_weekday(self):
+        """Restricting both day and weekday fires on either."""
+        cron = CronExpression("0 0 13 * 1")
+        # Monday the 19th matches by weekday, Friday the 13th of November by day
+        self.assertEqual(cron.next_after(datetime(2026, 10, 16, 0, 0)), datetime(2026, 10, 19, 0, 0))
+        self.assertEqual(cron.next_after(datetime(2026, 11, 12, 0, 0)), datetime(2026, 11, 13, 0, 0))
+
+    def test_aliases_and_errors(self):
+        """Aliases expand and malformed expressions are rejected."""
+        self.assertEqual(CronExpression("@daily").next_after(datetime(2026, 12, 31, 5, 0)),
+                         datetime(2027, 1, 1, 0, 0))
+        for expression in ["* * *", "60 * * * *", "* * * 13 *", "*/0 * * * *"]:
+            with self.assertRaises(ValueError):
+                CronExpression(expression)
+        with self.assertRaises(ValueError):
+            CronExpression("0 0 30 2 *").next_after(datetime(2026, 1, 1))
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    """Test cases for the min-heap timer core."""
+
+    def setUp(self):
+        self.timer = DeadlineScheduler(max_workers=2)
+        self.timer.start()
+        self.addCleanup(self.timer.stop)
+
+    def test_interval_job_fires_promptly(self):
+        """Interval jobs fire on time and repeat."""
+        fired = []
+        self.timer.add_job("tick", lambda: fired.append(time.time()), interval=0.05)
+        time.sleep(0.28)
+
+        self.assertGreaterEqual(len(fired), 4)
+        self.assertLess(self.timer.get_stats()["max_lateness"], 0.05)
+
+    def test_added_job_wakes_timer_early(self):
+        """Adding a sooner job interrupts a long sleep."""
+        event = threading.Event()
+        self.timer.add_job("far", lambda: None, interval=3600)
+        time.sleep(0.02)
+        self.timer.add_job("soon", event.set, interval=3600, start_at=time.time() + 0.05)
+
+        self.assertTrue(event.wait(1.0))
+        self.assertLess(self.timer.get_stats()["last_lateness"], 0.05)
+
+    def test_remove_and_jitter(self):
+        """Removed jobs stop firing and jitter stays within bounds."""
+        fired = []
+        job = self.timer.add_job("tick", lambda: fired.append(1), interval=0.05, jitter=0.02)
+        self.assertTrue(job.due <= job.fire_at <= job.due + 0.02)
+
+        time.sleep(0.15)
+        self.assertTrue(self.timer.remove_job("tick"))
+        count = len(fired)
+        time.sleep(0.15)
+        self.assertEqual(len(fired), count)
+        self.assertFalse(self.timer.remove_job("tick"))
+
+    def test_overlapping_runs_are_skipped(self):
+        """A job still running when due again is skipped, not stacked."""
+        running = []
+        self.timer.add_job("slow", lambda: (running.append(1), time.sleep(0.2)), interval=0.05)
+        time.sleep(0.3)
+
+        self.assertLessEqual(len(running), 2)
+        self.assertGreater(self.timer.get_stats()["skipped_overlaps"], 0)
+
+    def test_idle_timer_does_not_poll(self):
+        """With nothing due the timer thread does not wake up."""
+        self.timer.add_job("far", lambda: None, interval=3600)
+        time.sleep(0.05)
+        wakeups = self.timer.get_stats()["wakeups"]
+        time.sleep(0.2)
+        self.assertEqual(self.timer.get_stats()["wakeups"], wakeups)
+
+
+class OverlapEngine(RecursiveEngine):
+    """Engine whose main and pre actions both sleep."""
+
+    def __init__(self, main_delay, pre_delay, config=None):
+        super().__init__("overlap", config)
+        self.main_delay = main_delay
+        self.pre_delay = pre_delay
+
+    def initialize(self):
+        return True
+
+    def execute_main_action(self):
+        time.sleep(self.main_delay)
+        return {"status": "done"}
+
+    def execute_pre_action(self):
+        time.sleep(self.pre_delay)
+        return {"status": "pre-action_completed"}
+
+
+class TestDelayedExecutor(unittest.TestCase):
+    """Test cases for one-shot delayed calls and pre-action overlap."""
+
+    def test_delay_and_expedite(self):
+        """Calls run after their delay, or immediately when expedited."""
+        executor = DelayedExecutor(max_workers=2)
+        started = time.monotonic()
+        delayed = executor.schedule(0.1, time.monotonic)
+        expedited = executor.schedule(10.0, time.monotonic)
+        # Holding the condition keeps the timer from dispatching the expedited call
+        with executor._condition:
+            self.assertTrue(executor.expedite(expedited))
+            self.assertEqual(executor.get_stats()["pending"], 2)
+
+        self.assertLess(expedited.future.result(timeout=1) - started, 0.05)
+        self.assertGreaterEqual(delayed.future.result(timeout=1) - started, 0.1)
+        self.assertFalse(executor.expedite(delayed))
+
+        stats = executor.get_stats()
+        self.assertEqual((stats["scheduled"], stats["executed"], stats["pending"]), (2, 2, 0))
+        self.assertLess(stats["queue_delay_max"], 0.05)
+
+    def test_pre_action_overlap_measured(self):
+        """The pre-action starts part-way into the main action and overlap is recorded."""
+        engine = OverlapEngine(0.3, 0.1, config={"pre_action_delay": 0.1})
+        engine.start()
+        engine.execute_with_compounding()
+
+        stats = engine.get_status()["pre_action"]
+        self.assertEqual(stats["runs"], 1)
+        self.assertAlmostEqual(stats["overlap_last"], 0.1, delta=0.05)
+        self.assertLess(stats["queue_delay_last"], 0.05)
+
+    def test_short_main_action_does_not_wait_for_delay(self):
+        """A main action finishing early pulls the pre-action forward."""
+        engine = OverlapEngine(0.0, 0.0, config={"pre_action_delay": 5.0})
+        engine.start()
+        threads_before = threading.active_count()
+
+        started = time.monotonic()
+        engine.execute_with_compounding()
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertIn("pre", engine.last_execution)
+
+        for _ in range(20):
+            engine.last_execution.clear()
+            engine.execute_with_compounding()
+        self.assertLessEqual(threading.active_count(), threads_before + 8)
+
+
+class TestRecursiveScheduler(unittest.TestCase):
+    """Test cases for engine scheduling on the deadline timer."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.recursive_logger = RecursiveLogger(self.temp_dir)
+        self.scheduler = RecursiveScheduler(self.recursive_logger)
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.addCleanup(self.recursive_logger.close)
+        self.addCleanup(self.scheduler.stop_scheduler)
+
+    def test_builtin_jobs(self):
+        """The weekly, daily and hourly jobs are scheduled."""
+        jobs = {job["name"] for job in self.scheduler.timer.jobs()}
+        self.assertEqual(jobs, {"weekly_cycle", "daily_health_check", "collect_metrics"})
+
+        next_weekly = datetime.fromisoformat(self.scheduler.get_scheduler_status()["next_weekly_cycle"])
+        self.assertEqual((next_weekly.weekday(), next_weekly.hour, next_weekly.minute), (0, 2, 0))
+        self.assertLessEqual(next_weekly - datetime.now(), timedelta(days=7))
+
+    def test_per_engine_schedule(self):
+        """Engines with a schedule config run on their own cadence."""
+        engine = SleepyEngine("scheduled", 0.0, config={"schedule": {"interval": 0.05}})
+        self.scheduler.register_engine(engine)
+        self.scheduler.start_scheduler()
+        time.sleep(0.2)
+
+        job = self.scheduler.timer.get_job("engine:scheduled")
+        self.assertGreaterEqual(job.runs, 2)
+        actions = self.recursive_logger.query_actions(engine="scheduled")
+        self.assertGreaterEqual(len(actions), 2)
+
+    def test_engine_intervals_configurable(self):
+        """Engine action intervals come from config instead of fixed weeks."""
+        engine = SleepyEngine("fast_cadence", 0.0, config={"intervals": {"main": 0.05}})
+        engine.last_execution["main"] = datetime.now()
+
+        self.assertFalse(engine.should_execute("main"))
+        time.sleep(0.06)
+        self.assertTrue(engine.should_execute("main"))
+        self.assertEqual(engine.intervals["pre"], timedelta(weeks=0.25))
+
+
+class DagEngine(SleepyEngine):
+    """Sleepy engine with per-instance dependency declarations."""
+
+    def __init__(self, name, delay=0.0, depends_on=(), produces=(), fail=False):
+        super().__init__(name, delay, fail=fail)
+        self.depends_on = depends_on
+        self.produces = produces
+
+
+class TestEngineDAG(unittest.TestCase):
+    """Test cases for the dependency-ordered weekly cycle."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.recursive_logger = RecursiveLogger(self.temp_dir)
+        self.scheduler = RecursiveScheduler(self.recursive_logger)
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.addCleanup(self.recursive_logger.close)
+        self.addCleanup(self.scheduler.stop_scheduler)
+
+    def _register(self, *engines):
+        for engine in engines:
+            self.scheduler.register_engine(engine)
+
+    def test_independent_engines_run_in_parallel(self):
+        """Independent engines overlap and dependents wait for all upstreams."""
+        self._register(
+            DagEngine("report", 0.1, depends_on=("collect_a", "collect_b")),
+            DagEngine("collect_a", 0.2),
+            DagEngine("collect_b", 0.3)
+        )
+        started = time.monotonic()
+        cycle = self.scheduler._execute_weekly_cycle()
+
+        self.assertLess(time.monotonic() - started, 0.55)
+        self.assertEqual(sorted(cycle["engines_executed"]), ["collect_a", "collect_b", "report"])
+        self.assertEqual(cycle["critical_path"]["engines"], ["collect_b", "report"])
+        self.assertAlmostEqual(cycle["critical_path"]["duration_seconds"], 0.4, delta=0.1)
+        self.assertEqual(self.scheduler.get_scheduler_status()["last_weekly_cycle"]["critical_path"],
+                         cycle["critical_path"])
+
+    def test_failed_upstream_skips_dependents(self):
+        """Failures propagate as skips down the graph but not sideways."""
+        self._register(
+            DagEngine("source", fail=True),
+            DagEngine("middle", depends_on=("source",)),
+            DagEngine("leaf", depends_on=("middle",)),
+            DagEngine("bystander")
+        )
+        cycle = self.scheduler._execute_weekly_cycle()
+
+        self.assertEqual(cycle["engines_executed"], ["bystander"])
+        self.assertEqual(len(cycle["errors"]), 1)
+        self.assertEqual(cycle["engines_skipped"], [
+            {"engine": "middle", "reason": "upstream failed: source"},
+            {"engine": "leaf", "reason": "upstream failed: middle"}
+        ])
+
+    def test_engine_registered_mid_cycle(self):
+        """An engine registered while a cycle runs waits for the next cycle."""
+        self._register(DagEngine("first"))
+        execute = self.scheduler.process_pool.execute
+
+        def execute_and_register(engine):
+            self.scheduler.register_engine(DagEngine("late"))
+            return execute(engine)
+
+        self.scheduler.process_pool.execute = execute_and_register
+        cycle = self.scheduler._execute_weekly_cycle()
+
+        self.assertEqual(cycle["engines_executed"], ["first"])
+        self.assertIn("late", self.scheduler.engines)
+
+    def test_artifacts_cycles_and_unknown_dependencies(self):
+        """Artifacts resolve to their producers, cycles are not run, unknown names are ignored."""
+        engines = {
+            engine.name: engine for engine in (
+                DagEngine("consumer", depends_on=("dataset", "not_registered")),
+                DagEngine("producer", produces=("dataset",)),
+                DagEngine("loop_a", depends_on=("loop_b",)),
+                DagEngine("loop_b", depends_on=("loop_a",))
+            )
+        }
+        for engine in engines.values():
+            engine.start()
+        dag = EngineDAG(engines)
+
+        self.assertEqual(dag.order, ["producer", "consumer"])
+        self.assertEqual(dag.cyclic, ["loop_a", "loop_b"])
+        self.assertEqual(dag.unresolved, {"consumer": ["not_registered"]})
+
+        outcomes = dag.run(lambda engine: engine.execute_with_compounding())
+        self.assertEqual(outcomes["consumer"]["status"], "ok")
+        self.assertEqual(outcomes["loop_a"], {"status": "skipped", "reason": "dependency cycle"})
+
+    def test_builtin_engine_dependencies(self):
+        """The shipped engines declare the debrief and documentation chains."""
+        engines = [
+            WeeklyAutoDebriefBotEngine(), SelfImprovingPlaybookGeneratorEngine(), DocUpdaterEngine(),
+            KPIMutationEngine(), RecursiveFeedbackLoopEngine(), AutoRefactorEngine()
+        ]
+        edges = EngineDAG({engine.name: engine for engine in engines}).to_dict()["edges"]
+
+        self.assertEqual(edges, {
+            "weekly_auto_debrief_bot": ["kpi_mutation_engine", "feedback_loop_engine"],
+            "self_improving_playbook_generator": ["weekly_auto_debrief_bot"],
+            "doc_updater": ["auto_refactor"]
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""Tests for tracing spans and the Chrome trace exporter"""
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path so we can import the modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recursive_improvement.orchestrator import RecursiveOrchestrator
+from recursive_improvement.tracing import Tracer, configure_tracing, current_span, traced, tracer
+from tests.test_orchestrator import AsyncSleepyEngine, BusyEngine
+
+
+class TestTracer(unittest.TestCase):
+    """Test cases for span creation, sampling and export."""
+
+    def setUp(self):
+        self.tracer = Tracer({"sample_rate": 1.0})
+
+    def test_spans_nest_and_record_errors(self):
+        """Children take their parent's trace and id; exceptions mark the span."""
+        with self.tracer.span("root", kind="test") as root:
+            self.assertIs(current_span(), root)
+            with self.assertRaises(ValueError):
+                with self.tracer.span("child") as child:
+                    raise ValueError("bad input")
+        self.assertIsNone(current_span())
+
+        self.assertEqual(child.parent_id, root.span_id)
+        self.assertEqual(child.trace_id, root.trace_id)
+        self.assertEqual(child.status, "error")
+        self.assertEqual(child.attributes["error"], "ValueError: bad input")
+        self.assertEqual([span.name for span in self.tracer.finished_spans()], ["child", "root"])
+        self.assertGreaterEqual(root.duration, child.duration)
+
+    def test_sampling_is_decided_per_trace(self):
+        """Unsampled roots suppress their whole trace; rate 0 records nothing."""
+        random.seed(7)
+        self.tracer.configure({"sample_rate": 0.5})
+        for _ in range(40):
+            with self.tracer.span("root"):
+                with self.tracer.span("child"):
+                    pass
+
+        stats = self.tracer.get_stats()
+        self.assertEqual(stats["traces_sampled"] + stats["traces_unsampled"], 40)
+        self.assertGreater(stats["traces_unsampled"], 0)
+        self.assertEqual(stats["spans_recorded"], 2 * stats["traces_sampled"])
+
+        self.tracer.clear()
+        self.tracer.configure({"sample_rate": 0.0})
+        with self.tracer.span("root"):
+            pass
+        self.assertEqual(self.tracer.finished_spans(), [])
+
+    def test_chrome_trace_export(self):
+        """Spans export as complete events with one named row per thread."""
+        with self.tracer.span("orchestrator.trigger", context="ctx"):
+            with self.tracer.span("engine.execute", engine="busy"):
+                pass
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        path = os.path.join(temp_dir, "trace.json")
+        self.assertEqual(self.tracer.export_chrome_trace(path), 2)
+
+        with open(path) as f:
+            document = json.load(f)
+        complete = [event for event in document["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual([event["name"] for event in complete], ["orchestrator.trigger", "engine.execute"])
+        self.assertEqual(complete[0]["cat"], "orchestrator")
+        self.assertEqual(complete[0]["ts"], 0)
+        self.assertGreaterEqual(complete[0]["dur"], complete[1]["dur"])
+        self.assertEqual(complete[1]["args"]["engine"], "busy")
+        self.assertEqual(complete[1]["args"]["parent_id"], complete[0]["args"]["span_id"])
+        names = [event["args"]["name"] for event in document["traceEvents"] if event["ph"] == "M"]
+        self.assertEqual(names, ["MainThread"])
+
+
+class TestOrchestratorTracing(unittest.TestCase):
+    """Test cases for spans recorded by the framework's instrumentation."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.addCleanup(tracer.clear)
+        self.addCleanup(configure_tracing, {"sample_rate": 0.0, "export_path": None})
+        tracer.clear()
+
+    def _orchestrator(self, **execution):
+        orchestrator = RecursiveOrchestrator({
+            "log_dir": self.temp_dir,
+            "execution": execution,
+            "tracing": {"sample_rate": 1.0, "export_path": os.path.join(self.temp_dir, "trace.json")}
+        })
+        return orchestrator
+
+    def _parents(self):
+        # Registration logs actions in traces of their own, keep the trigger's
+        trigger = [span for span in tracer.finished_spans() if span.name == "orchestrator.trigger"][-1]
+        spans = tracer.finished_spans(trigger.trace_id)
+        by_id = {span.span_id: span for span in spans}
+        return spans, lambda span: by_id[span.parent_id].name if span.parent_id else None
+
+    def test_parallel_trigger_spans(self):
+        """Spans on pool and timer threads attach to the trigger that started them."""
+        orchestrator = self._orchestrator(mode="parallel")
+        orchestrator.register_engine(BusyEngine("busy_a"))
+        orchestrator.register_engine(BusyEngine("busy_b"))
+        orchestrator.trigger_recursive_improvement("busy")
+
+        spans, parent = self._parents()
+        by_name = {}
+        for span in spans:
+            by_name.setdefault(span.name, []).append(span)
+
+        self.assertEqual(parent(by_name["orchestrator.trigger"][0]), None)
+        self.assertEqual(by_name["orchestrator.trigger"][0].attributes["admission"], "admitted")
+        self.assertEqual(parent(by_name["orchestrator.route"][0]), "orchestrator.trigger")
+        self.assertEqual([parent(span) for span in by_name["engine.execute"]], ["orchestrator.fan_out"] * 2)
+        self.assertEqual({span.attributes["engine"] for span in by_name["engine.execute"]}, {"busy_a", "busy_b"})
+        for name in ("engine.main_action", "engine.pre_action", "logger.store_payload"):
+            self.assertEqual([parent(span) for span in by_name[name]], ["engine.execute"] * 2, name)
+        self.assertEqual(parent(by_name["logger.log_action"][0]), "orchestrator.trigger")
+        self.assertNotEqual(by_name["engine.main_action"][0].lane, "MainThread")
+
+        orchestrator.shutdown()
+        with open(os.path.join(self.temp_dir, "trace.json")) as f:
+            events = [event for event in json.load(f)["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual(len(events), len(tracer.finished_spans()))
+
+    def test_async_trigger_spans(self):
+        """Async fan-out carries the trace onto the event loop and into its tasks."""
+        orchestrator = self._orchestrator(mode="async")
+        self.addCleanup(orchestrator.shutdown)
+        orchestrator.register_engine(AsyncSleepyEngine("async_sleepy", 0.01))
+        orchestrator.trigger_recursive_improvement("async_sleepy")
+
+        spans, parent = self._parents()
+        main = [span for span in spans if span.name == "engine.main_action"]
+        self.assertEqual(len(main), 1)
+        self.assertEqual(parent(main[0]), "engine.execute")
+        self.assertIn("/", main[0].lane)  # Task lane on the loop thread
+        execute = [span for span in spans if span.name == "engine.execute"][0]
+        self.assertEqual(execute.attributes["backend"], "async")
+        self.assertEqual(parent(execute), "orchestrator.fan_out")
+
+    def test_traced_helpers_and_status(self):
+        """Decorated helpers nest under the current span and tracing shows in the status."""
+        @traced("helper.work")
+        def work():
+            return current_span().name
+
+        orchestrator = self._orchestrator()
+        self.addCleanup(orchestrator.shutdown)
+        with tracer.span("root"):
+            self.assertEqual(work(), "helper.work")
+
+        self.assertEqual(orchestrator.get_system_status()["tracing"]["sample_rate"], 1.0)
+        self.assertEqual(orchestrator.get_system_status()["tracing"]["spans_buffered"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
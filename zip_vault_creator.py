@@ -20,6 +20,8 @@ from pathlib import Path
 import glob
 import zlib
 
+from recursive_improvement.log_config import configure_logging
+
 
 class VaultCreator:
     """Creates and manages zip vault snapshots with multiple profiles."""
@@ -35,7 +37,7 @@ class VaultCreator:
             path.mkdir(parents=True, exist_ok=True)
         
         # Setup logging
-        logging.basicConfig(level=logging.INFO)
+        configure_logging()
         self.logger = logging.getLogger(__name__)
         
         # Load configuration